@@ -13,6 +13,10 @@ requirements = [
     "attrs",
 ]
 
+extras = {
+    "fast": ["numpy", "scipy"],
+}
+
 setup(
     name="wrestling",
     version="0.4.7",
@@ -24,4 +28,6 @@ setup(
     url="https://github.com/nanthony007/wrestling/",
     packages=find_packages(),
     install_requires=requirements,
+    extras_require=extras,
+    entry_points={"console_scripts": ["wrestling = wrestling.cli:main"]},
 )
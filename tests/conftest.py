@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.matches import match_class
+from wrestling.scoring import scoring_class
+from wrestling.wrestlers import Wrestler
+
+
+def build_match(
+        level="college", labels=(("red", "T2"), ("green", "E1")), result=base.Result.WD,
+        focus="Nick Anthony", focus_team="Eagles", opponent="John Smith", opp_team="Hawks", weight="165",
+        kind="Dual Meet", date=datetime(2020, 1, 1), event="Fun One", overtime=False,
+        match_id="abc", focus_color="red",
+):
+    scoring, label, match = scoring_class(level), base.label_class(level), match_class(level)
+    ts = tuple(
+        scoring(
+            time_stamp=f"00:{i // 60:02d}:{i % 60:02d}",
+            initiator=initiator,
+            focus_color=focus_color,
+            period=1 + i // 180,
+            label=label(tag),
+        )
+        for i, (initiator, tag) in zip(range(10, 10000, 20), labels)
+    )
+    return match(
+        id=match_id,
+        event=Event(name=event, kind=base.Mark(kind)),
+        date=date,
+        result=result,
+        overtime=overtime,
+        focus=Wrestler(name=focus, team=focus_team),
+        opponent=Wrestler(name=opponent, team=opp_team),
+        weight=base.Mark(weight),
+        time_series=ts,
+    )
+
+
+@pytest.fixture
+def make_match():
+    return build_match
@@ -0,0 +1,23 @@
+from wrestling.audit import audit_matches
+from wrestling.base import Result
+
+
+def test_result_inference(make_match):
+    assert make_match().expected_result == Result.WD
+    major = make_match(labels=(("red", "T2"), ("red", "N4"), ("red", "N2")), result=Result.WM)
+    assert major.expected_result == Result.WM and major.isvalid
+    wrong = make_match(result=Result.WM)
+    assert not wrong.result_consistent
+    assert "Result inconsistent with time-series." in wrong.invalid_messages
+    fall = make_match(labels=(("red", "T2"), ("green", "E1"), ("green", "FALL")), result=Result.WF)
+    assert fall.expected_result == Result.LF and not fall.result_consistent
+    assert make_match(result=Result.WF).result_consistent
+    assert make_match(labels=(("red", "T2"), ("green", "R2")), result=Result.LD).isvalid
+
+
+def test_audit_matches(make_match):
+    matches = [make_match(), make_match(result=Result.WM), make_match(result=Result.LD)]
+    report = audit_matches(iter(matches * 2))
+    assert report.total == 6 and report.inconsistent == 4
+    assert [f.index for f in report.findings] == [1, 2, 4, 5]
+    assert report.summary()[("WM", "WD")] == 2
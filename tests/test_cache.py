@@ -0,0 +1,77 @@
+import pickle
+import zlib
+
+from wrestling.cache import MatchCache, input_key, schema_version
+
+
+class Stale(object):
+    """Stands in for an entry pickled by incompatible code."""
+
+    def __reduce__(self):
+        return (int, ("not a number",))
+
+
+def _raw(**kwargs):
+    return dict(dict(focus="Nick Anthony", opponent="John Smith", labels=[["red", "T2"]]), **kwargs)
+
+
+def test_cache_hits_and_persists(tmp_path, make_match):
+    built = []
+
+    def build(raw):
+        built.append(raw)
+        return make_match(focus=raw["focus"], labels=[tuple(pair) for pair in raw["labels"]])
+
+    cache = MatchCache(tmp_path)
+    first = cache.get_or_build(_raw(), build)
+    second = cache.get_or_build(dict(reversed(list(_raw().items()))), build)
+    assert len(built) == 1 and (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert second.to_dict() == first.to_dict() and second.focus_pts == 2 and second.isvalid
+    assert input_key(_raw()) != input_key(_raw(focus="Other"))
+    reopened = MatchCache(tmp_path)
+    assert len(reopened) == 1 and reopened.total_bytes == cache.total_bytes
+    assert reopened.get(input_key(_raw(), build)).to_dict() == first.to_dict()
+
+
+def test_cache_lru_eviction(tmp_path, make_match):
+    cache = MatchCache(tmp_path, max_entries=2)
+    keys = [input_key(_raw(focus=name)) for name in ("a", "b", "c")]
+    cache.put(keys[0], make_match())
+    cache.put(keys[1], make_match())
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], make_match())
+    assert keys[1] not in cache and keys[0] in cache and cache.stats.evictions == 1
+    with open(cache.path_of(keys[0]), "wb") as file:
+        file.write(b"corrupt")
+    assert cache.get(keys[0]) is None and len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_cache_keys_and_stale_entries(tmp_path, make_match):
+    def build(raw):
+        return make_match(focus=raw["focus"])
+
+    def other_build(raw):
+        return make_match(focus=raw["focus"])
+
+    assert input_key(_raw(), build) != input_key(_raw(), other_build) != input_key(_raw())
+    assert len(schema_version()) == 16
+    cache = MatchCache(tmp_path)
+    key = input_key(_raw(), build)
+    cache.put(key, make_match())
+    with open(cache.path_of(key), "wb") as file:
+        file.write(zlib.compress(pickle.dumps(Stale())))
+    assert cache.get(key) is None and key not in cache
+    assert cache.get_or_build(_raw(), build).focus.name == "Nick Anthony"
+
+
+def test_cache_deferred_match(tmp_path, make_match):
+    match = make_match()
+    expected = match.to_dict()
+    match.defer_time_series()
+    cache = MatchCache(tmp_path)
+    cache.put("ab", match)
+    assert match.deferred
+    cached = cache.get("ab")
+    assert not cached.deferred and cached.to_dict() == expected and cached.focus_pts == 2
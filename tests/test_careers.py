@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling.base import Result
+from wrestling.careers import CareerTracker, rolling_stats
+from wrestling.wrestlers import Wrestler
+
+
+def test_rolling_window(make_match):
+    matches = [
+        make_match(date=datetime(2020, 1, 1)),
+        make_match(date=datetime(2020, 1, 8), labels=(("red", "T2"), ("red", "N4"), ("red", "N2")), result=Result.WM),
+        make_match(date=datetime(2020, 1, 15), labels=(("green", "T2"),), result=Result.LD),
+    ]
+    nick, john = Wrestler(name="Nick Anthony", team="Eagles"), Wrestler(name="John Smith", team="Hawks")
+    tracker = CareerTracker(window=2)
+    assert tracker.update(matches[:2]) == 2
+    assert tracker.stats(nick).bonus_rate == 0.5
+    tracker.update(matches[2:])
+    stats = tracker.stats(nick)
+    assert (stats.matches, stats.wins, stats.bonus_wins, stats.td_diff) == (2, 1, 1, 0)
+    assert (stats.points_for, stats.points_against) == (8, 2)
+    assert tracker.stats(john).win_pct == 0.5 and tracker.stats(john).mov == -6
+    assert [point.stats.wins for point in tracker.timeline(nick)] == [1, 2, 1]
+    assert rolling_stats(matches, window=2) == tracker.snapshot()
+    with pytest.raises(ValueError):
+        tracker.update(matches[:1])
+
+
+def test_grade_progression(make_match):
+    tracker = CareerTracker()
+    for date, grade in ((datetime(2020, 1, 1), 1), (datetime(2020, 2, 1), 1), (datetime(2021, 1, 1), 2)):
+        match = make_match(date=date)
+        match.focus = Wrestler(name="Nick Anthony", team="Eagles", grade_int=grade)
+        tracker.update([match])
+    nick = Wrestler(name="Nick Anthony", team="Eagles")
+    assert tracker.grade_progression(nick) == ((datetime(2020, 1, 1), 1), (datetime(2021, 1, 1), 2))
+
+
+def test_update_orders_mixed_date_types(make_match):
+    tracker = CareerTracker()
+    assert tracker.update([make_match(date="2020-01-01T08:00:00"), make_match(date=datetime(2020, 1, 1, 9))]) == 2
+    with pytest.raises(ValueError):
+        tracker.update([make_match(date="2020-01-01 08:30:00")])
@@ -0,0 +1,69 @@
+import csv
+import json
+
+import pytest
+
+from wrestling.cli import main
+
+
+def _record(index, **kwargs):
+    record = dict(
+        id=str(index), event_name="Fun One", event_type="Dual Meet", date=f"2020-01-{index % 28 + 1:02d}",
+        result="WD", focus_name=f"Wrestler {index % 3}", focus_team="Eagles",
+        opp_name="John Smith", opp_team="Hawks", weight="165",
+        time_series=[
+            dict(time_stamp="00:00:10", initiator="red", focus_color="red", period=1, label="T2"),
+            dict(time_stamp="00:00:30", initiator="green", focus_color="red", period=1, label="E1"),
+        ],
+    )
+    record.update(kwargs)
+    return record
+
+
+@pytest.fixture
+def season(tmp_path):
+    path = tmp_path / "season.jsonl"
+    lines = [json.dumps(_record(i)) for i in range(9)] + [json.dumps(_record(9, weight="heavy")), "{oops"]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_and_ingest(season, tmp_path, capsys, workers):
+    assert main(["validate", season, "--errors", "5", "--workers", str(workers), "--chunk-size", "4"]) == 1
+    out = capsys.readouterr().out
+    assert "records: 11, valid: 9, invalid: 2" in out and "record 9: weight: Invalid weight class." in out
+
+    store = str(tmp_path / "store")
+    assert main(["ingest", season, "--store", store, "--workers", str(workers), "--chunk-size", "4"]) == 0
+    assert "ingested 9 of 11 records" in capsys.readouterr().out
+
+    output = tmp_path / "stats.csv"
+    assert main(["stats", "--store", store, "--output", str(output)]) == 0
+    rows = list(csv.DictReader(output.open()))
+    assert [(row["name"], row["matches"], row["wins"], row["focus_pts"]) for row in rows] == [
+        (f"Wrestler {i}", "3", "3", "6") for i in range(3)
+    ]
+
+
+def test_export_formats(season, tmp_path, capsys):
+    assert main(["export", season, "--fields", "focus_name,mov", "--chunk-size", "4"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:2] == ["focus_name,mov", "Wrestler 0,1"] and len(lines) == 10
+
+    output = tmp_path / "columns.json"
+    assert main(["export", season, "--format", "columns", "--fields", "focus_name,mov",
+                 "--chunk-size", "4", "--output", str(output)]) == 0
+    columns = json.loads(output.read_text())
+    assert columns["mov"] == [1] * 9 and columns["focus_name"][:2] == ["Wrestler 0", "Wrestler 1"]
+
+    csv_path = tmp_path / "season.csv"
+    with csv_path.open("w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(_record(0)))
+        writer.writeheader()
+        writer.writerow({**_record(0), "time_series": json.dumps(_record(0)["time_series"])})
+    assert main(["export", str(csv_path), "--format", "jsonl", "--fields", "focus_name,win"]) == 0
+    assert json.loads(capsys.readouterr().out) == dict(focus_name="Wrestler 0", win=True)
+
+    with pytest.raises(SystemExit):
+        main(["stats"])
@@ -0,0 +1,59 @@
+import pytest
+
+from wrestling import base
+from wrestling.codec import decode_time_series, encode_match, encode_time_series
+from wrestling.scoring import scoring_class
+
+
+def _fields(time_series):
+    return [
+        (str(e.time_stamp), e.initiator, e.focus_color, e.period, e.label.tag)
+        for e in time_series
+        if e.label.tag != "START"
+    ]
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_codec_round_trip(make_match, compression):
+    labels = (("red", "T2"), ("green", "E1"), ("green", "T2"), ("red", "E1"), ("red", "XX")) * 20
+    match = make_match(labels=labels, focus_color="green", level="high school", result=base.Result.NC)
+    blob = encode_match(match, compression)
+    events = decode_time_series(blob)
+    assert _fields(events) == _fields(match.time_series)
+    assert type(events[0]) is match.scoring_cls and not events[-1].label.isvalid
+
+
+def test_codec_size_and_errors(make_match):
+    import json
+
+    match = make_match(labels=(("red", "T2"), ("green", "E1"), ("green", "T2"), ("red", "E1")) * 10)
+    as_json = json.dumps([dict(time_stamp=str(e.time_stamp), initiator=e.initiator,
+                               focus_color=e.focus_color, period=e.period, label=e.label.tag)
+                          for e in match.time_series[1:]])
+    assert len(encode_match(match, "none")) * 10 < len(as_json)
+    with pytest.raises(ValueError):
+        encode_time_series(match.time_series, "college", compression="gzip")
+    with pytest.raises(ValueError):
+        encode_time_series(tuple(reversed(match.time_series[1:])), "college")
+    with pytest.raises(ValueError):
+        decode_time_series(b"nope")
+
+
+def test_codec_format_limits():
+    scoring, label = scoring_class("college"), base.label_class("college")
+
+    def series(tags, periods):
+        return tuple(
+            scoring(time_stamp=f"00:{i // 60:02d}:{i % 60:02d}", initiator="red", focus_color="red",
+                    period=period, label=label(tag))
+            for i, (tag, period) in enumerate(zip(tags, periods))
+        )
+
+    at_limit = series(["X" * 255, "T2"] * 128, [1, 2] * 127 + [1, 1])
+    assert _fields(decode_time_series(encode_time_series(at_limit, "college"))) == _fields(at_limit)
+    with pytest.raises(ValueError, match="255 bytes"):
+        encode_time_series(series(["X" * 256], [1]), "college")
+    with pytest.raises(ValueError, match="255 runs"):
+        encode_time_series(series(["T2"] * 256, [1, 2] * 128), "college")
+    with pytest.raises(ValueError, match="`period`"):
+        encode_time_series(series(["T2"], [256]), "college")
@@ -0,0 +1,37 @@
+from wrestling.base import Result
+from wrestling.dedup import (
+    CONFLICT_RESULT, CONFLICT_SCORING, CONFLICT_TIMING, DedupEngine, canonical_key, dedupe,
+    fingerprint,
+)
+
+
+def test_perspectives_collapse(make_match):
+    mine = make_match()
+    theirs = make_match(
+        focus="John Smith", focus_team="Hawks", opponent="Nick Anthony", opp_team="Eagles",
+        focus_color="green", result=Result.LD,
+    )
+    assert canonical_key(mine) == canonical_key(theirs)
+    assert fingerprint(mine) == fingerprint(theirs)
+    engine = DedupEngine(partitions=4)
+    engine.extend([mine, theirs, make_match(weight="174")])
+    assert len(list(engine.duplicates())) == 1
+    assert not list(engine.conflicts())
+    assert len(dedupe([mine, theirs], partitions=3)) == 1
+
+
+def test_conflicts(make_match):
+    base_match = make_match()
+    engine = DedupEngine()
+    engine.extend([base_match, make_match(result=Result.WM)])
+    assert next(engine.conflicts()).conflicts == (CONFLICT_RESULT,)
+    engine = DedupEngine()
+    engine.extend([base_match, make_match(labels=(("red", "T2"), ("green", "E1"), ("red", "N2")))])
+    group = next(engine.conflicts())
+    assert group.conflicts == (CONFLICT_SCORING,)
+    assert len(group.merged.time_series) == 4
+    shifted = make_match()
+    shifted.time_series[2].time_stamp = "00:00:45"
+    engine = DedupEngine()
+    engine.extend([base_match, shifted])
+    assert next(engine.conflicts()).conflicts == (CONFLICT_TIMING,)
@@ -0,0 +1,244 @@
+"""Randomized differential tests of the fast paths against the object model.
+
+Random time series are generated for every registered ruleset by walking the
+position state machine, then optionally corrupted (moves that are invalid in
+the current position, labels unknown to the ruleset, out of order time
+stamps).  Every optimized path is compared with the reference implementation
+built from ScoringEvent objects (`isvalid_sequence`, the Match score pass) or
+with totals recounted from the raw events.
+
+Set FUZZ_SEED and FUZZ_EXAMPLES to reproduce a failure or to run longer.
+
+"""
+
+import os
+import random
+from bisect import bisect_right
+from datetime import datetime
+
+import pytest
+
+from wrestling import base, rulesets
+from wrestling.codec import COMPRESSIONS, decode_time_series, encode_time_series
+from wrestling.event_index import EventIndex
+from wrestling.events import Event
+from wrestling.matches import match_class
+from wrestling.records import to_records
+from wrestling.replay import ActionLog
+from wrestling.scoring import compress_time_series, decompress_time_series, scoring_class, summarize
+from wrestling.sequence import isvalid_sequence
+from wrestling.storage.partitioned import PartitionedCollection, PartitionStats
+from wrestling.validation import validate_records
+from wrestling.vectorized import validate_series
+from wrestling.wrestlers import Wrestler
+
+SEED = int(os.environ.get("FUZZ_SEED", "2020"))
+EXAMPLES = int(os.environ.get("FUZZ_EXAMPLES", "150"))
+RULESETS = sorted({rulesets.get_ruleset(name) for name in rulesets.registered_rulesets()}, key=lambda r: r.name)
+COLORS = ("red", "green")
+
+
+def random_events(rng, ruleset, corrupt=False):
+    """Raw events (seconds, initiator, focus color, period, tag) of a random series."""
+    excluded = {f"{prefix}{tag}" for tag in ruleset.terminal_labels | {"START"} for prefix in "fo"}
+    focus_color = rng.choice(COLORS)
+    other_color = COLORS[1 - COLORS.index(focus_color)]
+    position, seconds, events = "neutral", 0, []
+    for _ in range(rng.randrange(0, 25)):
+        seconds += rng.randrange(1, 30)
+        label = rng.choice(sorted(ruleset.moves[position] - excluded))
+        if corrupt and rng.random() < 0.15:
+            label = rng.choice(
+                [f"{prefix}{tag}" for tag in ruleset.points if tag != "START" for prefix in "fo"]
+                + ["fXX", "oN9"]
+            )
+        position = ruleset.next_position(position, label)
+        period = bisect_right(ruleset.period_starts, seconds)
+        initiator = focus_color if label[0] == "f" else other_color
+        events.append((seconds, initiator, focus_color, period, label[1:]))
+    if events and rng.random() < 0.3:
+        terminal = rng.choice(sorted(ruleset.terminal_labels))
+        events.append((seconds + 5, rng.choice(COLORS), focus_color, events[-1][3], terminal))
+    if corrupt and len(events) > 2 and rng.random() < 0.3:
+        i = rng.randrange(len(events) - 1)
+        events[i], events[i + 1] = events[i + 1], events[i]
+    return events
+
+
+def time_stamp(seconds):
+    return f"00:{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def build_events(ruleset, events):
+    scoring_cls, label_cls = scoring_class(ruleset), base.label_class(ruleset)
+    return tuple(
+        scoring_cls(time_stamp=time_stamp(seconds), initiator=initiator, focus_color=focus_color,
+                    period=period, label=label_cls(tag))
+        for seconds, initiator, focus_color, period, tag in events
+    )
+
+
+def recount(ruleset, events):
+    """Point totals and takedown differential counted directly from raw events."""
+    focus = opp = td_diff = 0
+    for _, initiator, focus_color, _, tag in events:
+        value = ruleset.points.get(tag, 0)
+        if initiator == focus_color:
+            focus += value
+            td_diff += tag == "T2"
+        else:
+            opp += value
+            td_diff -= tag == "T2"
+    return focus, opp, td_diff
+
+
+def build_match(ruleset, events, rng, index=0):
+    focus_pts, opp_pts, _ = recount(ruleset, events)
+    value = rng.randrange(1, 5)
+    result = base.Result(value if focus_pts >= opp_pts else -value)
+    return match_class(ruleset)(
+        id=str(index),
+        event=Event(
+            name=rng.choice(("Fun One", "Big Ten")), kind=base.Mark(rng.choice(("Dual Meet", "Tournament")))
+        ),
+        date=datetime(2020, 1 + rng.randrange(3), 1 + rng.randrange(28)),
+        result=result,
+        overtime=False,
+        focus=Wrestler(name=f"Focus {rng.randrange(5)}", team="Eagles"),
+        opponent=Wrestler(name=f"Opponent {rng.randrange(5)}", team=rng.choice(("Hawks", "Owls"))),
+        weight=base.Mark(rng.choice(("125", "165"))),
+        time_series=build_events(ruleset, events),
+    )
+
+
+def examples(seed_offset, corrupt):
+    rng = random.Random(SEED + seed_offset)
+    for i in range(EXAMPLES):
+        ruleset = RULESETS[i % len(RULESETS)]
+        yield rng, ruleset, random_events(rng, ruleset, corrupt)
+
+
+def test_sequence_validators_agree():
+    for rng, ruleset, events in examples(0, corrupt=True):
+        reference = build_events(ruleset, events)
+        try:
+            isvalid_sequence(ruleset, reference)
+            unsorted = False
+        except ValueError:
+            unsorted = True
+        invalid = {i for i, score in enumerate(reference) if not score.label.isvalid}
+        last = len(events) - 1
+        known = [tag in ruleset.points for *_, tag in events]
+
+        if not unsorted:
+            report = validate_series([build_events(ruleset, events)], ruleset)
+            mask = list(report.valid[0][: len(events)])
+            expected = [i not in invalid if known[i] else i == last for i in range(len(events))]
+            assert mask == expected, events
+            assert not report.unsorted[0]
+
+        record = dict(
+            id="x", ruleset=ruleset.name, event_name="Fun One", event_type="Dual Meet", date="2020-01-01",
+            result="NC", focus_name="A", focus_team="B", opp_name="C", opp_team="D", weight="165",
+            time_series=[
+                dict(time_stamp=time_stamp(s), initiator=i, focus_color=f, period=p, label=t)
+                for s, i, f, p, t in events
+            ],
+        )
+        rows = list(validate_records([record]).rows())
+        flagged = {event for _, event, _, code, _ in rows if code in ("invalid_label", "invalid_sequence")}
+        assert any(code == "unsorted_time_series" for *_, code, _ in rows) == unsorted, events
+        if not unsorted:
+            assert flagged == invalid, events
+
+
+def test_score_paths_agree():
+    for rng, ruleset, events in examples(1, corrupt=True):
+        if any(a[0] > b[0] for a, b in zip(events, events[1:])):
+            continue
+        focus_pts, opp_pts, td_diff = recount(ruleset, events)
+        match = build_match(ruleset, events, rng)
+        summary = match.score_summary
+        assert (summary.focus_pts, summary.opp_pts, summary.td_diff) == (focus_pts, opp_pts, td_diff)
+        assert (match.focus_pts, match.opp_pts, match.mov) == (focus_pts, opp_pts, focus_pts - opp_pts)
+        assert summarize(match.time_series, ruleset) == summary
+        fresh = summarize(build_events(ruleset, events), ruleset)
+        assert (fresh.focus_pts, fresh.opp_pts, fresh.td_diff, fresh.terminal) == (
+            focus_pts, opp_pts, td_diff, summary.terminal
+        )
+        last = match.time_series[-1]
+        assert (last.focus_score, last.opp_score) == (focus_pts, opp_pts)
+
+        flipped = match.flipped()
+        assert (flipped.focus_pts, flipped.opp_pts, flipped.td_diff) == (opp_pts, focus_pts, -td_diff)
+
+        if all(tag in ruleset.points for *_, tag in events):
+            log = ActionLog(ruleset, focus_color=events[0][2] if events else "red")
+            for seconds, initiator, _, period, tag in events:
+                log.record(time_stamp(seconds), initiator, tag, period)
+            state = log.state_at()
+            assert (state.focus_pts, state.opp_pts, state.td_diff) == (focus_pts, opp_pts, td_diff)
+
+        before = [(str(e.time_stamp), e.label.tag, e.focus_score) for e in match.time_series]
+        match.defer_time_series()
+        assert match.score_summary == summary
+        assert [(str(e.time_stamp), e.label.tag, e.focus_score) for e in match.time_series] == before
+
+
+def test_encodings_round_trip():
+    for rng, ruleset, events in examples(2, corrupt=True):
+        if any(a[0] > b[0] for a, b in zip(events, events[1:])):
+            continue
+        original = build_events(ruleset, events)
+        fields = [(str(e.time_stamp), e.initiator, e.focus_color, e.period, e.label.tag) for e in original]
+        blob = encode_time_series(original, ruleset, rng.choice(COMPRESSIONS))
+        decoded = decode_time_series(blob)
+        assert [(str(e.time_stamp), e.initiator, e.focus_color, e.period, e.label.tag) for e in decoded] == fields
+        assert all(type(e) is scoring_class(ruleset) for e in decoded)
+        restored = decompress_time_series(compress_time_series(original))
+        assert [(str(e.time_stamp), e.initiator, e.focus_color, e.period, e.label.tag) for e in restored] == fields
+
+
+def test_cached_totals_agree():
+    rng = random.Random(SEED + 3)
+    matches = []
+    for i in range(EXAMPLES):
+        ruleset = RULESETS[i % len(RULESETS)]
+        events = random_events(rng, ruleset)
+        matches.append(build_match(ruleset, events, rng, i))
+
+    index = EventIndex()
+    index.extend(matches)
+    for event_id in range(len(index)):
+        bouts = index.matches(event_id)
+        summary = index.summary(event_id)
+        assert summary.bouts == len(bouts)
+        assert summary.falls == sum(abs(m.result.value) == 4 for m in bouts)
+        points = {}
+        for m in bouts:
+            winner = m.focus if m.result.value > 0 else m.opponent
+            points[winner.team] = points.get(winner.team, 0) + base.Result(abs(m.result.value)).team_points
+        assert dict(summary.team_points) == points
+
+    store = PartitionedCollection()
+    store.extend(matches[: len(matches) // 2])
+    store.extend(matches[len(matches) // 2:])
+    for key, stats in store.stats().items():
+        group = [m for m in matches if store.key_of(m) == key]
+        assert stats == PartitionStats().updated(group)
+        assert stats.focus_pts == sum(recount(m.ruleset, [
+            (0, e.initiator, e.focus_color, 0, e.label.tag) for e in m.time_series
+        ])[0] for m in group)
+
+    rows = to_records(matches, fmt="dicts")
+    assert rows == [m.to_dict() for m in matches]
+
+
+@pytest.mark.parametrize("ruleset", RULESETS, ids=lambda r: r.name)
+def test_generated_valid_series_are_valid(ruleset):
+    rng = random.Random(SEED + 4)
+    for _ in range(EXAMPLES // 5):
+        events = random_events(rng, ruleset)
+        series = build_events(ruleset, events)
+        assert isvalid_sequence(ruleset, series)
+        assert all(score.label.isvalid for score in series)
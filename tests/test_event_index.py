@@ -0,0 +1,36 @@
+from wrestling.base import Result
+from wrestling.event_index import EventIndex
+from wrestling.repository import MatchRepository
+
+
+def test_event_index_summaries(make_match):
+    matches = [
+        make_match(),
+        make_match(labels=(("red", "T2"), ("green", "E1"), ("red", "FALL")), result=Result.WF),
+        make_match(labels=(("green", "T2"),), result=Result.LD),
+        make_match(event="Other", kind="Tournament"),
+    ]
+    index = EventIndex(rating=lambda wrestler: {"Nick Anthony": 1.0, "John Smith": 2.0}[wrestler.name])
+    index.extend(matches[:2])
+    first = index.find("Fun One")
+    before = index.summary(first)
+    assert index.summary(first) is before and before.bouts == 2
+    index.extend(matches[2:])
+    summary = index.summary(first)
+    assert (summary.bouts, summary.decisions, summary.falls, summary.upsets) == (3, 2, 1, 2)
+    assert dict(summary.team_points) == {"Eagles": 9, "Hawks": 3}
+    assert summary.bonus_rate == 1 / 3
+    assert len(index) == 2 and index.find("Other", "Tournament") == 1
+    assert index.matches(first) == tuple(matches[:3])
+    assert index.event(first) is matches[0].event
+    assert matches[2].event is not matches[0].event
+
+
+def test_event_index_read_only_views(make_match):
+    match = make_match(result=Result.WF, labels=(("red", "T2"), ("red", "FALL")))
+    repository = MatchRepository([make_match(match_id="x")])
+    index = EventIndex()
+    index.extend([match.flipped(), repository.get("x")])
+    summary = index.summary(0)
+    assert (summary.bouts, summary.falls) == (2, 1)
+    assert dict(summary.team_points) == {"Eagles": 9}
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import wrestling
+
+
+def _import_report(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    # cumulative import time per module, in microseconds
+    timings = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                timings[module.strip()] = int(cumulative)
+    return result.stdout, timings
+
+
+def test_lazy_exports():
+    assert wrestling.CollegeMatch.__name__ == "CollegeMatch"
+    assert wrestling.audit.audit_matches
+    assert set(wrestling.__all__) <= set(dir(wrestling))
+
+
+def test_import_is_lightweight():
+    out, timings = _import_report(
+        "import sys, wrestling; print(sorted(m for m in sys.modules if m.startswith(('wrestling', 'attr'))))"
+    )
+    assert out.strip() == "['wrestling']"
+    # generous bound, the lazy package imports in about a millisecond
+    assert timings["wrestling"] < 250000
+
+
+def test_import_is_cheaper_than_submodules():
+    _, timings = _import_report("import wrestling, wrestling.matches")
+    # relative to an eager import in the same process, so machine speed cancels out
+    assert timings["wrestling"] * 5 < timings["wrestling.matches"]
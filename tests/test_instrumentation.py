@@ -0,0 +1,29 @@
+import json
+
+from wrestling import instrumentation
+from wrestling.matches import CollegeMatch
+
+
+def test_instrumentation_roundtrip(make_match):
+    original = CollegeMatch.__init__
+    instrumentation.reset()
+    with instrumentation.instrumented():
+        assert instrumentation.enabled()
+        make_match().to_dict()
+        with instrumentation.stage("custom"):
+            pass
+    assert not instrumentation.enabled()
+    assert CollegeMatch.__init__ is original
+    snap = instrumentation.snapshot()
+    assert snap["match.init"]["count"] == 1
+    assert snap["scoring.init"]["count"] == 3
+    assert snap["label.post_init"]["count"] == 3
+    assert snap["match.to_dict"]["count"] == 1
+    assert snap["custom"]["count"] == 1
+    assert sum(snap["match.init"]["histogram"].values()) == 1
+    assert "match.score_pass" in instrumentation.report()
+    assert json.loads(instrumentation.report("json"))["sequence.isvalid"]["count"] == 1
+    make_match()
+    assert instrumentation.snapshot()["match.init"]["count"] == 1
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,98 @@
+import base64
+import pickle
+import zlib
+
+from wrestling.base import Result
+from wrestling.scoring import LazyTimeSeries
+
+
+def test_running_scores(make_match):
+    match = make_match(labels=(("red", "T2"), ("green", "E1"), ("red", "N2")))
+    assert match.time_series[0].label.tag == "START"
+    assert [(s.focus_score, s.opp_score) for s in match.time_series] == [
+        (0, 0), (2, 0), (2, 1), (4, 1)
+    ]
+    assert (match.focus_pts, match.opp_pts, match.mov, match.td_diff) == (4, 1, 3, 1)
+
+
+def test_deferred_time_series(make_match):
+    match = make_match(labels=(("red", "T2"), ("green", "E1"), ("red", "N2")))
+    expected = match.to_dict()
+    events = match.time_series
+    match.defer_time_series()
+    assert isinstance(match.time_series, LazyTimeSeries)
+    assert match.deferred
+    assert match.to_dict() == expected
+    assert not match.time_series.loaded
+    assert len(match.time_series) == 4
+    assert [(s.formatted_label, s.opp_score) for s in match.time_series] == [
+        (s.formatted_label, s.opp_score) for s in events
+    ]
+    assert not match.deferred
+    assert match.to_dict() == expected
+
+
+def test_lazy_match_construction(make_match):
+    source = make_match(result=Result.WM)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return source.time_series
+
+    lazy = LazyTimeSeries(loader=loader, summary=source.score_summary)
+    match = make_match(result=Result.WM, labels=())
+    match.time_series = lazy
+    assert match.focus_pts == source.focus_pts and not calls
+    assert [s.label.tag for s in match.time_series] == ["START", "T2", "E1"]
+    assert calls == [1]
+
+
+def test_flipped(make_match):
+    match = make_match(labels=(("red", "T2"), ("green", "E1"), ("red", "N2")))
+    flipped = match.flipped()
+    assert flipped.focus == match.opponent and flipped.opponent == match.focus
+    assert flipped.result == Result.LD
+    assert (flipped.focus_pts, flipped.opp_pts, flipped.mov, flipped.td_diff) == (1, 4, -3, -1)
+    assert [s.formatted_label for s in flipped.time_series] == ["oSTART", "oT2", "fE1", "oN2"]
+    assert flipped.time_series[-1].focus_score == 1
+    assert flipped.time_series[-1].source is match.time_series[-1]
+    row = flipped.to_dict()
+    assert row["focus_name"] == "John Smith" and row["text_result"] == "Loss Dec"
+    assert row["weight"] == "165"
+    assert flipped.to_dict(ts_only=True)[2]["str_label"] == "fE1"
+    assert flipped.calculate_pts("f") == 1
+    assert flipped.flipped() is match
+
+
+def test_flipped_deferred(make_match):
+    match = make_match()
+    match.defer_time_series()
+    flipped = match.flipped()
+    assert flipped.score_summary.focus_pts == 1
+    assert [s.formatted_label for s in flipped.time_series] == ["oSTART", "oT2", "fE1"]
+
+
+def test_flipped_expected_result(make_match):
+    match = make_match(labels=(("red", "T2"), ("red", "FALL")), result=Result.WF)
+    assert match.expected_result == Result.WF
+    flipped = match.flipped()
+    assert flipped.expected_result == Result.LF
+    assert flipped.result_consistent
+
+
+# CollegeMatch pickled before matches cached their ScoreSummary (no `_summary` slot)
+LEGACY_PICKLE = (
+    "eNptUEtPwkAQbgsIEuIj3k1PRhKDVKMHbwQxhlpMgMTztky6DaVN2kXiTQ8KJntj/Af+NP+HTh+kHNxsupOv32NmXstfJ5qSHnm4iCAWvhe4"
+    "rRkTDocYZaMb+j64YCUArrH5hqeyxGwHB/Kg4MMzBILolV5SZDxZvZsH+mMAKPcKps1iAsoWi6Y5bfd2znzdAhC4kgou0f5AW9YmTIDwZkQu"
+    "yjV269UfVc0axnccIq/LnSHEcz9JNdUE+pRHRV5WQUTN1Z7yOg9uDDxnqncCwcPgBeVOj7k+zdz/pUNd8OOEVO+HPNBHM09wGu+eLaZbjEbC"
+    "KBnXV7ji+wSsmqZifavbm4ydMKKXdpBvcpQD+S5r7fZNeskoggnyc1M1FVOhuTa7f2A2+Bt+ZTTuDMdJnqkItOnys20jo00WqYlGJkb6SxtfpA"
+    "LtP8ElJVfcCCDAXKZuZD0jlamZbIn0af0BLq7QjQ=="
+)
+
+
+def test_legacy_pickle(make_match):
+    match = pickle.loads(zlib.decompress(base64.b64decode(LEGACY_PICKLE)))
+    assert (match.focus_pts, match.opp_pts, match.mov) == (2, 1, 1)
+    assert match.to_dict() == make_match().to_dict()
+    assert pickle.loads(pickle.dumps(match)).score_summary == match.score_summary
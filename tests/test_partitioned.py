@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling.base import Result
+from wrestling.query import MatchQuery
+from wrestling.storage.partitioned import PartitionedCollection, date_bucket
+
+
+def test_date_bucket():
+    assert date_bucket(datetime(2020, 3, 4)) == "2020-03"
+    assert date_bucket("2020-03-04", "year") == "2020"
+    assert date_bucket("2021-01-01", "week") == "2020-W53"
+    with pytest.raises(ValueError):
+        date_bucket("2020-01-01", "day")
+
+
+def test_partition_pruning_and_persistence(tmp_path, make_match):
+    matches = [
+        make_match(weight="165", date=datetime(2020, 1, 5)),
+        make_match(weight="165", date=datetime(2020, 2, 5), result=Result.WM,
+                   labels=(("red", "T2"), ("red", "N4"), ("red", "N2"))),
+        make_match(weight="174", date=datetime(2020, 1, 20)),
+    ]
+    store = PartitionedCollection()
+    store.extend(matches)
+    assert len(store) == 3
+    assert [p.key for p in store.partitions([165], end=datetime(2020, 1, 31))] == [("165", "2020-01")]
+    query = MatchQuery().weight(165).between(datetime(2020, 2, 1), datetime(2020, 2, 28))
+    assert list(store.query(query)) == [matches[1]]
+    stats = store.stats(weights=["165"])[("165", "2020-02")]
+    assert (stats.count, stats.bonus_wins, stats.focus_pts) == (1, 1, 8)
+
+    assert store.save(tmp_path) == 3
+    store.extend([make_match(weight="174", date=datetime(2020, 1, 25))])
+    assert store.save() == 1
+    reopened = PartitionedCollection.open(tmp_path)
+    assert len(reopened) == 4 and reopened.stats() == store.stats()
+    assert not any(partition.loaded for partition in reopened.partitions())
+    found = list(reopened.query(MatchQuery().weight("174")))
+    assert [match.to_dict() for match in found] == [m.to_dict() for m in store.query(MatchQuery().weight("174"))]
+    assert [p.loaded for p in reopened.partitions()] == [False, False, True]
+
+
+def test_partition_query_with_string_bounds(make_match):
+    matches = [
+        make_match(weight="165", date=datetime(2020, 1, 5)),
+        make_match(weight="165", date=datetime(2020, 1, 31, 18)),
+        make_match(weight="165", date=datetime(2020, 2, 5)),
+        make_match(weight="174", date=datetime(2020, 1, 10)),
+    ]
+    store = PartitionedCollection()
+    store.extend(matches)
+    found = list(store.query(MatchQuery().weight(165).between("2020-01-01", "2020-01-31")))
+    assert found == matches[:2]
+    assert list(store.query(MatchQuery().between(start="2020-02-01"))) == [matches[2]]
+
+
+def test_partition_stats_date_keys(make_match):
+    store = PartitionedCollection()
+    store.extend([make_match(date=datetime(2020, 1, 5, 9)), make_match(date="2020-01-05T08:00:00")])
+    stats = store.stats()[("165", "2020-01")]
+    assert (stats.first_date, stats.last_date) == ("2020-01-05T08:00:00", "2020-01-05T09:00:00")
+    assert date_bucket("2020-01-05 09:00:00", "week") == date_bucket(datetime(2020, 1, 5), "week")
@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+from wrestling.base import Result
+from wrestling.query import MatchCollection, MatchQuery
+
+
+def test_query_indexes(make_match):
+    matches = MatchCollection([
+        make_match(weight="165", result=Result.WM, date=datetime(2020, 1, 1)),
+        make_match(weight="165", result=Result.WD, date=datetime(2020, 1, 2)),
+        make_match(weight="174", result=Result.WF, date=datetime(2020, 1, 3)),
+        make_match(weight="165", result=Result.LT, date=datetime(2020, 2, 1), opp_team="owls"),
+    ])
+    query = MatchQuery().weight("165").bonus()
+    assert query.run(matches).count() == 2
+    window = query.between(datetime(2020, 1, 1), datetime(2020, 1, 31))
+    assert window.run(matches).positions == [0]
+    assert MatchQuery().opponent_team("owls").run(matches).positions == [3]
+    assert MatchQuery().where(lambda m: m.result.win).run(matches).count() == 3
+    rows = MatchQuery().result(Result.WF).run(matches).to_dict()
+    assert rows[0]["weight"] == "174"
+
+
+def test_collection_extend_updates_indexes(make_match):
+    matches = MatchCollection([make_match(weight="165")])
+    query = MatchQuery().weight("165").between(end=datetime(2021, 1, 1))
+    assert query.run(matches).count() == 1
+    matches.extend([make_match(weight="165", date=datetime(2020, 6, 1))])
+    assert query.run(matches).count() == 2
+    assert query.run(matches).aggregate("mov") == 2
+
+
+def test_date_range_mixes_strings_and_datetimes(make_match):
+    matches = MatchCollection([
+        make_match(date=datetime(2020, 1, 15)),
+        make_match(date="2020-03-01"),
+    ])
+    assert MatchQuery().between("2020-01-01", "2020-02-01").run(matches).positions == [0]
+    assert MatchQuery().between(datetime(2020, 2, 1)).run(matches).positions == [1]
+    matches.extend([make_match(date="2020-01-20"), make_match(date=datetime(2019, 12, 31))])
+    assert MatchQuery().between("2020-01-01", "2020-02-01").run(matches).positions == [0, 2]
+    assert MatchQuery().between(end="2019-12-31T23:59:59").run(matches).positions == [3]
+
+
+def test_date_only_end_bound_includes_the_day(make_match):
+    matches = MatchCollection([
+        make_match(date=datetime(2020, 1, 31)),
+        make_match(date=datetime(2020, 1, 31, 19)),
+        make_match(date="2020-01-31 20:30:00"),
+        make_match(date=datetime(2020, 2, 1)),
+    ])
+    by_string = MatchQuery().between("2020-01-01", "2020-01-31").run(matches).positions
+    assert by_string == [0, 1, 2]
+    assert MatchQuery().between(date(2020, 1, 31), date(2020, 1, 31)).run(matches).positions == [0, 1, 2]
+    assert MatchQuery().between(end=datetime(2020, 1, 31)).run(matches).positions == [0]
+    assert MatchQuery().between(start="2020-01-31T19:00:00").run(matches).positions == [1, 2, 3]
@@ -0,0 +1,23 @@
+import pytest
+
+from wrestling.base import Result
+from wrestling.records import FIELDS, to_records
+
+
+def test_records_match_to_dict(make_match):
+    matches = [make_match(), make_match(result=Result.LF, weight="174").flipped()]
+    dicts = to_records(matches, fmt="dicts")
+    assert dicts == [match.to_dict() for match in matches]
+    assert list(dicts[0]) == list(FIELDS)
+    rows = to_records(matches, fields=("weight", "mov"))
+    assert rows == [("165", 1), ("174", -1)]
+    columns = to_records(matches, fields=("win", "focus_name"), fmt="columns")
+    assert columns == {"win": [True, True], "focus_name": ["Nick Anthony", "John Smith"]}
+    assert to_records(matches, fields=("weight",)) == [("165",), ("174",)]
+
+
+def test_records_errors(make_match):
+    with pytest.raises(ValueError):
+        to_records([make_match()], fields=("nope",))
+    with pytest.raises(ValueError):
+        to_records([make_match()], fmt="arrow")
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.replay import ActionLog
+from wrestling.wrestlers import Wrestler
+
+
+def _match_kwargs():
+    return dict(
+        id="abc",
+        event=Event(name="Fun One", kind=base.Mark("Dual Meet")),
+        date="2020-01-01",
+        result=base.Result.WD,
+        focus=Wrestler(name="Nick Anthony", team="Eagles"),
+        opponent=Wrestler(name="John Smith", team="Hawks"),
+        weight=base.Mark("165"),
+    )
+
+
+def test_replay_undo_and_correct():
+    log = ActionLog("college", snapshot_every=2)
+    takedown = log.record("00:00:30", "red", "T2")
+    log.record("00:01:10", "green", "E1")
+    near_fall = log.record("00:02:00", "red", "N2")
+    assert log.state_at("00:01:00").focus_pts == 2
+    assert log.state_at("00:01:00").position == "top"
+    log.undo(near_fall)
+    log.correct(takedown, time_stamp="00:00:40")
+    final = log.state_at()
+    assert (final.focus_pts, final.opp_pts, final.position, final.td_diff) == (2, 1, "neutral", 1)
+    assert log.state_at("00:00:35").focus_pts == 0
+    assert [state.mov for state in log.replay()] == [2, 1]
+    rebuilt = ActionLog.from_entries("college", log.entries, snapshot_every=2)
+    assert rebuilt.actions == log.actions
+    with pytest.raises(ValueError):
+        log.undo(near_fall)
+    with pytest.raises(ValueError):
+        log.record("00:03:00", "red", "TH4")
+
+    match = log.to_match(**_match_kwargs())
+    assert match.isvalid and (match.focus_pts, match.opp_pts) == (2, 1)
+
+
+def test_replay_snapshots_agree_with_full_replay():
+    rng = random.Random(7)
+    log = ActionLog("college", snapshot_every=3)
+    for second in range(0, 400, 5):
+        log.record(f"00:{second // 60:02d}:{second % 60:02d}", rng.choice(("red", "green")), "P1")
+    for seq in rng.sample(range(len(log)), 10):
+        log.undo(seq)
+    states = list(log.replay())
+    for state in states:
+        assert log.state_at(state.time_stamp) == state
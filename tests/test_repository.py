@@ -0,0 +1,66 @@
+import threading
+
+import attr
+import pytest
+
+from wrestling.query import MatchQuery
+from wrestling.repository import FrozenMatch, MatchRepository
+
+
+def test_repository_copy_on_write(make_match):
+    repository = MatchRepository([make_match(match_id="a", weight="165"), make_match(match_id="b", weight="174")])
+    before = repository.snapshot()
+    assert len(before.query(MatchQuery().weight(165))) == 1
+
+    repository.put([make_match(match_id="c", weight="165"), make_match(match_id="b", weight="165")])
+    assert repository.version == 1 and len(repository) == 3
+    assert [m._id for m in repository.query(MatchQuery().weight(165))] == ["a", "b", "c"]
+    # readers holding the old snapshot see the old contents
+    assert len(before) == 2 and before.get("b").weight == "174" and "c" not in before
+
+    repository.remove(["a", "missing"])
+    assert [m._id for m in repository] == ["b", "c"] and repository.get("a") is None
+
+
+def test_frozen_match_is_read_only(make_match):
+    repository = MatchRepository([make_match(match_id="a")])
+    match = repository.get("a")
+    assert isinstance(match, FrozenMatch) and match.focus_pts == 2 and match.to_dict()["focus_name"] == "Nick Anthony"
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        match.result = None
+    with pytest.raises(AttributeError):
+        match.defer_time_series()
+    with pytest.raises(TypeError):
+        repository.put(["a"])
+
+
+def test_concurrent_reads_see_consistent_snapshots(make_match):
+    repository = MatchRepository()
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            snapshot = repository.snapshot()
+            ids = [match._id for match in snapshot.query(MatchQuery().weight(165))]
+            if len(ids) != snapshot.version or ids != sorted(ids, key=int):
+                errors.append(ids)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for i in range(50):
+        repository.put([make_match(match_id=str(i), weight="165")])
+    done.set()
+    for reader in readers:
+        reader.join()
+    assert not errors and len(repository) == 50
+
+
+def test_seal_loads_deferred_time_series(make_match):
+    match = make_match(match_id="a")
+    match.defer_time_series()
+    assert not match.time_series.loaded
+    repository = MatchRepository([match])
+    assert match.time_series.loaded
+    assert [s.formatted_label for s in repository.get("a").time_series] == ["fSTART", "fT2", "oE1"]
@@ -0,0 +1,100 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.matches import CollegeMatch, HSMatch, match_class
+from wrestling.rulesets import COLLEGE, HIGH_SCHOOL, Ruleset, get_ruleset, register_ruleset
+from wrestling.scoring import CollegeScoring, scoring_class
+from wrestling.wrestlers import Wrestler
+
+
+def test_registry():
+    assert get_ruleset("college") is COLLEGE
+    assert get_ruleset("hs") is HIGH_SCHOOL
+    assert get_ruleset(COLLEGE) is COLLEGE
+    with pytest.raises(ValueError):
+        get_ruleset("sumo")
+    with pytest.raises(ValueError):
+        register_ruleset(HIGH_SCHOOL, aliases=("college",))
+
+
+def test_moves_only_include_scored_labels():
+    assert "fRT1" in COLLEGE.moves["top"]
+    assert all("fRT1" not in moves for moves in HIGH_SCHOOL.moves.values())
+
+
+def test_builtin_classes_share_rulesets():
+    assert base.label_class("college") is base.CollegeLabel
+    assert scoring_class("high school").ruleset is HIGH_SCHOOL
+    assert match_class(COLLEGE) is CollegeMatch
+    assert HSMatch.ruleset.duration == 360
+    assert base.CollegeLabel("N4").point_value == 4
+    assert not base.HSLabel("N4").isvalid
+    assert base.HSLabel("N3").valid_labels is HIGH_SCHOOL.labels
+
+
+def test_custom_ruleset_as_data():
+    youth = register_ruleset(Ruleset(
+        name="youth",
+        title="Youth",
+        points=dict(COLLEGE.points, T2=3),
+        always=COLLEGE.always,
+        position_moves=COLLEGE.position_moves,
+        transitions=COLLEGE.transitions,
+        duration=240,
+        periods=(60, 90, 90),
+    ))
+    scoring, label = scoring_class(youth), base.label_class(youth)
+    assert scoring_class("youth") is scoring and label.ruleset is youth
+    assert youth.period_starts == (0, 60, 150)
+    match = match_class(youth)(
+        id="a",
+        event=Event(name="Open", kind=base.Mark("Tournament")),
+        date=datetime(2021, 1, 1),
+        result=base.Result.WD,
+        focus=Wrestler(name="a", team="b"),
+        opponent=Wrestler(name="c", team="d"),
+        weight=base.Mark("60"),
+        time_series=(
+            scoring(time_stamp="00:00:10", initiator="red", focus_color="red", period=1,
+                    label=label("T2")),
+        ),
+    )
+    assert match.duration == 240
+    assert match.focus_pts == 3
+    with pytest.raises(TypeError):
+        match_class(youth)(
+            id="a", event=match.event, date=match.date, result=match.result,
+            focus=match.focus, opponent=match.opponent, weight=base.Mark("60"),
+            time_series=(CollegeScoring(time_stamp="00:00:10", initiator="red",
+                                        focus_color="red", period=1,
+                                        label=base.CollegeLabel("T2")),),
+        )
+
+
+def test_international_tech_superiority(make_match):
+    labels = (("red", "T2"), ("red", "EX2"), ("red", "EX2"), ("red", "EX2"), ("red", "EX2"))
+    greco = make_match(level="greco", labels=labels, result=base.Result.WT)
+    assert greco.focus_pts == 10 and greco.tech_superiority
+    assert greco.score_summary.tech_index == 4
+    freestyle = make_match(level="freestyle", labels=labels, result=base.Result.WT)
+    assert freestyle.score_summary.tech_index == 5
+    college = make_match(labels=(("red", "T2"), ("red", "N4")))
+    assert not college.tech_superiority
+
+
+def test_criteria(make_match):
+    match = make_match(
+        level="freestyle",
+        labels=(("red", "TH4"), ("green", "R1"), ("red", "NEU"), ("green", "T2"), ("green", "C1")),
+    )
+    assert match.focus_pts == match.opp_pts == 4
+    assert all(s.label.isvalid for s in match.time_series)
+    assert match.criteria_winner == match.focus
+    assert match.score_summary.focus_cautions == 1
+    assert match.flipped().score_summary.criteria_leader == "o"
+    even = make_match(level="greco", labels=(("red", "T2"), ("green", "T2")))
+    assert even.criteria_winner == even.opponent
+    assert make_match(labels=(("red", "T2"), ("green", "R2"))).criteria_winner is None
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from wrestling import schedule
+from wrestling.base import Result
+from wrestling.schedule import ScheduleGraph, strength_of_schedule
+from wrestling.wrestlers import Wrestler
+
+
+def test_schedule_metrics(make_match):
+    def bout(focus, opponent, **kwargs):
+        return make_match(focus=focus, opponent=opponent, opp_team="Eagles", **kwargs)
+
+    matches = [
+        bout("A", "B", labels=(("red", "T2"),)),
+        bout("B", "C", labels=(("red", "T2"),)),
+        bout("C", "D", labels=(("red", "T2"),)),
+        bout("D", "A", result=Result.NC),
+    ]
+    graph = ScheduleGraph.from_matches(matches, margin="mov")
+    assert graph.bouts == 3 and len(graph.wrestlers) == 4
+    table = strength_of_schedule(matches, margin="mov", ridge=1e-6)
+    a, b, c, d = (table[Wrestler(name=name, team="Eagles")] for name in "ABCD")
+    assert (a.wins, a.losses, b.win_pct) == (1, 0, 0.5)
+    assert (a.owp, b.owp, c.owp, d.owp) == (0.5, 0.75, 0.25, 0.5)
+    assert b.oowp == pytest.approx(0.375) and a.strength == pytest.approx(1.75 / 3)
+    assert a.rating - b.rating == pytest.approx(2, abs=1e-3)
+    assert b.rating - d.rating == pytest.approx(4, abs=1e-3)
+    assert sum(stats.rating for stats in table.values()) == pytest.approx(0, abs=1e-6)
+    with pytest.raises(ValueError):
+        graph.ratings(ridge=0)
+
+
+def test_numpy_scipy_paths_match_python(monkeypatch, make_match):
+    pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    rng = random.Random(7)
+    names = [f"W{i}" for i in range(12)]
+    matches = []
+    for _ in range(40):
+        focus, opponent = rng.sample(names, 2)
+        result = rng.choice((Result.WD, Result.WM, Result.LD, Result.LF))
+        matches.append(make_match(focus=focus, opponent=opponent, opp_team="Eagles", result=result))
+    fast = ScheduleGraph.from_matches(matches)
+    fast_table = fast.table(ridge=1e-4)
+    monkeypatch.setattr(schedule, "numpy", None)
+    monkeypatch.setattr(schedule, "sparse", None)
+    slow_table = ScheduleGraph.from_matches(matches).table(ridge=1e-4)
+    for wrestler, stats in slow_table.items():
+        other = fast_table[wrestler]
+        assert (other.owp, other.oowp) == pytest.approx((stats.owp, stats.oowp))
+        assert other.rating == pytest.approx(stats.rating, abs=1e-4)
@@ -0,0 +1,27 @@
+from wrestling.scouting import ProfileStore
+from wrestling.wrestlers import Wrestler
+
+FOCUS = Wrestler(name="Nick Anthony", team="Eagles")
+OPPONENT = Wrestler(name="John Smith", team="Hawks")
+
+
+def test_profiles_from_both_perspectives(make_match, tmp_path):
+    labels = (("red", "T2"), ("green", "E1"), ("red", "T2"), ("green", "R2"), ("red", "E1"))
+    store = ProfileStore()
+    store.update([make_match(labels=labels), make_match(labels=labels[:2])])
+    focus, opponent = store.profile(FOCUS), store.profile(OPPONENT)
+
+    assert focus.matches == 2 and focus.actions == {"T2": 3, "E1": 1} and focus.against == {"E1": 2, "R2": 1}
+    assert focus.scored == {1: 7} and opponent.allowed == {1: 7} and opponent.scored == {1: 4}
+    assert (focus.escapes, focus.escape_seconds, focus.reversals) == (1, 20, 0)
+    assert (opponent.escapes, opponent.escape_seconds, opponent.reversals) == (2, 40, 1)
+    assert focus.sequences[("fT2", "oE1")] == 2 and opponent.sequences[("oT2", "fE1")] == 2
+    assert focus.takedowns_per_minute == 3 / (2 * make_match().duration / 60)
+
+    path = str(tmp_path / "profiles.json.z")
+    store.save(path)
+    loaded = ProfileStore.load(path)
+    assert loaded.profile(FOCUS).to_dict() == focus.to_dict()
+    report = loaded.report(OPPONENT)
+    assert "2 escapes after 20s on average, 1 reversals" in report and "oT2 -> fE1 x2" in report
+    assert list(loaded.reports([FOCUS, Wrestler(name="Nobody", team="Hawks")])) == [FOCUS]
@@ -0,0 +1,43 @@
+import pytest
+
+from wrestling import rulesets
+from wrestling.base import CollegeLabel
+from wrestling.scoring import CollegeScoring
+from wrestling.sequence import COLLEGE_SEQUENCES, HS_SEQUENCES, isvalid_sequence
+
+
+def _series(*labels):
+    return tuple(
+        CollegeScoring(time_stamp=f"00:0{i}:00", initiator=initiator, focus_color="red",
+                       period=1, label=CollegeLabel(tag))
+        for i, (initiator, tag) in enumerate(labels)
+    )
+
+
+def test_sequences_tables():
+    assert "fT2" in COLLEGE_SEQUENCES["neutral"]
+    assert "fN4" in COLLEGE_SEQUENCES["top"] and "fN4" not in COLLEGE_SEQUENCES["bottom"]
+
+
+@pytest.mark.parametrize(
+    "ruleset, table", [(rulesets.COLLEGE, COLLEGE_SEQUENCES), (rulesets.HIGH_SCHOOL, HS_SEQUENCES)]
+)
+def test_sequences_tables_match_compiled_moves(ruleset, table):
+    assert {position: table[position] for position in rulesets.POSITIONS} == dict(ruleset.moves)
+    assert all(table["always"] <= ruleset.moves[position] for position in rulesets.POSITIONS)
+    assert all(label[1:] in ruleset.points for label in table["always"])
+    assert ("fRT1" in table["always"]) == ("RT1" in ruleset.points)
+
+
+def test_position_tracking():
+    ts = _series(("red", "T2"), ("red", "N2"), ("green", "E1"), ("red", "N2"), ("red", "T2"))
+    assert isvalid_sequence("college", ts)
+    assert [s.label.isvalid for s in ts] == [True, True, True, False, True]
+    assert "neutral move" in ts[3].label.msg
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        isvalid_sequence("sumo", ())
+    with pytest.raises(ValueError):
+        isvalid_sequence("college", tuple(reversed(_series(("red", "T2"), ("red", "N2")))))
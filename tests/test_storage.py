@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling.base import Result
+from wrestling.matches import CollegeMatch, HSMatch
+from wrestling.storage.sqlite import SQLiteStore
+from wrestling.wrestlers import Wrestler
+
+
+def test_sqlite_roundtrip(make_match):
+    matches = [
+        make_match(weight="165", date=datetime(2020, 1, 1)),
+        make_match(level="hs", weight="120", result=Result.LD, date="2020-01-05",
+                   labels=(("green", "T2"), ("red", "E1"), ("green", "N3"))),
+        make_match(weight="165", opponent="Al Bo", date=datetime(2020, 2, 1)),
+    ]
+    with SQLiteStore() as store:
+        assert store.insert_matches(matches, batch_size=2) == 3
+        assert store.count() == 3
+        records = list(store.select(weight="165"))
+        assert [r.opponent.name for r in records] == ["John Smith", "Al Bo"]
+        assert records[0].date == datetime(2020, 1, 1)
+        assert records[0]._time_series is None
+        assert records[0].mov == matches[0].mov
+        rebuilt = records[0].to_match()
+        assert isinstance(rebuilt, CollegeMatch)
+        assert rebuilt.to_dict() == matches[0].to_dict()
+        hs = next(store.select(result=Result.LD))
+        assert hs.focus_pts == 1 and hs.opp_pts == 5
+        assert isinstance(hs.to_match(), HSMatch)
+        assert len(list(store.select(wrestler="al bo", end=datetime(2020, 3, 1)))) == 1
+
+
+def test_sqlite_lazy_match(make_match):
+    match = make_match()
+    with SQLiteStore() as store:
+        store.insert_matches([match])
+        lazy = next(store.select()).to_match(lazy=True)
+        assert lazy.deferred
+        assert lazy.to_dict() == match.to_dict()
+        assert [s.formatted_label for s in lazy.time_series] == [
+            s.formatted_label for s in match.time_series
+        ]
+        assert lazy.time_series[-1].opp_score == 1
+
+
+def test_sqlite_insert_retry_after_rollback(make_match):
+    match = make_match(opponent="Al Bo")
+    with SQLiteStore() as store:
+        with pytest.raises(TypeError):
+            store.insert_matches([match, "bad"])
+        assert store.count() == 0
+        assert store.insert_matches([match]) == 1
+        assert [r.opponent.name for r in store.select()] == ["Al Bo"]
+
+
+def test_sqlite_lazy_match_keeps_full_summary(make_match):
+    labels = (("red", "T2"), ("red", "N4"), ("green", "E1")) * 3
+    match = make_match(labels=labels, result=Result.WT)
+    assert match.isvalid and match.tech_superiority
+    with SQLiteStore() as store:
+        store.insert_matches([match])
+        record = next(store.select())
+        assert record.summary == match.score_summary
+        lazy = record.to_match(lazy=True)
+        assert lazy.isvalid
+        assert lazy.expected_result == Result.WT
+        assert lazy.tech_superiority
+        assert lazy.deferred
+
+
+def test_sqlite_keeps_latest_known_grade(make_match):
+    with SQLiteStore() as store:
+        first = make_match()
+        first.focus = Wrestler(name="Nick Anthony", team="Eagles", grade_int=2)
+        store.insert_matches([first])
+        second = make_match()
+        second.focus = Wrestler(name="Nick Anthony", team="Eagles", grade_int=3)
+        store.insert_matches([second, make_match()])
+        assert [record.focus.grade_int for record in store.select()] == [3, 3, 3]
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from wrestling import base
+from wrestling.upsets import EloRatings, UpsetDetector, from_seeds, upset_rate, win_probability
+from wrestling.wrestlers import Wrestler
+
+
+def test_seeded_upsets(make_match):
+    seeds = {Wrestler(name="Nick Anthony", team="Eagles"): 1, Wrestler(name="John Smith", team="Hawks"): 4}
+    detector = UpsetDetector(from_seeds(seeds), scale=4)
+    favorite, underdog, unseeded = detector.stream(
+        [
+            make_match(result=base.Result.WD),
+            make_match(result=base.Result.LF),
+            make_match(result=base.Result.NC, labels=()),
+            make_match(result=base.Result.WD, opponent="Unseeded"),
+        ]
+    )
+    assert favorite.win_probability == pytest.approx(win_probability(-1, -4, 4)) and not favorite.upset
+    assert underdog.winner.name == "John Smith" and underdog.upset and underdog.upset_score > 0.5
+    assert underdog.bonus_surprise == pytest.approx(3 * (1 - underdog.win_probability))
+    assert not unseeded.rated and detector.processed == 4
+    assert upset_rate([favorite, underdog, unseeded]) == 0.5
+    with pytest.raises(ValueError):
+        UpsetDetector(from_seeds(seeds), scale=0)
+
+
+def test_elo_backfill_updates_after_expectation(make_match):
+    elo = EloRatings()
+    detector = UpsetDetector(elo)
+    first, second = detector.backfill(
+        [make_match(result=base.Result.LD, date="2020-02-01"), make_match(result=base.Result.WD, date="2020-01-01")]
+    )
+    assert first.win_probability == 0.5 and not first.upset
+    assert second.upset and second.winner.name == "John Smith"
+    assert 1484 < elo(Wrestler(name="Nick Anthony", team="Eagles")) < 1500
+    assert list(detector.upsets([make_match(result=base.Result.LD)])) == []
+
+
+def test_backfill_orders_mixed_date_types(make_match):
+    detector = UpsetDetector(EloRatings())
+    later = make_match(result=base.Result.LD, date=datetime(2020, 1, 1, 9))
+    earlier = make_match(result=base.Result.WD, date="2020-01-01T08:00:00")
+    assert [outcome.match for outcome in detector.backfill([later, earlier])] == [earlier, later]
@@ -0,0 +1,58 @@
+from wrestling.validation import build_match, validate_records
+
+
+def _record(**kwargs):
+    labels = kwargs.pop("labels", (("red", "T2"), ("green", "E1")))
+    record = dict(
+        id="abc", event_name="Fun One", event_type="Dual Meet", date="2020-01-01",
+        result="WD", focus_name="Nick Anthony", focus_team="Eagles",
+        opp_name="John Smith", opp_team="Hawks", weight="165",
+        time_series=[
+            dict(time_stamp=f"00:00:{10 + 20 * i:02d}", initiator=initiator,
+                 focus_color="red", period=1, label=tag)
+            for i, (initiator, tag) in enumerate(labels)
+        ],
+    )
+    record.update(kwargs)
+    return record
+
+
+def test_validate_records_collects_errors():
+    unsorted = _record()
+    unsorted["time_series"].reverse()
+    records = [
+        _record(),
+        _record(weight="heavy", event_type="Scrimmage"),
+        _record(labels=(("red", "T2"), ("red", "XX"), ("green", "E1"))),
+        _record(result="WM"),
+        unsorted,
+        _record(result="WT", overtime=True, ruleset="nope"),
+        dict(id=1),
+        "not a record",
+    ]
+    report = validate_records(records)
+    assert (report.total, report.invalid, report.valid) == (8, 7, 1)
+    assert list(report.valid_indices()) == [0]
+    rows = list(report.rows())
+    assert (1, -1, "weight", "invalid_weight", "Invalid weight class.") in rows
+    assert (2, 1, "time_series", "invalid_label", "Invalid time-series label.") in rows
+    assert (3, -1, "result", "result_inconsistent", "Result inconsistent with time-series.") in rows
+    assert (4, 1, "time_series", "unsorted_time_series") in [row[:4] for row in rows]
+    counts = report.counts()
+    assert counts["overtime_tech"] == counts["unknown_ruleset"] == counts["malformed"] == 1
+    assert counts["missing_field"] == 10 and counts["invalid_type"] == 1
+    assert report.to_columns()["index"] == [row[0] for row in rows]
+
+
+def test_validation_agrees_with_match_construction():
+    records = [
+        _record(),
+        _record(weight="heavy"),
+        _record(labels=(("red", "T2"), ("red", "T2"), ("green", "E1"))),
+        _record(result="LD"),
+        _record(ruleset="high school", labels=(("red", "T2"), ("red", "N3"))),
+    ]
+    report = validate_records(records)
+    invalid = set(report.invalid_indices())
+    for index, record in enumerate(records):
+        assert build_match(record).isvalid == (index not in invalid)
@@ -0,0 +1,77 @@
+import random
+from datetime import time
+
+import pytest
+
+from wrestling import base, rulesets, vectorized
+from wrestling.scoring import CollegeScoring
+from wrestling.sequence import isvalid_sequence
+from wrestling.vectorized import encode, validate_batch, validate_matches, validate_series
+
+
+def _series(rng, length):
+    tags = ("T2", "E1", "R2", "N2", "N4", "P1", "BOT", "TOP", "NEU", "XX")
+    return tuple(
+        CollegeScoring(
+            time_stamp=f"00:{i // 60:02d}:{i % 60:02d}",
+            initiator=rng.choice(("red", "green")),
+            focus_color="red",
+            period=1,
+            label=base.CollegeLabel(rng.choice(tags)),
+        )
+        for i in range(0, 10 * length, 10)
+    )
+
+
+def test_batch_matches_isvalid_sequence():
+    rng = random.Random(3)
+    series = [_series(rng, rng.randrange(0, 12)) for _ in range(200)]
+    report = validate_series(series, "college")
+    for row, time_series in enumerate(series):
+        isvalid_sequence("college", time_series)
+        last = len(time_series) - 1
+        # unknown tags are invalid labels anyway, the mask only skips the last event
+        expected = [
+            score.label.isvalid if score.label.tag != "XX" else i == last
+            for i, score in enumerate(time_series)
+        ]
+        assert list(report.valid[row][: len(time_series)]) == expected
+    assert not any(report.unsorted)
+
+
+def test_validate_matches_flags_unsorted(make_match):
+    matches = [make_match(), make_match(level="high school", labels=(("red", "T2"), ("red", "N3")))]
+    report = validate_matches(matches)
+    assert report.series_valid() == [True, True] and report.lengths == [2, 2]
+    rng = random.Random(0)
+    shuffled = list(_series(rng, 3))
+    shuffled.reverse()
+    assert validate_series([shuffled], "college").unsorted == [True]
+
+
+def _timed(*stamps):
+    return tuple(
+        CollegeScoring(time_stamp=stamp, initiator="red", focus_color="red", period=1, label=base.CollegeLabel("T2"))
+        for stamp in stamps
+    )
+
+
+def test_sort_check_uses_exact_time_stamps():
+    backwards = _timed(time(0, 0, 5, 500000), time(0, 0, 5, 200000))
+    forwards = _timed(time(0, 0, 5, 200000), time(0, 0, 5, 500000), time(0, 0, 6))
+    with pytest.raises(ValueError):
+        isvalid_sequence("college", backwards)
+    assert isvalid_sequence("college", forwards)
+    assert validate_series([backwards, forwards], "college").unsorted == [True, False]
+
+
+def test_numpy_path_matches_python(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(5)
+    series = [_series(rng, rng.randrange(0, 12)) for _ in range(100)] + [_timed("00:00:06", "00:00:05.5")]
+    batch = encode(series, rulesets.COLLEGE)
+    fast = validate_batch(batch)
+    monkeypatch.setattr(vectorized, "numpy", None)
+    slow = validate_batch(batch)
+    assert [list(row[:n]) for row, n in zip(fast.valid, fast.lengths)] == slow.valid
+    assert list(fast.unsorted) == slow.unsorted and slow.unsorted[-1]
@@ -8,14 +8,85 @@ in the future.
 
 The only package requirement is attrs.
 
+Submodules and the public names listed in `__all__` are imported on first
+access, so `import wrestling` itself is nearly free.
+
 Important notes:
     Use Mark class when prompted (as validation will utilize the
     Mark class extended functionality.)
 
 """
 
-from .base import Mark, CollegeLabel, HSLabel, Result
-from .events import Event
-from .matches import CollegeMatch, HSMatch
-from .scoring import CollegeScoring, HSScoring
-from .wrestlers import Wrestler
+import importlib
+
+_EXPORTS = {
+    "Mark": "base",
+    "CollegeLabel": "base",
+    "HSLabel": "base",
+    "FreestyleLabel": "base",
+    "GrecoLabel": "base",
+    "Result": "base",
+    "Event": "events",
+    "CollegeMatch": "matches",
+    "HSMatch": "matches",
+    "FreestyleMatch": "matches",
+    "GrecoMatch": "matches",
+    "MatchCollection": "query",
+    "MatchQuery": "query",
+    "Ruleset": "rulesets",
+    "get_ruleset": "rulesets",
+    "register_ruleset": "rulesets",
+    "CollegeScoring": "scoring",
+    "HSScoring": "scoring",
+    "FreestyleScoring": "scoring",
+    "GrecoScoring": "scoring",
+    "Wrestler": "wrestlers",
+}
+"""dict[str, str]: Public names mapped to the submodule that defines them."""
+
+_SUBMODULES = {
+    "audit",
+    "base",
+    "cache",
+    "careers",
+    "cli",
+    "codec",
+    "dedup",
+    "event_index",
+    "events",
+    "instrumentation",
+    "matches",
+    "query",
+    "records",
+    "replay",
+    "repository",
+    "rulesets",
+    "schedule",
+    "scouting",
+    "scoring",
+    "sequence",
+    "storage",
+    "upsets",
+    "validation",
+    "vectorized",
+    "wrestlers",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Imports submodules and public names on first access."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lists loaded and lazily available attributes."""
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
@@ -0,0 +1,7 @@
+"""Runs the `wrestling` command line tool, see `wrestling.cli`."""
+
+import sys
+
+from wrestling.cli import main
+
+sys.exit(main())
@@ -0,0 +1,117 @@
+#! /usr/bin/python
+
+"""Module for auditing archives of Matches.
+
+This module compares every match's entered Result against the Result implied
+by its time series (see `wrestling.matches.infer_result`) and collects the
+inconsistencies into an AuditReport.  The check only reads the ScoreSummary
+every match computes when it is built, so archives are audited in a single
+streaming pass that keeps nothing but the findings in memory.
+
+Example:
+    >>>report = audit_matches(matches)
+    >>>for finding in report.findings:
+    >>>    print(finding.index, finding.recorded.text, finding.expected)
+
+"""
+
+from collections import Counter
+from typing import Iterable, List, Optional
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.matches import Match
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class AuditFinding(object):
+    """One match whose Result contradicts its time series.
+
+    Args:
+        index (int): Position of the match in the audited iterable.
+        id (str): Match id.
+        recorded (Result): Result entered on the match.
+        expected (Optional[Result]): Result implied by the time series.
+        mov (int): Margin of victory from the time series.
+
+    """
+
+    index: int = attr.ib(validator=instance_of(int))
+    id: str = attr.ib(validator=instance_of(str))
+    recorded: base.Result = attr.ib(validator=instance_of(base.Result), repr=lambda x: x.name)
+    expected: Optional[base.Result] = attr.ib(repr=lambda x: x.name if x is not None else None)
+    mov: int = attr.ib(validator=instance_of(int))
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class AuditReport(object):
+    """Result of auditing many matches.
+
+    Args:
+        total (int): Number of matches audited.
+        findings (List[AuditFinding]): Inconsistent matches, in input order.
+
+    """
+
+    total: int = attr.ib(default=0)
+    findings: List[AuditFinding] = attr.ib(factory=list, repr=lambda x: f"{len(x)} findings")
+
+    @property
+    def inconsistent(self) -> int:
+        """Number of inconsistent matches."""
+        return len(self.findings)
+
+    def summary(self) -> Counter:
+        """Counts of inconsistencies by (recorded, expected) Result names.
+
+        Returns:
+            Counter: Keys are (recorded name, expected name) pairs.
+
+        """
+        return Counter(
+            (finding.recorded.name, finding.expected.name if finding.expected else None)
+            for finding in self.findings
+        )
+
+
+def check_match(match: Match, index: int = 0) -> Optional[AuditFinding]:
+    """Audits one match.
+
+    Args:
+        match: Match instance.
+        index: Position reported in the finding.
+
+    Returns:
+        Optional[AuditFinding]: Finding if inconsistent, else None.
+
+    """
+    if match.result_consistent:
+        return None
+    return AuditFinding(
+        index=index,
+        id=match._id,
+        recorded=match.result,
+        expected=match.expected_result,
+        mov=match.mov,
+    )
+
+
+def audit_matches(matches: Iterable[Match]) -> AuditReport:
+    """Audits an archive of matches for Result inconsistencies.
+
+    Args:
+        matches: Match instances, consumed one at a time.
+
+    Returns:
+        AuditReport: Findings in input order.
+
+    """
+    report = AuditReport()
+    for index, match in enumerate(matches):
+        finding = check_match(match, index)
+        if finding is not None:
+            report.findings.append(finding)
+        report.total += 1
+    return report
@@ -4,16 +4,20 @@
 
 This module contains the Years dictionary, Result enumeration class,
 the Mark class which is foundational to all other classes in the project,
-and the CollegeLabel and HSLabel classes inheriting from the Mark class.
+and the Label class (with its CollegeLabel and HSLabel variants) inheriting
+from the Mark class and backed by a Ruleset.
 
 """
 
 import enum
-from typing import Dict, Set, Union
+from datetime import datetime, time
+from typing import Dict, FrozenSet, Mapping, Type, Union
 
 import attr
 from attr.validators import instance_of
 
+from wrestling import rulesets
+
 YEARS = {
     -1: "Unknown",
     0: "K",
@@ -186,8 +190,11 @@ class Mark(object):
 
 
 @attr.s(auto_attribs=True, order=False, eq=False, slots=True)
-class CollegeLabel(Mark):
-    """Label class for College scoring event labels.
+class Label(Mark):
+    """Label class for scoring event labels of a Ruleset.
+
+    Subclasses set the `ruleset` class attribute; see `label_class` to create
+    one for any registered ruleset.
 
     Args:
         point_value: Numeric point value for label, different than tag value.
@@ -195,20 +202,22 @@ class CollegeLabel(Mark):
     """
 
     point_value: int = attr.ib(init=False, repr=False)
+    ruleset = rulesets.COLLEGE
 
     def __attrs_post_init__(self):
         """Post init hook function.
 
         This function checks if the label tag is considered a valid label based
-        on college (folkstyle) ruleset.  If not it adjusts the 'isvalid' and 'msg'
+        on the class ruleset.  If not it adjusts the 'isvalid' and 'msg'
         attributes accordingly.
 
         """
-        if self.tag in self.valid_labels:
-            self.point_value = self.points_dict[self.tag]
+        points = self.ruleset.points
+        if self.tag in points:
+            self.point_value = points[self.tag]
         else:  # invalid tag
             message = (
-                f"Invalid tag for 'College Label'. Expected one of "
+                f"Invalid tag for '{self.ruleset.title} Label'. Expected one of "
                 f"{*self.valid_labels,}, got {self.tag}."
             )
             self.point_value = 0
@@ -216,158 +225,130 @@ class CollegeLabel(Mark):
             self.msg = message
 
     @property
-    def valid_labels(self) -> Set:
-        """Set of valid scoring event labels based on current college ruleset.
+    def valid_labels(self) -> FrozenSet:
+        """Set of valid scoring event labels based on the class ruleset.
 
         Returns:
-            Set: Scoring events.
+            FrozenSet: Scoring events.
         """
-        return {
-            "START",
-            "T2",
-            "E1",
-            "R2",
-            "N2",
-            "N4",
-            "C",
-            "P1",
-            "P2",
-            "WS",
-            "S1",
-            "S2",
-            "RT1",
-            "BOT",
-            "TOP",
-            "NEU",
-            "DEFER",
-            "FALL",
-            "TECH",
-            "FORFEIT",
-            "DEFAULT",
-            "DISQ",
-        }
+        return self.ruleset.labels
 
     @property
-    def points_dict(self) -> Dict:
+    def points_dict(self) -> Mapping:
         """Dictionary of valid scoring event labels and their point values.
 
         Returns:
-            Dict: Dictionary of labels and their corresponding point values.
+            Mapping: Read-only mapping of labels and their corresponding point values.
         """
-        return {
-            "START": 0,
-            "T2": 2,
-            "E1": 1,
-            "R2": 2,
-            "N2": 2,
-            "N4": 4,
-            "C": 0,
-            "P1": 1,
-            "P2": 2,
-            "WS": 0,
-            "S1": 1,
-            "S2": 2,
-            "RT1": 1,
-            "BOT": 0,
-            "TOP": 0,
-            "NEU": 0,
-            "DEFER": 0,
-            "FALL": 0,
-            "TECH": 0,
-            "FORFEIT": 0,
-            "DEFAULT": 0,
-            "DISQ": 0,
-        }
+        return self.ruleset.points
+
+
+@attr.s(auto_attribs=True, order=False, eq=False, slots=True)
+class CollegeLabel(Label):
+    """Label class for College scoring event labels."""
+
+    ruleset = rulesets.COLLEGE
 
 
 @attr.s(auto_attribs=True, order=False, eq=False, slots=True)
-class HSLabel(Mark):
-    """Label class for High School scoring event labels.
+class HSLabel(Label):
+    """Label class for High School scoring event labels."""
+
+    ruleset = rulesets.HIGH_SCHOOL
+
+
+_LABEL_CLASSES: Dict[str, Type[Label]] = {
+    rulesets.COLLEGE.name: CollegeLabel,
+    rulesets.HIGH_SCHOOL.name: HSLabel,
+}
+
+
+def label_class(ruleset: Union[str, rulesets.Ruleset]) -> Type[Label]:
+    """Label class for a registered ruleset, created on first use.
 
     Args:
-        point_value: Numeric point value for label, different than tag value.
+        ruleset: Ruleset or registered ruleset name.
+
+    Returns:
+        Type[Label]: Label subclass bound to the ruleset.
 
     """
+    ruleset = rulesets.get_ruleset(ruleset)
+    if ruleset.name not in _LABEL_CLASSES:
+        name = "".join(part.title() for part in ruleset.name.split()) + "Label"
+        cls = attr.s(auto_attribs=True, order=False, eq=False, slots=True)(
+            type(name, (Label,), {"ruleset": ruleset, "__module__": __name__})
+        )
+        # module level name so instances can be pickled
+        globals()[name] = _LABEL_CLASSES[ruleset.name] = cls
+    return _LABEL_CLASSES[ruleset.name]
 
-    point_value: int = attr.ib(validator=instance_of(int), init=False, repr=False)
 
-    def __attrs_post_init__(self):
-        """Post init hook function.
+def seconds_of(time_stamp: Union[time, str]) -> int:
+    """Whole seconds since midnight of a time stamp.
 
-        This function checks if the label tag is considered a valid label based
-        on high school (folkstyle) ruleset.  If not it adjusts the 'isvalid' and 'msg'
-        attributes accordingly.
+    Args:
+        time_stamp: Time or 'HH:MM:SS' string, fractional seconds are
+            truncated.
 
-        """
-        if self.tag in self.valid_labels:
-            self.point_value = self.points_dict[self.tag]
-        else:  # invalid tag
-            message = (
-                f"Invalid tag for 'High School Label'. Expected one of "
-                f"{*self.valid_labels,}, got {self.tag}."
-            )
-            self.point_value = 0
-            self.isvalid = False
-            self.msg = message
+    Returns:
+        int: Seconds.
 
-    @property
-    def valid_labels(self) -> Set:
-        """Set of valid scoring event labels based on current college ruleset.
+    """
+    hours, minutes, seconds = str(time_stamp).split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
 
-        Returns:
-            Set: Scoring events.
-        """
-        return {
-            "START",
-            "T2",
-            "E1",
-            "R2",
-            "N2",
-            "N3",
-            "C",
-            "P1",
-            "P2",
-            "WS",
-            "S1",
-            "S2",
-            "BOT",
-            "TOP",
-            "NEU",
-            "DEFER",
-            "FALL",
-            "TECH",
-            "FORFEIT",
-            "DEFAULT",
-            "DISQ",
-        }
 
-    @property
-    def points_dict(self) -> Dict:
-        """Dictionary of valid scoring event labels and their point values.
+def microseconds_of(time_stamp: Union[time, str]) -> int:
+    """Exact microseconds since midnight of a time stamp.
 
-        Returns:
-            Dict: Dictionary of labels and their corresponding point values.
-        """
-        return {
-            "START": 0,
-            "T2": 2,
-            "E1": 1,
-            "R2": 2,
-            "N2": 2,
-            "N3": 3,
-            "C": 0,
-            "P1": 1,
-            "P2": 2,
-            "WS": 0,
-            "S1": 1,
-            "S2": 2,
-            "BOT": 0,
-            "TOP": 0,
-            "NEU": 0,
-            "DEFER": 0,
-            "FALL": 0,
-            "TECH": 0,
-            "FORFEIT": 0,
-            "DEFAULT": 0,
-            "DISQ": 0,
-        }
+    Unlike `seconds_of`, time stamps that differ only in fractional seconds
+    keep their order.
+
+    Args:
+        time_stamp: Time or 'HH:MM:SS[.ffffff]' string.
+
+    Returns:
+        int: Microseconds.
+
+    """
+    hours, minutes, seconds = str(time_stamp).split(":")
+    whole, _, fraction = seconds.partition(".")
+    micros = int((fraction + "000000")[:6])
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(whole)) * 1000000 + micros
+
+
+def date_key(date: Union[datetime, str]) -> str:
+    """Sortable key of a match date.
+
+    Datetimes and ISO formatted strings (date only, or with a 'T' or a space
+    before the time) all become 'YYYY-MM-DDTHH:MM:SS', so keys of both kinds
+    sort together.  Other strings are returned unchanged.
+
+    Args:
+        date: Datetime or date string.
+
+    Returns:
+        str: ISO formatted datetime.
+
+    """
+    if isinstance(date, str):
+        try:
+            date = datetime.fromisoformat(date)
+        except ValueError:
+            return date
+    return date.isoformat()
+
+
+_LAZY_CLASSES = {
+    "FreestyleLabel": "freestyle",
+    "GrecoLabel": "greco",
+}
+"""dict[str, str]: Classes for additional rulesets, created by `label_class` on first access."""
+
+
+def __getattr__(name: str):
+    """Creates the classes of additional rulesets on first access."""
+    if name in _LAZY_CLASSES:
+        return label_class(_LAZY_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
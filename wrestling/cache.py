@@ -0,0 +1,285 @@
+#! /usr/bin/python
+
+"""Module for a content-addressed disk cache of validated Matches.
+
+Feeds are re-ingested often and mostly unchanged, so constructing and
+validating every match again is wasted work.  A MatchCache keys each match on
+a hash of its raw input (any JSON-like mapping describing the wrestlers,
+event, result and time series), the callable building it and the layout of
+the pickled classes, and keeps the constructed match as a zlib
+compressed pickle on local disk.  Entries are evicted least recently used
+first once the cache exceeds its size or entry limits; the access order is
+persisted through file modification times, so it survives restarts.
+
+Example:
+    >>>cache = MatchCache("~/.cache/wrestling", max_bytes=64 * 2 ** 20)
+    >>>match = cache.get_or_build(raw, build_match)
+    >>>cache.stats
+    CacheStats(hits=1, misses=0, evictions=0)
+
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Optional
+
+import attr
+from attr.validators import instance_of, optional
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.matches import Match, match_class
+from wrestling.rulesets import registered_rulesets
+from wrestling.scoring import LazyTimeSeries, ScoreSummary, scoring_class
+from wrestling.wrestlers import Wrestler
+
+CACHE_VERSION = 2
+"""int: Serialization version, part of every key so format changes miss."""
+
+_SUFFIX = ".match"
+
+
+@functools.lru_cache(maxsize=None)
+def schema_version() -> str:
+    """Fingerprint of the attribute layout of every pickled class.
+
+    Adding, removing or reordering a field of a match, scoring event, label,
+    wrestler, event or summary class changes the fingerprint, so entries
+    pickled by older code are never read back.  Computed once, for the
+    rulesets registered at the first call.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    classes = [base.Mark, Event, Wrestler, ScoreSummary]
+    for name in sorted(registered_rulesets()):
+        classes += [match_class(name), scoring_class(name), base.label_class(name)]
+    layout = [(cls.__module__, cls.__qualname__, [field.name for field in attr.fields(cls)]) for cls in classes]
+    return hashlib.blake2b(repr(layout).encode(), digest_size=8).hexdigest()
+
+
+def input_key(raw: Mapping[str, Any], build: Optional[Callable] = None) -> str:
+    """Content address of a raw match input.
+
+    The input is serialized as canonical JSON (sorted keys, values without a
+    JSON type rendered with `str`), so equal inputs hash equally regardless
+    of key order.  CACHE_VERSION, `schema_version()` and the qualified name
+    of the build callable are hashed too.
+
+    Args:
+        raw: Raw match input.
+        build: Callable constructing the match from `raw`; lambdas all share
+            the name '<lambda>', so pass named functions.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    payload = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    builder = "" if build is None else f"{build.__module__}.{build.__qualname__}"
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"v{CACHE_VERSION}:{schema_version()}:{builder}:".encode())
+    digest.update(payload.encode())
+    return digest.hexdigest()
+
+
+@attr.s(slots=True, eq=True, order=False, auto_attribs=True)
+class CacheStats(object):
+    """Counters of a MatchCache.
+
+    Args:
+        hits (int): Lookups answered from disk.
+        misses (int): Lookups that had to build the match.
+        evictions (int): Entries removed to respect the limits.
+
+    """
+
+    hits: int = attr.ib(default=0)
+    misses: int = attr.ib(default=0)
+    evictions: int = attr.ib(default=0)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class MatchCache(object):
+    """Content-addressed LRU cache of Matches on local disk.
+
+    Args:
+        directory (str): Cache directory, created if missing.
+        max_bytes (int): Total size limit of the entries, defaults to 256 MiB.
+        max_entries (Optional[int]): Entry count limit, None for no limit.
+        level (int): zlib compression level of the entries.
+
+    Raises:
+        ValueError: `max_bytes` or `max_entries` is less than 1.
+
+    """
+
+    directory: str = attr.ib(converter=lambda x: os.path.expanduser(str(x)))
+    max_bytes: int = attr.ib(default=256 * 2 ** 20, validator=instance_of(int))
+    max_entries: Optional[int] = attr.ib(default=None, validator=optional(instance_of(int)))
+    level: int = attr.ib(default=6, validator=instance_of(int), repr=False)
+    stats: CacheStats = attr.ib(init=False, factory=CacheStats)
+    _sizes: "OrderedDict[str, int]" = attr.ib(init=False, factory=OrderedDict, repr=False)
+    _total: int = attr.ib(init=False, default=0, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to load the index of existing entries."""
+        if self.max_bytes < 1 or (self.max_entries is not None and self.max_entries < 1):
+            raise ValueError(
+                f"`max_bytes` and `max_entries` must be at least 1, "
+                f"got {self.max_bytes} and {self.max_entries}."
+            )
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.name[: -len(_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total += size
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sizes
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the entries on disk."""
+        return self._total
+
+    def path_of(self, key: str) -> str:
+        """File holding an entry.
+
+        Args:
+            key: Content address.
+
+        Returns:
+            str: Entry path, sharded on the first two hex digits.
+
+        """
+        return os.path.join(self.directory, key[:2], key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[Match]:
+        """Looks up a cached match.
+
+        Entries that fail to load for any reason (corrupt, or pickled by
+        incompatible code) are removed and reported as missing.
+
+        Args:
+            key: Content address, see `input_key`.
+
+        Returns:
+            Optional[Match]: The cached match, or None.
+
+        """
+        if key not in self._sizes:
+            return None
+        path = self.path_of(key)
+        try:
+            with open(path, "rb") as file:
+                match = pickle.loads(zlib.decompress(file.read()))
+            os.utime(path)
+        except Exception:
+            self._discard(key)
+            return None
+        self._sizes.move_to_end(key)
+        return match
+
+    def put(self, key: str, match: Match) -> None:
+        """Stores a match, evicting old entries if over the limits.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never see a partial entry.  The loader of a
+        deferred time series cannot be pickled, so such a match is stored
+        with its events loaded (the match itself is left deferred).
+
+        Args:
+            key: Content address, see `input_key`.
+            match: Constructed match.
+
+        """
+        blob = zlib.compress(pickle.dumps(_materialized(match), pickle.HIGHEST_PROTOCOL), self.level)
+        path = self.path_of(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._total += len(blob) - self._sizes.pop(key, 0)
+        self._sizes[key] = len(blob)
+        self._evict()
+
+    def get_or_build(self, raw: Mapping[str, Any], build: Callable[[Mapping[str, Any]], Match]) -> Match:
+        """Cached match for a raw input, building and storing it on a miss.
+
+        Args:
+            raw: Raw match input, hashed with `input_key` along with `build`.
+            build: Callable constructing the match from `raw`.
+
+        Returns:
+            Match: Cached or newly built match.
+
+        """
+        key = input_key(raw, build)
+        match = self.get(key)
+        if match is not None:
+            self.stats.hits += 1
+            return match
+        self.stats.misses += 1
+        match = build(raw)
+        self.put(key, match)
+        return match
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for key in list(self._sizes):
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        self._total -= self._sizes.pop(key, 0)
+        try:
+            os.remove(self.path_of(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        while self._sizes and (
+            self._total > self.max_bytes
+            or (self.max_entries is not None and len(self._sizes) > self.max_entries)
+        ):
+            key = next(iter(self._sizes))
+            self._discard(key)
+            self.stats.evictions += 1
+
+
+def _materialized(match: Match) -> Match:
+    ts = getattr(match, "time_series")
+    if not isinstance(ts, LazyTimeSeries):
+        return match
+    loaded = ts.loaded
+    eager = copy.copy(match)
+    eager.time_series = ts.events
+    eager._summary = ts.summary
+    if not loaded:
+        ts.unload()
+    return eager
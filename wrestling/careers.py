@@ -0,0 +1,285 @@
+#! /usr/bin/python
+
+"""Module for wrestler career timelines and rolling-window statistics.
+
+A CareerTracker consumes matches in date order and keeps, for every wrestler
+(focus and opponent alike), a rolling window of their last `window` matches.
+Window sums are updated in O(1) as matches enter and leave, so the metrics of
+every wrestler are computed in a single streaming pass, and the tracker can
+be kept between runs and updated with only the new week's matches.
+
+Each match also appends a point to the wrestler's career timeline with the
+rolling metrics at that date and the wrestler's `grade_int`.  Reports of the
+same bout from both perspectives should be collapsed first (see
+`wrestling.dedup`), otherwise the bout is counted twice.
+
+Example:
+    >>>tracker = CareerTracker(window=10)
+    >>>tracker.update(season_matches)
+    >>>tracker.stats(wrestler).win_pct
+    0.8
+    >>>tracker.update(this_weeks_matches)
+
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.matches import Match
+from wrestling.wrestlers import Wrestler
+
+# (win, bonus win, points for, points against, takedown differential)
+_Line = Tuple[bool, bool, int, int, int]
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class WindowStats(object):
+    """Metrics over a wrestler's recent matches.
+
+    Args:
+        matches (int): Matches in the window.
+        wins (int): Wins in the window.
+        bonus_wins (int): Wins by major, tech or fall.
+        points_for (int): Points scored.
+        points_against (int): Points allowed.
+        td_diff (int): Takedown differential.
+
+    """
+
+    matches: int = attr.ib(default=0)
+    wins: int = attr.ib(default=0)
+    bonus_wins: int = attr.ib(default=0)
+    points_for: int = attr.ib(default=0)
+    points_against: int = attr.ib(default=0)
+    td_diff: int = attr.ib(default=0)
+
+    @property
+    def win_pct(self) -> float:
+        """Share of matches won."""
+        return self.wins / self.matches if self.matches else 0.0
+
+    @property
+    def bonus_rate(self) -> float:
+        """Share of matches won with bonus."""
+        return self.bonus_wins / self.matches if self.matches else 0.0
+
+    @property
+    def mov(self) -> int:
+        """Total margin of victory."""
+        return self.points_for - self.points_against
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class TimelinePoint(object):
+    """A wrestler's rolling metrics after one match.
+
+    Args:
+        date (Union[str, datetime]): Date of the match.
+        match_id (str): Id of the match.
+        grade_int (int): Wrestler's grade at the match.
+        stats (WindowStats): Rolling metrics including the match.
+
+    """
+
+    date: Union[str, datetime] = attr.ib()
+    match_id: str = attr.ib()
+    grade_int: int = attr.ib()
+    stats: WindowStats = attr.ib()
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class RollingWindow(object):
+    """Last `size` matches of a wrestler with running sums.
+
+    Args:
+        size (int): Maximum number of matches kept.
+
+    """
+
+    size: int = attr.ib(validator=instance_of(int))
+    _lines: Deque[_Line] = attr.ib(init=False, factory=deque, repr=False)
+    _sums: List[int] = attr.ib(init=False, factory=lambda: [0] * 5, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def push(self, line: _Line) -> None:
+        """Adds a match, dropping the oldest one if the window is full.
+
+        Args:
+            line: (win, bonus win, points for, points against, takedown diff).
+
+        """
+        sums = self._sums
+        if len(self._lines) == self.size:
+            for i, value in enumerate(self._lines.popleft()):
+                sums[i] -= value
+        for i, value in enumerate(line):
+            sums[i] += value
+        self._lines.append(line)
+
+    @property
+    def stats(self) -> WindowStats:
+        """Metrics over the window."""
+        wins, bonus_wins, points_for, points_against, td_diff = self._sums
+        return WindowStats(
+            matches=len(self._lines),
+            wins=wins,
+            bonus_wins=bonus_wins,
+            points_for=points_for,
+            points_against=points_against,
+            td_diff=td_diff,
+        )
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class CareerTracker(object):
+    """Streaming per-wrestler rolling statistics and career timelines.
+
+    Wrestlers are identified by name and team (Wrestler equality).
+
+    Args:
+        window (int): Number of recent matches in the rolling window.
+        keep_timeline (bool): Whether to record a TimelinePoint per match.
+
+    Raises:
+        ValueError: `window` is less than 1.
+
+    """
+
+    window: int = attr.ib(default=10, validator=instance_of(int))
+    keep_timeline: bool = attr.ib(default=True, validator=instance_of(bool))
+    processed: int = attr.ib(init=False, default=0)
+    _windows: Dict[Wrestler, RollingWindow] = attr.ib(init=False, factory=dict, repr=False)
+    _timelines: Dict[Wrestler, List[TimelinePoint]] = attr.ib(init=False, factory=dict, repr=False)
+    _grades: Dict[Wrestler, int] = attr.ib(init=False, factory=dict, repr=False)
+    _last_date: Optional[str] = attr.ib(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to check the window size."""
+        if self.window < 1:
+            raise ValueError(f"`window` must be at least 1, got {self.window}.")
+
+    def update(self, matches: Iterable[Match]) -> int:
+        """Adds matches, sorted by date and later than any already added.
+
+        Args:
+            matches: Match (or FlippedMatch) instances sorted by `date`.
+
+        Raises:
+            ValueError: A match is dated before the previous one.
+
+        Returns:
+            int: Number of matches added.
+
+        """
+        added = 0
+        for match in matches:
+            when = base.date_key(match.date)
+            if self._last_date is not None and when < self._last_date:
+                raise ValueError(
+                    f"Matches must be sorted by date, got {when} after {self._last_date}."
+                )
+            self._last_date = when
+            summary = match.score_summary
+            value = match.result.value
+            self._push(
+                match, match.focus,
+                (value > 0, value > 1, summary.focus_pts, summary.opp_pts, summary.td_diff),
+            )
+            self._push(
+                match, match.opponent,
+                (value < 0, value < -1, summary.opp_pts, summary.focus_pts, -summary.td_diff),
+            )
+            added += 1
+        self.processed += added
+        return added
+
+    def _push(self, match: Match, wrestler: Wrestler, line: _Line) -> None:
+        window = self._windows.get(wrestler)
+        if window is None:
+            window = self._windows[wrestler] = RollingWindow(self.window)
+            self._timelines[wrestler] = []
+        window.push(line)
+        if wrestler.grade_int != -1:
+            self._grades[wrestler] = wrestler.grade_int
+        if self.keep_timeline:
+            self._timelines[wrestler].append(
+                TimelinePoint(
+                    date=match.date,
+                    match_id=match._id,
+                    grade_int=self._grades.get(wrestler, -1),
+                    stats=window.stats,
+                )
+            )
+
+    def wrestlers(self) -> Iterator[Wrestler]:
+        """Every wrestler seen, in order of first appearance."""
+        return iter(self._windows)
+
+    def stats(self, wrestler: Wrestler) -> WindowStats:
+        """Current rolling metrics of a wrestler.
+
+        Args:
+            wrestler: Wrestler instance.
+
+        Returns:
+            WindowStats: Metrics over the last `window` matches, empty if the
+            wrestler has not been seen.
+
+        """
+        window = self._windows.get(wrestler)
+        return window.stats if window is not None else WindowStats()
+
+    def snapshot(self) -> Dict[Wrestler, WindowStats]:
+        """Current rolling metrics of every wrestler."""
+        return {wrestler: window.stats for wrestler, window in self._windows.items()}
+
+    def timeline(self, wrestler: Wrestler) -> Tuple[TimelinePoint, ...]:
+        """Career timeline of a wrestler.
+
+        Args:
+            wrestler: Wrestler instance.
+
+        Returns:
+            Tuple[TimelinePoint]: One point per match, in date order.
+
+        """
+        return tuple(self._timelines.get(wrestler, ()))
+
+    def grade_progression(self, wrestler: Wrestler) -> Tuple[Tuple[Union[str, datetime], int], ...]:
+        """Dates at which a wrestler's known grade changed.
+
+        Args:
+            wrestler: Wrestler instance.
+
+        Returns:
+            Tuple: (date, grade_int) pairs, starting with the first known grade.
+
+        """
+        progression = []
+        for point in self._timelines.get(wrestler, ()):
+            if point.grade_int != -1 and (not progression or progression[-1][1] != point.grade_int):
+                progression.append((point.date, point.grade_int))
+        return tuple(progression)
+
+
+def rolling_stats(matches: Iterable[Match], window: int = 10) -> Dict[Wrestler, WindowStats]:
+    """Rolling metrics of every wrestler after a date-sorted set of matches.
+
+    Args:
+        matches: Match instances sorted by `date`.
+        window: Number of recent matches in the rolling window.
+
+    Returns:
+        Dict[Wrestler, WindowStats]: Metrics per wrestler.
+
+    """
+    tracker = CareerTracker(window=window, keep_timeline=False)
+    tracker.update(matches)
+    return tracker.snapshot()
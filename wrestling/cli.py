@@ -0,0 +1,386 @@
+#! /usr/bin/python
+
+"""Module for the `wrestling` command line tool.
+
+Subcommands work on raw match records (see `validation` for the record
+layout) read from JSON lines or CSV files, or on a partitioned store written
+by `ingest`:
+
+* `ingest` validates records and adds the valid matches to a store,
+* `validate` reports every problem in the records without building matches,
+* `stats` computes season totals per focus wrestler,
+* `export` writes match records as CSV, JSON lines or a columnar JSON file.
+
+Inputs are read lazily in chunks of `--chunk-size` records, and
+`--workers N` validates and builds the chunks in N processes, so memory is
+bounded by the chunks in flight (plus the store for `ingest`).  In CSV
+inputs every column is a record field and 'time_series' holds the events as
+a JSON list.  Only the standard library is imported at startup; the rest of
+the package is imported by the subcommand that needs it.
+
+Example:
+    $ wrestling validate season.jsonl --errors 20
+    $ wrestling ingest season.jsonl --store archive --workers 4
+    $ wrestling stats --store archive --output standings.csv
+    $ wrestling export season.csv --format columns --fields focus_name,mov --output mov.json
+
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import nullcontext
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+INPUT_FORMATS = ("jsonl", "csv")
+"""tuple[str]: Formats of record inputs."""
+
+EXPORT_FORMATS = ("csv", "jsonl", "columns")
+"""tuple[str]: Formats written by `export`."""
+
+STATS_FIELDS = (
+    "name", "team", "matches", "wins", "losses", "no_contests", "bonus_wins", "falls",
+    "team_pts", "focus_pts", "opp_pts", "td_diff",
+)
+"""tuple[str]: Columns written by `stats`."""
+
+Chunk = Tuple[int, List[Dict[str, Any]], str]
+
+_TRUE = frozenset(("1", "true", "yes", "y", "t"))
+
+
+def _input_format(path: str, fmt: Optional[str]) -> str:
+    if fmt is not None:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _open_input(path: str):
+    return nullcontext(sys.stdin) if path == "-" else open(path, newline="")
+
+
+def _csv_record(row: Dict[str, str]) -> Dict[str, Any]:
+    record: Dict[str, Any] = {key: value for key, value in row.items() if value not in ("", None)}
+    if "overtime" in record:
+        record["overtime"] = record["overtime"].strip().lower() in _TRUE
+    if "duration" in record:
+        record["duration"] = int(record["duration"])
+    record["time_series"] = json.loads(record.get("time_series", "[]"))
+    return record
+
+
+def read_records(paths: Sequence[str], fmt: Optional[str] = None) -> Iterator[Any]:
+    """Streams raw records from JSON lines or CSV files.
+
+    Lines that are not valid JSON are yielded as None, which validation
+    reports as malformed records.
+
+    Args:
+        paths: File paths, '-' for stdin.
+        fmt: One of INPUT_FORMATS, inferred from each file extension if None.
+
+    Returns:
+        Iterator: Raw records.
+
+    """
+    for path in paths:
+        with _open_input(path) as file:
+            if _input_format(path, fmt) == "csv":
+                for row in csv.DictReader(file):
+                    try:
+                        yield _csv_record(row)
+                    except ValueError:
+                        yield None
+            else:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+
+def _chunks(records: Iterable[Any], chunk_size: int, ruleset: str) -> Iterator[Chunk]:
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk, ruleset
+        start += len(chunk)
+
+
+def _validate_chunk(chunk: Chunk):
+    from wrestling.validation import validate_records
+
+    start, records, ruleset = chunk
+    return start, validate_records(records, ruleset)
+
+
+def _build_chunk(chunk: Chunk):
+    from wrestling.validation import build_match
+
+    start, report = _validate_chunk(chunk)
+    _, records, ruleset = chunk
+    matches = []
+    for index in report.valid_indices():
+        try:
+            matches.append(build_match(records[index], ruleset))
+        except (TypeError, ValueError):
+            report.add(index, "record", "malformed")
+    return start, report, matches
+
+
+def _pool_map(function: Callable, chunks: Iterable[Chunk], workers: int) -> Iterator:
+    if workers == 1:
+        yield from map(function, chunks)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # bounded read ahead keeps memory proportional to the workers
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def _merge(report, start: int, chunk_report) -> None:
+    for index, event, field, code, _ in chunk_report.rows():
+        report.add(start + index, field, code, event)
+    report.total += chunk_report.total
+
+
+def _matches(args) -> Iterator:
+    """Matches of the `--store` or the record inputs of a subcommand."""
+    if args.store:
+        from wrestling.storage.partitioned import PartitionedCollection
+
+        yield from PartitionedCollection.open(args.store)
+        return
+    chunks = _chunks(read_records(args.inputs, args.input_format), args.chunk_size, args.ruleset)
+    for _, _, matches in _pool_map(_build_chunk, chunks, args.workers):
+        yield from matches
+
+
+def _open_output(path: Optional[str]) -> TextIO:
+    return sys.stdout if path in (None, "-") else open(path, "w", newline="")
+
+
+def _close_output(file: TextIO) -> None:
+    if file is not sys.stdout:
+        file.close()
+
+
+def ingest(args) -> int:
+    """Validates records and adds the valid matches to a partitioned store."""
+    from wrestling.storage.partitioned import MANIFEST, PartitionedCollection
+    from wrestling.validation import ValidationReport
+
+    if os.path.exists(os.path.join(args.store, MANIFEST)):
+        store = PartitionedCollection.open(args.store)
+    else:
+        store = PartitionedCollection(granularity=args.granularity, directory=args.store)
+    report = ValidationReport()
+    added = 0
+    chunks = _chunks(read_records(args.inputs, args.input_format), args.chunk_size, args.ruleset)
+    for start, chunk_report, matches in _pool_map(_build_chunk, chunks, args.workers):
+        _merge(report, start, chunk_report)
+        store.extend(matches)
+        added += len(matches)
+    written = store.save()
+    print(
+        f"ingested {added} of {report.total} records into {args.store} "
+        f"({written} partitions written, {report.invalid} records skipped)"
+    )
+    return 0
+
+
+def validate(args) -> int:
+    """Prints a validation summary; exits with 1 if any record is invalid."""
+    from wrestling.validation import ValidationReport
+
+    report = ValidationReport()
+    chunks = _chunks(read_records(args.inputs, args.input_format), args.chunk_size, args.ruleset)
+    for start, chunk_report in _pool_map(_validate_chunk, chunks, args.workers):
+        _merge(report, start, chunk_report)
+    print(f"records: {report.total}, valid: {report.valid}, invalid: {report.invalid}")
+    for code, count in report.counts().most_common():
+        print(f"  {code}: {count}")
+    for index, event, field, code, message in islice(report.rows(), args.errors):
+        location = f"record {index}" if event < 0 else f"record {index} event {event}"
+        print(f"{location}: {field}: {message}")
+    return 1 if report.invalid else 0
+
+
+def stats(args) -> int:
+    """Writes season totals per focus wrestler as CSV."""
+    totals: Dict[Tuple[str, str], List[int]] = {}
+    for match in _matches(args):
+        summary = match.score_summary
+        value = match.result.value
+        row = totals.get((match.focus.name, match.focus.team))
+        if row is None:
+            row = totals[(match.focus.name, match.focus.team)] = [0] * (len(STATS_FIELDS) - 2)
+        row[0] += 1
+        row[1] += value > 0
+        row[2] += value < 0
+        row[3] += value == 0
+        row[4] += value > 1
+        row[5] += value == 4
+        row[6] += match.result.team_points
+        row[7] += summary.focus_pts
+        row[8] += summary.opp_pts
+        row[9] += summary.td_diff
+    file = _open_output(args.output)
+    try:
+        writer = csv.writer(file)
+        writer.writerow(STATS_FIELDS)
+        for (name, team), row in sorted(totals.items()):
+            writer.writerow((name, team, *row))
+    finally:
+        _close_output(file)
+    return 0
+
+
+def _batches(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def export(args) -> int:
+    """Writes match records as CSV, JSON lines or a columnar JSON file."""
+    from wrestling.records import FIELDS, to_records
+
+    fields = tuple(args.fields.split(",")) if args.fields else tuple(FIELDS)
+    unknown = [field for field in fields if field not in FIELDS]
+    if unknown:
+        print(f"unknown fields {*unknown,}, expected any of {*FIELDS,}", file=sys.stderr)
+        return 2
+    batches = _batches(_matches(args), args.chunk_size)
+    if args.format == "columns":
+        _export_columns(batches, fields, args.output)
+        return 0
+    file = _open_output(args.output)
+    try:
+        if args.format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(fields)
+            for batch in batches:
+                writer.writerows(to_records(batch, fields, "tuples"))
+        else:
+            for batch in batches:
+                for row in to_records(batch, fields, "dicts"):
+                    file.write(json.dumps(row, default=str) + "\n")
+    finally:
+        _close_output(file)
+    return 0
+
+
+def _export_columns(batches: Iterable[List], fields: Tuple[str, ...], output: Optional[str]) -> None:
+    from wrestling.records import to_records
+
+    # every column is spooled to its own temporary file, then concatenated
+    directory = tempfile.mkdtemp(prefix="wrestling-export-")
+    try:
+        spools = [open(os.path.join(directory, str(i)), "w+") for i in range(len(fields))]
+        first = True
+        for batch in batches:
+            columns = to_records(batch, fields, "columns")
+            for spool, field in zip(spools, fields):
+                values = json.dumps(columns[field], default=str)[1:-1]
+                if values:
+                    spool.write(values if first else "," + values)
+            first = False
+        file = _open_output(output)
+        try:
+            file.write("{")
+            for i, (spool, field) in enumerate(zip(spools, fields)):
+                file.write(f'{"," if i else ""}{json.dumps(field)}:[')
+                spool.seek(0)
+                shutil.copyfileobj(spool, file)
+                file.write("]")
+            file.write("}\n")
+        finally:
+            _close_output(file)
+        for spool in spools:
+            spool.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser of the `wrestling` command."""
+    parser = argparse.ArgumentParser(prog="wrestling", description="Wrestling match data tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, handler: Callable, help_text: str, store: Optional[str] = "optional"):
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        sub.set_defaults(handler=handler)
+        sub.add_argument("inputs", nargs="*" if store == "optional" else "+", default=[],
+                         help="JSON lines or CSV record files, '-' for stdin")
+        sub.add_argument("--input-format", choices=INPUT_FORMATS, default=None,
+                         help="record format, inferred from the file extension by default")
+        sub.add_argument("--ruleset", default="college", help="ruleset of records without one")
+        sub.add_argument("--workers", type=_positive, default=1, help="worker processes")
+        sub.add_argument("--chunk-size", type=_positive, default=2000, help="records per chunk")
+        if store == "optional":
+            sub.add_argument("--store", default=None, help="read matches from a store instead")
+        elif store == "required":
+            sub.add_argument("--store", required=True, help="store directory")
+        return sub
+
+    sub = add("ingest", ingest, "Validate records and add the valid matches to a store.", store="required")
+    sub.add_argument("--granularity", default="month", choices=("year", "month", "week"),
+                     help="date bucket size of a new store")
+    sub = add("validate", validate, "Report problems in raw records.", store=None)
+    sub.add_argument("--errors", type=int, default=0, help="number of error rows to print")
+    sub = add("stats", stats, "Season totals per focus wrestler as CSV.")
+    sub.add_argument("--output", default=None, help="output file, stdout by default")
+    sub = add("export", export, "Export match records.")
+    sub.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="output format")
+    sub.add_argument("--fields", default=None, help="comma separated fields of `records.FIELDS`")
+    sub.add_argument("--output", default=None, help="output file, stdout by default")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the `wrestling` command.
+
+    Args:
+        argv: Arguments without the program name, defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit status.
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.inputs and not getattr(args, "store", None):
+        parser.error(f"{args.command}: expected input files or --store")
+    return args.handler(args)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#! /usr/bin/python
+
+"""Module for a compact binary codec of time series.
+
+Every scoring event otherwise stores a time string, two color strings and a
+label.  The codec stores a match's events column-wise instead:
+
+* the ruleset name and the focus color once per series,
+* time stamps as unsigned 16 bit deltas in whole seconds,
+* one byte per event holding the ruleset label code (`Ruleset.label_codes`)
+  shifted left, plus a bit set when the opponent initiated the action,
+* periods as (period, run length) pairs.
+
+Labels unknown to the ruleset are escaped and stored as text, so invalid
+series round trip.  Columns are fixed width so they decode with
+`array.frombytes` rather than per value parsing, and the payload can be
+compressed with zlib or lzma.  Decoding yields `scoring_class(ruleset)`
+instances (CollegeScoring, HSScoring...) ready for a Match.
+
+Example:
+    >>>blob = encode_match(match, compression="zlib")
+    >>>same = match_class(match.ruleset)(..., time_series=decode_time_series(blob))
+
+"""
+
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from typing import List, Sequence, Tuple, Union
+
+from wrestling import base, rulesets
+from wrestling.matches import Match
+from wrestling.scoring import ScoringEvent, scoring_class
+
+MAGIC = b"WTS\x01"
+"""bytes: Format marker and version prefixing every blob."""
+
+COMPRESSIONS = ("none", "zlib", "lzma")
+"""tuple[str]: Compression applied to the payload."""
+
+_ESCAPE = 0x7F
+_HEADER = struct.Struct("<BHB")
+_RUN = struct.Struct("<BH")
+_COLORS = ("red", "green")
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_time_series(
+    time_series: Sequence[ScoringEvent],
+    ruleset: Union[str, rulesets.Ruleset],
+    compression: str = "zlib",
+) -> bytes:
+    """Encodes scoring events.
+
+    A leading 'START' event (as on a constructed Match) is skipped.  Time
+    stamps are stored in whole seconds.
+
+    Args:
+        time_series: Scoring events of one match, sorted chronologically.
+        ruleset: Ruleset or registered ruleset name of the events.
+        compression: One of COMPRESSIONS.
+
+    Raises:
+        ValueError: Unknown compression, events with different focus colors,
+            time stamps that do not increase or exceed the 16 bit range, or
+            a series over the format limits: 65535 events, 255 period runs,
+            periods above 255 or escaped labels longer than 255 bytes.
+
+    Returns:
+        bytes: Encoded blob.
+
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Expected `compression` to be one of {*COMPRESSIONS,}, got {compression!r}.")
+    ruleset = rulesets.get_ruleset(ruleset)
+    events = list(time_series)
+    if events and events[0].label.tag == "START":
+        events = events[1:]
+    if len(events) > 0xFFFF:
+        raise ValueError(f"Expected at most 65535 events, got {len(events)}.")
+    focus_color = events[0].focus_color if events else "red"
+    label_codes = ruleset.label_codes
+    deltas, labels = array("H"), array("B")
+    escapes, runs = [], []
+    previous = 0
+    for event in events:
+        if event.focus_color != focus_color:
+            raise ValueError("All events of a time series must have the same `focus_color`.")
+        seconds = base.seconds_of(event.time_stamp)
+        if not 0 <= seconds - previous <= 0xFFFF:
+            raise ValueError(f"Time stamps must increase by at most 65535 seconds, got {event.time_stamp}.")
+        deltas.append(seconds - previous)
+        previous = seconds
+        code = label_codes.get(event.label.tag, _ESCAPE)
+        if code == _ESCAPE:
+            tag = str(event.label.tag).encode()
+            if len(tag) > 0xFF:
+                raise ValueError(f"Escaped labels must be at most 255 bytes, got {len(tag)}.")
+            escapes.append(bytes((len(tag),)) + tag)
+        labels.append(code << 1 | (event.initiator != focus_color))
+        if runs and runs[-1][0] == event.period:
+            runs[-1][1] += 1
+        elif not 0 <= event.period <= 0xFF:
+            raise ValueError(f"Expected `period` to be between 0 and 255, got {event.period}.")
+        else:
+            runs.append([event.period, 1])
+    if len(runs) > 0xFF:
+        raise ValueError(f"Expected at most 255 runs of equal periods, got {len(runs)}.")
+    name = ruleset.name.encode()
+    payload = b"".join(
+        (
+            _HEADER.pack(_COLORS.index(focus_color), len(events), len(name)),
+            name,
+            _little_endian(deltas),
+            labels.tobytes(),
+            b"".join(escapes),
+            bytes((len(runs),)),
+            b"".join(_RUN.pack(period, length) for period, length in runs),
+        )
+    )
+    if compression == "zlib":
+        payload = zlib.compress(payload, 9)
+    elif compression == "lzma":
+        payload = lzma.compress(payload, format=lzma.FORMAT_RAW, filters=[{"id": lzma.FILTER_LZMA2}])
+    return MAGIC + bytes((COMPRESSIONS.index(compression),)) + payload
+
+
+def encode_match(match: Match, compression: str = "zlib") -> bytes:
+    """Encodes the time series of a Match, see `encode_time_series`."""
+    return encode_time_series(match.time_series, match.ruleset, compression)
+
+
+def decode_time_series(blob: bytes) -> Tuple[ScoringEvent, ...]:
+    """Decodes a blob into scoring events of its ruleset.
+
+    Args:
+        blob: Blob from `encode_time_series`.
+
+    Raises:
+        ValueError: Not an encoded time series.
+
+    Returns:
+        Tuple[ScoringEvent]: Unscored events without a 'START' event, as
+        passed to a Match.
+
+    """
+    if blob[:4] != MAGIC or len(blob) < 5 or blob[4] >= len(COMPRESSIONS):
+        raise ValueError("Not an encoded time series.")
+    compression = COMPRESSIONS[blob[4]]
+    payload = blob[5:]
+    if compression == "zlib":
+        payload = zlib.decompress(payload)
+    elif compression == "lzma":
+        payload = lzma.decompress(payload, format=lzma.FORMAT_RAW, filters=[{"id": lzma.FILTER_LZMA2}])
+    color, count, name_length = _HEADER.unpack_from(payload)
+    offset = _HEADER.size
+    ruleset = rulesets.get_ruleset(payload[offset:offset + name_length].decode())
+    offset += name_length
+    deltas = _from_little_endian("H", payload[offset:offset + 2 * count])
+    offset += 2 * count
+    labels = payload[offset:offset + count]
+    offset += count
+    tags = list(ruleset.label_codes)
+    names: List[str] = []
+    for value in labels:
+        if value >> 1 == _ESCAPE:
+            length = payload[offset]
+            names.append(payload[offset + 1:offset + 1 + length].decode())
+            offset += 1 + length
+        else:
+            names.append(tags[value >> 1])
+    periods: List[int] = []
+    for _ in range(payload[offset]):
+        period, length = _RUN.unpack_from(payload, offset + 1)
+        periods += [period] * length
+        offset += _RUN.size
+    scoring_cls, label_cls = scoring_class(ruleset), base.label_class(ruleset)
+    focus_color, other_color = _COLORS[color], _COLORS[1 - color]
+    events = []
+    seconds = 0
+    for delta, value, tag, period in zip(deltas, labels, names, periods):
+        seconds += delta
+        minutes, second = divmod(seconds, 60)
+        events.append(
+            scoring_cls(
+                time_stamp=f"00:{minutes:02d}:{second:02d}",
+                initiator=other_color if value & 1 else focus_color,
+                focus_color=focus_color,
+                period=period,
+                label=label_cls(tag),
+            )
+        )
+    return tuple(events)
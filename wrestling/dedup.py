@@ -0,0 +1,282 @@
+#! /usr/bin/python
+
+"""Module for deduplicating Matches reported from multiple sources.
+
+The same bout is often reported once from each wrestler's perspective (swapped
+focus/opponent, inverted Result, flipped focus_color) and by more than one
+scorer.  This module reduces every match to a perspective independent key
+(wrestlers, date, event, weight), fingerprints its time series, and groups
+matches sharing a key.  Groups are resolved into one representative match
+plus a tuple of conflict codes when the reports disagree.
+
+Keys are hash partitioned so that very large feeds can be processed one
+partition at a time (or one partition per worker).
+
+Example:
+    >>>engine = DedupEngine()
+    >>>engine.extend(matches)
+    >>>unique = list(engine.unique())
+
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.matches import Match
+
+CONFLICT_RESULT = "result"
+"""str: Conflict code, reports disagree on the Result."""
+CONFLICT_SCORING = "scoring"
+"""str: Conflict code, reports disagree on which scoring actions happened."""
+CONFLICT_TIMING = "timing"
+"""str: Conflict code, same scoring actions recorded at different times."""
+
+MatchKey = Tuple[Tuple[str, str], Tuple[str, str], str, str, str]
+
+
+def _day(date) -> str:
+    if isinstance(date, datetime):
+        return date.date().isoformat()
+    return str(date)[:10]
+
+
+def focus_is_first(match: Match) -> bool:
+    """Whether the focus wrestler sorts first in the canonical ordering.
+
+    Args:
+        match: Match instance.
+
+    Returns:
+        bool: True if the focus is the canonical first wrestler.
+
+    """
+    return (match.focus.name, match.focus.team) <= (match.opponent.name, match.opponent.team)
+
+
+def canonical_key(match: Match) -> MatchKey:
+    """Perspective independent identity of a bout.
+
+    Args:
+        match: Match instance.
+
+    Returns:
+        Tuple: ((name, team), (name, team), day, event name, weight), with the
+        wrestlers in sorted order.
+
+    """
+    focus = (match.focus.name, match.focus.team)
+    opponent = (match.opponent.name, match.opponent.team)
+    first, second = (focus, opponent) if focus <= opponent else (opponent, focus)
+    return first, second, _day(match.date), match.event.name, match.weight
+
+
+def canonical_result(match: Match) -> base.Result:
+    """Result from the canonical first wrestler's perspective.
+
+    Args:
+        match: Match instance.
+
+    Returns:
+        Result: The match Result, inverted if the focus sorts second.
+
+    """
+    return match.result if focus_is_first(match) else base.Result(-match.result.value)
+
+
+def _actions(match: Match, with_time: bool) -> List[Tuple]:
+    first = focus_is_first(match)
+    actions = []
+    for score in match.time_series:
+        tag = score.label.tag
+        if tag == "START":
+            continue
+        by_focus = score.focus_color == score.initiator
+        actor = 0 if by_focus == first else 1
+        if with_time:
+            actions.append((str(score.time_stamp), score.period, actor, str(tag)))
+        else:
+            actions.append((actor, str(tag)))
+    return actions
+
+
+def fingerprint(match: Match, fuzzy: bool = False) -> str:
+    """Perspective independent hash of the time series.
+
+    Args:
+        match: Match instance.
+        fuzzy: If True, ignore time stamps and periods and hash only the
+            multiset of (wrestler, action) pairs, so reports from scorers
+            whose clocks disagree still match.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    actions = _actions(match, with_time=not fuzzy)
+    if fuzzy:
+        actions.sort()
+    digest = hashlib.blake2b(digest_size=16)
+    for action in actions:
+        digest.update(repr(action).encode())
+    return digest.hexdigest()
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class DuplicateGroup(object):
+    """All reports of one bout.
+
+    Args:
+        key (Tuple): Canonical key shared by the reports.
+        matches (List[Match]): Reports in insertion order.
+
+    """
+
+    key: MatchKey = attr.ib()
+    matches: List[Match] = attr.ib(factory=list, repr=lambda x: f"{len(x)} reports")
+
+    @property
+    def is_duplicate(self) -> bool:
+        """Whether more than one report exists."""
+        return len(self.matches) > 1
+
+    @property
+    def conflicts(self) -> Tuple[str, ...]:
+        """Conflict codes describing how the reports disagree.
+
+        Returns:
+            Tuple[str]: Empty if every report agrees.
+
+        """
+        if not self.is_duplicate:
+            return ()
+        codes = []
+        if len({canonical_result(match) for match in self.matches}) > 1:
+            codes.append(CONFLICT_RESULT)
+        if len({fingerprint(match, fuzzy=True) for match in self.matches}) > 1:
+            codes.append(CONFLICT_SCORING)
+        elif len({fingerprint(match) for match in self.matches}) > 1:
+            codes.append(CONFLICT_TIMING)
+        return tuple(codes)
+
+    @property
+    def merged(self) -> Match:
+        """Representative report for the bout.
+
+        Valid reports are preferred, then the one with the most scoring
+        events, then the earliest inserted.
+
+        Returns:
+            Match: Representative match.
+
+        """
+        return max(
+            enumerate(self.matches),
+            key=lambda pair: (pair[1].isvalid, len(pair[1].time_series), -pair[0]),
+        )[1]
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class DedupEngine(object):
+    """Hash partitioned duplicate detector.
+
+    Args:
+        partitions (int): Number of hash partitions, defaults to 1.
+
+    """
+
+    partitions: int = attr.ib(default=1, validator=instance_of(int))
+    _groups: List[Dict[MatchKey, DuplicateGroup]] = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to allocate partitions."""
+        if self.partitions < 1:
+            raise ValueError(f"`partitions` must be at least 1, got {self.partitions}.")
+        self._groups = [dict() for _ in range(self.partitions)]
+
+    def partition_of(self, key: MatchKey) -> int:
+        """Partition a canonical key is assigned to.
+
+        Uses a stable digest rather than `hash` so assignments agree across
+        processes.
+
+        Args:
+            key: Canonical key.
+
+        Returns:
+            int: Partition number.
+
+        """
+        if self.partitions == 1:
+            return 0
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") % self.partitions
+
+    def add(self, match: Match) -> DuplicateGroup:
+        """Adds one report.
+
+        Args:
+            match: Match instance.
+
+        Returns:
+            DuplicateGroup: Group the report was added to.
+
+        """
+        key = canonical_key(match)
+        groups = self._groups[self.partition_of(key)]
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = DuplicateGroup(key=key)
+        group.matches.append(match)
+        return group
+
+    def extend(self, matches: Iterable[Match]) -> None:
+        """Adds many reports."""
+        for match in matches:
+            self.add(match)
+
+    def groups(self, partition: Optional[int] = None) -> Iterator[DuplicateGroup]:
+        """Iterates over groups, optionally restricted to one partition.
+
+        Args:
+            partition: Partition number, None for all partitions.
+
+        Returns:
+            Iterator[DuplicateGroup]: Groups in insertion order per partition.
+
+        """
+        partitions = self._groups if partition is None else [self._groups[partition]]
+        for groups in partitions:
+            yield from groups.values()
+
+    def duplicates(self) -> Iterator[DuplicateGroup]:
+        """Groups with more than one report."""
+        return (group for group in self.groups() if group.is_duplicate)
+
+    def conflicts(self) -> Iterator[DuplicateGroup]:
+        """Groups whose reports disagree."""
+        return (group for group in self.duplicates() if group.conflicts)
+
+    def unique(self) -> Iterator[Match]:
+        """One representative match per bout."""
+        return (group.merged for group in self.groups())
+
+
+def dedupe(matches: Iterable[Match], partitions: int = 1) -> List[Match]:
+    """Collapses reports of the same bout into one match.
+
+    Args:
+        matches: Match instances, possibly from several sources.
+        partitions: Number of hash partitions.
+
+    Returns:
+        List[Match]: One representative match per bout.
+
+    """
+    engine = DedupEngine(partitions=partitions)
+    engine.extend(matches)
+    return list(engine.unique())
@@ -0,0 +1,199 @@
+#! /usr/bin/python
+
+"""Module for indexing Matches by interned Events.
+
+Every match carries its own Event instance, so grouping by event otherwise
+means comparing names.  An EventIndex interns events by (name, kind), giving
+each an integer id and one shared Event instance (the first one seen, kept in
+the index; the added matches are never modified), keeps the matches of every
+event, and maintains per-event tallies (bouts by Result method, team points,
+upsets) incrementally as matches are added.  `summary` returns a cached
+EventSummary that is rebuilt from the tallies only after the event changes.
+
+Example:
+    >>>index = EventIndex()
+    >>>index.extend(season_matches)
+    >>>event_id = index.find("Fun One")
+    >>>index.summary(event_id).falls
+    3
+
+"""
+
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import attr
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.matches import Match
+from wrestling.wrestlers import Wrestler
+
+Rating = Callable[[Wrestler], Optional[float]]
+"""Callable returning a wrestler's rating, or None if unrated."""
+
+_METHODS = {1: "decisions", 2: "majors", 3: "techs", 4: "falls"}
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class EventSummary(object):
+    """Totals of one event.
+
+    Args:
+        bouts (int): Matches at the event.
+        decisions (int): Bouts won by decision.
+        majors (int): Bouts won by major decision.
+        techs (int): Bouts won by technical superiority.
+        falls (int): Bouts won by fall.
+        no_contests (int): Bouts without a winner.
+        upsets (int): Bouts won by the lower rated wrestler.
+        team_points (Mapping[str, int]): Team points scored per team.
+
+    """
+
+    bouts: int = attr.ib(default=0)
+    decisions: int = attr.ib(default=0)
+    majors: int = attr.ib(default=0)
+    techs: int = attr.ib(default=0)
+    falls: int = attr.ib(default=0)
+    no_contests: int = attr.ib(default=0)
+    upsets: int = attr.ib(default=0)
+    team_points: Mapping[str, int] = attr.ib(factory=dict, converter=MappingProxyType, repr=False)
+
+    @property
+    def bonus_rate(self) -> float:
+        """Share of decided bouts won with bonus."""
+        decided = self.bouts - self.no_contests
+        return (self.majors + self.techs + self.falls) / decided if decided else 0.0
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class _Tally(object):
+    counts: Dict[str, int] = attr.ib(
+        factory=lambda: dict(bouts=0, decisions=0, majors=0, techs=0, falls=0, no_contests=0, upsets=0)
+    )
+    team_points: Dict[str, int] = attr.ib(factory=dict)
+    summary: Optional[EventSummary] = attr.ib(default=None)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class EventIndex(object):
+    """Interned events with their matches and incremental summaries.
+
+    Args:
+        rating (Optional[Rating]): Rating source used to count upsets, read
+            when a match is added; no upsets are counted without one.
+
+    """
+
+    rating: Optional[Rating] = attr.ib(default=None, repr=False)
+    _ids: Dict[Tuple[str, str], int] = attr.ib(init=False, factory=dict, repr=False)
+    _events: List[Event] = attr.ib(init=False, factory=list, repr=lambda x: f"{len(x)} events")
+    _matches: List[List[Match]] = attr.ib(init=False, factory=list, repr=False)
+    _tallies: List[_Tally] = attr.ib(init=False, factory=list, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> Tuple[Event, ...]:
+        """Interned events, by id."""
+        return tuple(self._events)
+
+    def id_of(self, event: Event) -> int:
+        """Id of an event, interning it if new.
+
+        Args:
+            event: Event instance.
+
+        Returns:
+            int: Event id.
+
+        """
+        key = (event.name, event.kind)
+        event_id = self._ids.get(key)
+        if event_id is None:
+            event_id = self._ids[key] = len(self._events)
+            self._events.append(event)
+            self._matches.append([])
+            self._tallies.append(_Tally())
+        return event_id
+
+    def find(self, name: str, kind: Optional[str] = None) -> Optional[int]:
+        """Id of an event by name.
+
+        Args:
+            name: Event name, as converted by Event (title case).
+            kind: Event type, None to match any.
+
+        Returns:
+            Optional[int]: First matching event id, None if not found.
+
+        """
+        if kind is not None:
+            return self._ids.get((name, kind))
+        for (event_name, _), event_id in self._ids.items():
+            if event_name == name:
+                return event_id
+        return None
+
+    def event(self, event_id: int) -> Event:
+        """Interned event of an id."""
+        return self._events[event_id]
+
+    def matches(self, event_id: int) -> Tuple[Match, ...]:
+        """Matches of an event, in insertion order."""
+        return tuple(self._matches[event_id])
+
+    def add(self, match: Match) -> int:
+        """Adds a match to its event.
+
+        The match is only read, so read-only views (FlippedMatch,
+        FrozenMatch) can be added too.
+
+        Args:
+            match: Match instance or read-only view.
+
+        Returns:
+            int: Id of the match's event.
+
+        """
+        event_id = self.id_of(match.event)
+        self._matches[event_id].append(match)
+        tally = self._tallies[event_id]
+        counts = tally.counts
+        counts["bouts"] += 1
+        value = match.result.value
+        if not value:
+            counts["no_contests"] += 1
+        else:
+            counts[_METHODS[abs(value)]] += 1
+            winner, loser = (match.focus, match.opponent) if value > 0 else (match.opponent, match.focus)
+            points = base.Result(abs(value)).team_points
+            tally.team_points[winner.team] = tally.team_points.get(winner.team, 0) + points
+            if self.rating is not None:
+                winner_rating, loser_rating = self.rating(winner), self.rating(loser)
+                if None not in (winner_rating, loser_rating) and winner_rating < loser_rating:
+                    counts["upsets"] += 1
+        tally.summary = None
+        return event_id
+
+    def extend(self, matches: Iterable[Match]) -> None:
+        """Adds many matches."""
+        for match in matches:
+            self.add(match)
+
+    def summary(self, event_id: int) -> EventSummary:
+        """Totals of an event, cached until a match is added to it.
+
+        Args:
+            event_id: Event id.
+
+        Returns:
+            EventSummary: Event totals.
+
+        """
+        tally = self._tallies[event_id]
+        if tally.summary is None:
+            tally.summary = EventSummary(team_points=dict(tally.team_points), **tally.counts)
+        return tally.summary
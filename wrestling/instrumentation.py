@@ -0,0 +1,234 @@
+#! /usr/bin/python
+
+"""Module for opt-in timing instrumentation of match construction.
+
+When enabled, the construction stages of Labels, Scoring Events and Matches
+(label post init, scoring event init, sequence validation, the score pass,
+validity checks, whole match init) and `Match.to_dict` are wrapped with
+timers that feed per-stage counters and log2 histograms.  Enabling patches
+the classes in place and disabling restores the original functions, so the
+instrumentation costs nothing while it is off.
+
+Classes created after `enable` (e.g. by `match_class` for a new ruleset) are
+instrumented on the next call to `enable`.
+
+Example:
+    >>>with instrumented():
+    >>>    build_matches()
+    >>>print(report())
+
+"""
+
+import functools
+import json
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import attr
+
+from wrestling import base, matches, scoring
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class StageStats(object):
+    """Timing statistics of one stage.
+
+    Args:
+        count (int): Number of timed calls.
+        total_ns (int): Total time in nanoseconds.
+        min_ns (int): Fastest call in nanoseconds.
+        max_ns (int): Slowest call in nanoseconds.
+        buckets (Dict[int, int]): Histogram of calls by power of two of
+            their duration in nanoseconds.
+
+    """
+
+    count: int = attr.ib(default=0)
+    total_ns: int = attr.ib(default=0)
+    min_ns: int = attr.ib(default=0)
+    max_ns: int = attr.ib(default=0)
+    buckets: Dict[int, int] = attr.ib(factory=dict, repr=False)
+
+    def record(self, elapsed: int) -> None:
+        """Adds one timed call.
+
+        Args:
+            elapsed: Duration in nanoseconds.
+
+        """
+        if not self.count or elapsed < self.min_ns:
+            self.min_ns = elapsed
+        if elapsed > self.max_ns:
+            self.max_ns = elapsed
+        self.count += 1
+        self.total_ns += elapsed
+        bucket = elapsed.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean duration in nanoseconds."""
+        return self.total_ns / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict:
+        """Creates a dictionary representation of the statistics.
+
+        Returns:
+            Dict: Counts and timings, histogram keyed by upper bound in ns.
+
+        """
+        return dict(
+            count=self.count,
+            total_ns=self.total_ns,
+            mean_ns=self.mean_ns,
+            min_ns=self.min_ns,
+            max_ns=self.max_ns,
+            histogram={1 << bucket: calls for bucket, calls in sorted(self.buckets.items())},
+        )
+
+
+_STATS: Dict[str, StageStats] = {}
+_PATCHES: List[Tuple[object, str, Callable]] = []
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    yield cls
+    for sub in cls.__subclasses__():
+        yield from _subclasses(sub)
+
+
+def _targets() -> List[Tuple[str, object, str]]:
+    targets = [
+        ("label.post_init", base.Label, "__attrs_post_init__"),
+        ("sequence.isvalid", matches, "isvalid_sequence"),
+        ("match.score_pass", matches.Match, "add_ts_points"),
+        ("match.set_validity", matches.Match, "set_validity"),
+        ("match.to_dict", matches.Match, "to_dict"),
+    ]
+    targets += [
+        ("scoring.init", cls, "__init__")
+        for cls in _subclasses(scoring.ScoringEvent)
+        if "__init__" in vars(cls)
+    ]
+    targets += [
+        ("match.init", cls, "__init__")
+        for cls in _subclasses(matches.Match)
+        if "__init__" in vars(cls)
+    ]
+    return targets
+
+
+def _timed(func: Callable, stats: StageStats) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(perf_counter_ns() - start)
+
+    wrapper.__wrestling_timed__ = True
+    return wrapper
+
+
+def enabled() -> bool:
+    """Whether instrumentation is active."""
+    return bool(_PATCHES)
+
+
+def enable() -> None:
+    """Wraps every construction stage with timers.
+
+    Calling it again instruments classes created since the last call.
+
+    """
+    for stage, owner, name in _targets():
+        func = getattr(owner, name)
+        if getattr(func, "__wrestling_timed__", False):
+            continue
+        stats = _STATS.setdefault(stage, StageStats())
+        _PATCHES.append((owner, name, func))
+        setattr(owner, name, _timed(func, stats))
+
+
+def disable() -> None:
+    """Restores the original, untimed functions."""
+    while _PATCHES:
+        owner, name, func = _PATCHES.pop()
+        setattr(owner, name, func)
+
+
+def reset() -> None:
+    """Clears every collected statistic."""
+    for stats in _STATS.values():
+        stats.count = stats.total_ns = stats.min_ns = stats.max_ns = 0
+        stats.buckets.clear()
+
+
+@contextmanager
+def instrumented():
+    """Context manager enabling instrumentation for its body."""
+    was_enabled = enabled()
+    enable()
+    try:
+        yield _STATS
+    finally:
+        if not was_enabled:
+            disable()
+
+
+@contextmanager
+def stage(name: str):
+    """Times a custom block under `name` while instrumentation is enabled.
+
+    Args:
+        name: Stage name reported in snapshots.
+
+    """
+    if not _PATCHES:
+        yield
+        return
+    stats = _STATS.setdefault(name, StageStats())
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        stats.record(perf_counter_ns() - start)
+
+
+def snapshot() -> Dict[str, Dict]:
+    """In-process copy of the collected metrics.
+
+    Returns:
+        Dict[str, Dict]: Stage names mapped to `StageStats.to_dict()`.
+
+    """
+    return {name: stats.to_dict() for name, stats in sorted(_STATS.items()) if stats.count}
+
+
+def report(fmt: str = "text") -> str:
+    """Exportable report of the collected metrics.
+
+    Args:
+        fmt: 'text' for an aligned table or 'json'.
+
+    Raises:
+        ValueError: Unknown format.
+
+    Returns:
+        str: Rendered report.
+
+    """
+    data = snapshot()
+    if fmt == "json":
+        return json.dumps(data, indent=2)
+    if fmt != "text":
+        raise ValueError(f"Expected `fmt` to be one of 'text' or 'json', got {fmt!r}.")
+    lines = [f"{'stage':<20}{'count':>10}{'total ms':>12}{'mean us':>10}{'max us':>10}"]
+    for name, stats in data.items():
+        lines.append(
+            f"{name:<20}{stats['count']:>10}{stats['total_ns'] / 1e6:>12.3f}"
+            f"{stats['mean_ns'] / 1e3:>10.2f}{stats['max_ns'] / 1e3:>10.2f}"
+        )
+    return "\n".join(lines)
@@ -13,20 +13,132 @@ Example:
 """
 
 from datetime import datetime, time
-from collections import Counter
-from typing import Optional, Dict, Tuple, Union
+from typing import Callable, Optional, Dict, Tuple, Type, Union
 from urllib.parse import quote
 
 import attr
 from attr.validators import instance_of
 
-from wrestling import base
+from wrestling import base, rulesets
 from wrestling.events import Event
-from wrestling.scoring import CollegeScoring, HSScoring
+from wrestling.scoring import (
+    CollegeScoring, FlippedTimeSeries, HSScoring, LazyTimeSeries, ScoreSummary, ScoringEvent,
+    compress_time_series, scoring_class, summarize,
+)
 from wrestling.sequence import isvalid_sequence
 from wrestling.wrestlers import Wrestler
 
 
+def score_pass(
+        time_series: Tuple[ScoringEvent],
+        scoring_cls: Type[ScoringEvent],
+        label_cls: Type[base.Mark],
+) -> Tuple[Tuple[ScoringEvent], ScoreSummary]:
+    """Prepends a 'START' event, sets running scores and summarizes in one pass.
+
+    Args:
+        time_series: Validated scoring events, sorted chronologically.
+        scoring_cls: Scoring class used for the 'START' event.
+        label_cls: Label class used for the 'START' event.
+
+    Returns:
+        Tuple: Scored events, 'START' first, and their ScoreSummary.
+
+    """
+    start = scoring_cls(
+        time_stamp=str(time(hour=0, minute=0, second=0)),
+        initiator='red',
+        focus_color='red',
+        period=1,
+        label=label_cls('START')
+    )
+    scored = (start,) + tuple(time_series)
+    return scored, summarize(scored, scoring_cls.ruleset, assign_scores=True)
+
+
+def score_time_series(
+        time_series: Tuple[ScoringEvent],
+        scoring_cls: Type[ScoringEvent],
+        label_cls: Type[base.Mark],
+) -> Tuple[ScoringEvent]:
+    """Sets running scores on each event and prepends a 'START' event.
+
+    Args:
+        time_series: Validated scoring events, sorted chronologically.
+        scoring_cls: Scoring class used for the 'START' event.
+        label_cls: Label class used for the 'START' event.
+
+    Returns:
+        Tuple: Scored events, 'START' first.
+
+    """
+    return score_pass(time_series, scoring_cls, label_cls)[0]
+
+
+def infer_result(summary: ScoreSummary, ruleset: rulesets.Ruleset) -> Optional[base.Result]:
+    """Infers the focus wrestler's Result from a time series summary.
+
+    Terminal labels decide first ('FALL' and 'TECH' credit their initiator,
+    other terminal labels mean a No Contest), then technical superiority,
+    then the margin against the ruleset's major threshold.  Ties are decided
+    on criteria when the ruleset uses them.
+
+    Args:
+        summary: Summary of the time series.
+        ruleset: Ruleset providing the thresholds.
+
+    Returns:
+        Optional[Result]: Inferred Result, None for undecided ties.
+
+    """
+    mov = summary.focus_pts - summary.opp_pts
+    terminal = summary.terminal
+    if terminal:
+        sign = 1 if terminal[0] == "f" else -1
+        if terminal[1:] == "FALL":
+            return base.Result(4 * sign)
+        if terminal[1:] == "TECH":
+            return base.Result(3 * sign)
+        return base.Result.NC
+    if mov == 0:
+        leader = summary.criteria_leader if ruleset.criteria else ""
+        if not leader:
+            return None
+        return base.Result.WD if leader == "f" else base.Result.LD
+    sign = 1 if mov > 0 else -1
+    if summary.tech_index >= 0:
+        return base.Result(3 * sign)
+    if ruleset.major_margin and abs(mov) >= ruleset.major_margin:
+        return base.Result(2 * sign)
+    return base.Result(sign)
+
+
+def check_result(
+        result: base.Result, summary: ScoreSummary, ruleset: rulesets.Ruleset
+) -> bool:
+    """Checks an entered Result against a time series summary.
+
+    No Contests and time series that do not determine a Result are always
+    consistent, as are falls without a terminal label (a fall can end a
+    match the scorer did not label).
+
+    Args:
+        result: Entered Result.
+        summary: Summary of the time series.
+        ruleset: Ruleset providing the thresholds.
+
+    Returns:
+        bool: False if the Result contradicts the time series.
+
+    """
+    if result == base.Result.NC:
+        return True
+    if result.pin and not summary.terminal:
+        return True
+    expected = infer_result(summary, ruleset)
+    return expected is None or expected == result
+
+
 @attr.s(slots=True, order=True, eq=True, kw_only=True, auto_attribs=True)
 class Match(object):
     """Match base class.
@@ -44,9 +156,13 @@ class Match(object):
         isvalid (bool): Whether the match is valid or has errors.
         invalid_messages (tuple): Tuple of (brief) match error messages, can be empty.
         invalid_count (int): Count of invalid Marks found in the match.
+        duration (Optional[int]): Length of match, defaults to the ruleset duration.
+        time_series (Tuple([ScoringEvent])): sequence of scoring events.
 
     Raises:
         ValueError: Overtime cannot be True if Result method is Tech.
+        TypeError: All items in time_series must be instances of `scoring_cls`.
+        ValueError: time_series must be sorted chronologically.
 
     """
 
@@ -77,10 +193,26 @@ class Match(object):
         init=False, factory=tuple, repr=False, order=False, eq=False
     )
     invalid_count: int = attr.ib(init=False, repr=False, order=False, eq=False)
+    duration: Optional[int] = attr.ib(
+        default=attr.Factory(lambda self: self.ruleset.duration, takes_self=True),
+        validator=instance_of(int),
+    )
+    # auto sorts (based on time)
+    time_series: Union[Tuple[ScoringEvent], LazyTimeSeries] = attr.ib(
+        validator=instance_of((tuple, LazyTimeSeries)),
+        order=False,
+        repr=lambda x: f"{len(x)} actions",
+    )
+    _summary: Optional[ScoreSummary] = attr.ib(
+        init=False, default=None, repr=False, order=False, eq=False
+    )
+    ruleset = rulesets.COLLEGE
+    scoring_cls = CollegeScoring
 
     def __attrs_post_init__(self):
-        """Post init function to call Mark input handlers."""
+        """Post init function to call Mark input handlers and score the time series."""
         self.check_weight_input()
+        self.add_ts_points()
         self.isvalid = self.set_validity()
 
     @overtime.validator
@@ -90,6 +222,29 @@ class Match(object):
             if value:  # if overtime is True
                 raise ValueError(f"Overtime must be false if match resulted in Tech.")
 
+    @time_series.validator
+    def check_time_series(self, attribute, value):
+        """Validates that all time_series are of the correct type and in the correct order."""
+        if isinstance(value, LazyTimeSeries):
+            # validated and scored before it was deferred
+            return
+        scoring_cls = self.scoring_cls
+        if not all(isinstance(event, scoring_cls) for event in value):
+            raise TypeError(
+                f"All of the items in the `time_series` set must be "
+                f"`{scoring_cls.__name__}` objects."
+            )
+        if not isvalid_sequence(self.ruleset, value):
+            raise ValueError(f"Time series sequence appears invalid...")
+
+    def add_ts_points(self):
+        """Adds running scores to the time series and prepends the 'START' event."""
+        if not isinstance(self.time_series, LazyTimeSeries):
+            self.time_series, self._summary = score_pass(
+                self.time_series, self.scoring_cls, base.label_class(self.ruleset)
+            )
+        return True
+
     @property
     def weight(self) -> str:
         """Weight class match contested at.
@@ -127,7 +282,7 @@ class Match(object):
             int: Focus points scored
 
         """
-        return self.calculate_pts("f")
+        return self.score_summary.focus_pts
 
     @property
     def opp_pts(self):
@@ -137,7 +292,7 @@ class Match(object):
             int: Opponent points scored
 
         """
-        return self.calculate_pts("o")
+        return self.score_summary.opp_pts
 
     @property
     def mov(self) -> int:
@@ -157,8 +312,111 @@ class Match(object):
             int: Difference in primary wrestler takedowns and opponent takedowns
 
         """
-        counts = Counter((score.formatted_label for score in self.time_series))
-        return counts.get('fT2', 0) - counts.get('oT2', 0)
+        return self.score_summary.td_diff
+
+    @property
+    def deferred(self) -> bool:
+        """Whether the time series is deferred and not yet loaded.
+
+        Returns:
+            bool: True if summary fields are served without the events.
+
+        """
+        ts = getattr(self, "time_series")
+        return isinstance(ts, LazyTimeSeries) and not ts.loaded
+
+    @property
+    def score_summary(self) -> ScoreSummary:
+        """Point totals of the time series.
+
+        Returns:
+            ScoreSummary: Summary precomputed by the score pass or the deferred series.
+
+        """
+        ts = getattr(self, "time_series")
+        if isinstance(ts, LazyTimeSeries):
+            return ts.summary
+        # matches pickled before the summary slot existed do not have it
+        if getattr(self, "_summary", None) is None:
+            self._summary = ScoreSummary.from_time_series(ts, self.ruleset)
+        return self._summary
+
+    @property
+    def expected_result(self) -> Optional[base.Result]:
+        """Result implied by the time series, see `infer_result`.
+
+        Returns:
+            Optional[Result]: Inferred Result, None if it cannot be inferred.
+
+        """
+        return infer_result(self.score_summary, self.ruleset)
+
+    @property
+    def result_consistent(self) -> bool:
+        """Whether the entered Result agrees with the time series, see `check_result`.
+
+        Returns:
+            bool: False if the Result contradicts the time series.
+
+        """
+        return check_result(self.result, self.score_summary, self.ruleset)
+
+    @property
+    def tech_superiority(self) -> bool:
+        """Whether a wrestler reached the ruleset's technical superiority margin.
+
+        Returns:
+            bool: True if the running scores reached the margin.
+
+        """
+        return self.score_summary.tech_index >= 0
+
+    @property
+    def criteria_winner(self) -> Optional[Wrestler]:
+        """Winner on criteria of a tied match, for rulesets using criteria.
+
+        Returns:
+            Optional[Wrestler]: Focus or opponent, None if the score is not tied,
+            the ruleset has no criteria, or criteria cannot separate them.
+
+        """
+        summary = self.score_summary
+        if not self.ruleset.criteria or summary.focus_pts != summary.opp_pts:
+            return None
+        leader = summary.criteria_leader
+        if not leader:
+            return None
+        return self.focus if leader == "f" else self.opponent
+
+    def defer_time_series(self, loader: Optional[Callable[[], Tuple]] = None) -> None:
+        """Replaces the in-memory time series with a LazyTimeSeries.
+
+        Args:
+            loader: Callable returning the events as stored on this match.
+                Defaults to keeping a compressed blob of the current events.
+
+        """
+        ts = getattr(self, "time_series")
+        if isinstance(ts, LazyTimeSeries):
+            ts.unload()
+            return
+        summary = self.score_summary
+        if loader is None:
+            lazy = LazyTimeSeries.from_blob(compress_time_series(ts), summary)
+        else:
+            lazy = LazyTimeSeries(loader=loader, summary=summary)
+        setattr(self, "time_series", lazy)
+
+    def flipped(self) -> "FlippedMatch":
+        """View of this match from the opponent's perspective.
+
+        The view shares this match's time series and revalidates nothing.
+
+        Returns:
+            FlippedMatch: Mirrored, read-only view.
+
+        """
+        return FlippedMatch(self)
 
     def set_validity(self) -> bool:
         """Identifies instance validity status.
@@ -182,12 +440,15 @@ class Match(object):
         if isinstance(self._weight, base.Mark) and not self._weight.isvalid:
             messages.append("Invalid weight class.")
             status = False
-        if not all((score.label.isvalid for score in getattr(self, "time_series"))):
+        if not self.score_summary.labels_valid:
             messages.append("Invalid time-series label.")
             status = False
         if isinstance(self.event._kind, base.Mark) and not self.event._kind.isvalid:
             messages.append("Invalid event type.")
             status = False
+        if not self.result_consistent:
+            messages.append("Result inconsistent with time-series.")
+            status = False
         self.invalid_messages = tuple(messages)
         self.invalid_count = len(messages)
         return status
@@ -280,67 +541,14 @@ class CollegeMatch(Match):
 
     """
 
-    duration: Optional[int] = attr.ib(default=420, validator=instance_of(int))
-    # auto sorts (based on time)
-    time_series: Tuple[CollegeScoring] = attr.ib(
-        validator=instance_of(Tuple), order=False, repr=lambda x: f"{len(x)} actions"
-    )
-
-    def __attrs_post_init__(self):
-        """Post init function to call Mark input handlers from super-class."""
-        Match.__attrs_post_init__(self)
-        self.add_college_ts_points()
-
-    @time_series.validator
-    def check_time_series(self, attribute, value):
-        """Validates that all time_series are of the correct type and in the correct order."""
-        if not all(isinstance(event, CollegeScoring) for event in value):
-            raise TypeError(
-                f"All of the items in the `time_series` set must be "
-                f"`CollegeScoring` objects."
-            )
-        if not isvalid_sequence("college", value):
-            raise ValueError(f"Time series sequence appears invalid...")
-    
-    def add_college_ts_points(self):
-        for i, score in enumerate(self.time_series):
-            if i == 0:
-                if score.formatted_label.startswith('f'):
-                    self.time_series[i].focus_score = self.time_series[i].label.point_value
-                    self.time_series[i].opp_score = 0
-                elif score.formatted_label.startswith('o'):
-                    self.time_series[i].focus_score = 0
-                    self.time_series[i].opp_score = self.time_series[i].label.point_value
-                continue
-            if score.formatted_label.startswith('f'):
-                self.time_series[i].focus_score = self.time_series[i].label.point_value + \
-                                            self.time_series[i - 1].focus_score
-                self.time_series[i].opp_score = self.time_series[i - 1].opp_score
-            elif score.formatted_label.startswith('o'):
-                self.time_series[i].focus_score = self.time_series[i - 1].focus_score
-                self.time_series[i].opp_score = self.time_series[i].label.point_value + self.time_series[i - 1].opp_score
-            else:
-                raise ValueError(
-                    f"Invalid `formatted_label`, expected startswith = 'o' or 'f', "
-                    f"got {score.formatted_label!r}")
-        ts = list(self.time_series)
-        ts.insert(
-            0,
-            CollegeScoring(
-                time_stamp=str(time(hour=0, minute=0, second=0)),
-                initiator='red',
-                focus_color='red',
-                period=1,
-                label=base.CollegeLabel('START')
-            )
-        )
-        self.time_series = tuple(ts)
-        return True
+    ruleset = rulesets.COLLEGE
+    scoring_cls = CollegeScoring
+    add_college_ts_points = Match.add_ts_points
 
 
 @attr.s(slots=True, order=True, eq=True, kw_only=True, auto_attribs=True)
 class HSMatch(Match):
-    """Match for college ruleset.
+    """Match for high school ruleset.
 
     Args:
         duration (Optional[int]): Length of match, defaults to 360.
@@ -352,59 +560,133 @@ class HSMatch(Match):
 
     """
 
-    duration: Optional[int] = attr.ib(default=360, validator=instance_of(int))
-    # auto sorts (based on time)
-    time_series: Tuple[HSScoring] = attr.ib(
-        order=False, repr=lambda x: f"{len(x)} actions"
-    )
+    ruleset = rulesets.HIGH_SCHOOL
+    scoring_cls = HSScoring
+    add_hs_ts_points = Match.add_ts_points
 
-    def __attrs_post_init__(self):
-        """Post init function to call Mark input handlers from super-class."""
-        Match.__attrs_post_init__(self)
-        self.add_hs_ts_points()
 
-    @time_series.validator
-    def check_time_series(self, attribute, value):
-        """Validates that all time_series are of the correct type and in the correct order."""
-        if not all(isinstance(event, HSScoring) for event in value):
-            raise TypeError(
-                f"All of the items in the `time_series` set must be "
-                f"`HighSchoolScoring` objects."
-            )
-        if not isvalid_sequence("high school", value):
-            raise ValueError(f"Time series sequence appears invalid...")
+_MATCH_CLASSES: Dict[str, Type[Match]] = {
+    rulesets.COLLEGE.name: CollegeMatch,
+    rulesets.HIGH_SCHOOL.name: HSMatch,
+}
 
-    def add_hs_ts_points(self):
-        for i, score in enumerate(self.time_series):
-            if i == 0:
-                if score.formatted_label.startswith('f'):
-                    self.time_series[i].focus_score = self.time_series[i].label.point_value
-                    self.time_series[i].opp_score = 0
-                elif score.formatted_label.startswith('o'):
-                    self.time_series[i].focus_score = 0
-                    self.time_series[i].opp_score = self.time_series[i].label.point_value
-                continue
-            if score.formatted_label.startswith('f'):
-                self.time_series[i].focus_score = self.time_series[i].label.point_value + \
-                                            self.time_series[i - 1].focus_score
-                self.time_series[i].opp_score = self.time_series[i - 1].opp_score
-            elif score.formatted_label.startswith('o'):
-                self.time_series[i].focus_score = self.time_series[i - 1].focus_score
-                self.time_series[i].opp_score = self.time_series[i].label.point_value + self.time_series[i - 1].opp_score
-            else:
-                raise ValueError(
-                    f"Invalid `formatted_label`, expected startswith = 'o' or 'f', "
-                    f"got {score.formatted_label!r}")
-        ts = list(self.time_series)
-        ts.insert(
-            0,
-            HSScoring(
-                time_stamp=str(time(hour=0, minute=0, second=0)),
-                initiator='red',
-                focus_color='red',
-                period=1,
-                label=base.HSLabel('START')
-            )
+
+def match_class(ruleset: Union[str, rulesets.Ruleset]) -> Type[Match]:
+    """Match class for a registered ruleset, created on first use.
+
+    Args:
+        ruleset: Ruleset or registered ruleset name.
+
+    Returns:
+        Type[Match]: Match subclass bound to the ruleset.
+
+    """
+    ruleset = rulesets.get_ruleset(ruleset)
+    if ruleset.name not in _MATCH_CLASSES:
+        name = "".join(part.title() for part in ruleset.name.split()) + "Match"
+        namespace = {
+            "__module__": __name__,
+            "ruleset": ruleset,
+            "scoring_cls": scoring_class(ruleset),
+        }
+        cls = attr.s(slots=True, order=True, eq=True, kw_only=True, auto_attribs=True)(
+            type(name, (Match,), namespace)
         )
-        self.time_series = tuple(ts)
-        return True
+        # module level name so instances can be pickled
+        globals()[name] = _MATCH_CLASSES[ruleset.name] = cls
+    return _MATCH_CLASSES[ruleset.name]
+
+
+_LAZY_CLASSES = {
+    "FreestyleMatch": "freestyle",
+    "GrecoMatch": "greco",
+}
+"""dict[str, str]: Classes for additional rulesets, created by `match_class` on first access."""
+
+
+def __getattr__(name: str):
+    """Creates the classes of additional rulesets on first access."""
+    if name in _LAZY_CLASSES:
+        return match_class(_LAZY_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class FlippedMatch(object):
+    """Read-only view of a Match from the opponent's perspective.
+
+    Focus and opponent, the Result, point totals, running scores and
+    `formatted_label` prefixes are mirrored; every other attribute is read
+    from the source match.
+
+    Args:
+        source (Match): Match being mirrored.
+
+    """
+
+    source: Match = attr.ib(validator=instance_of(Match), repr=lambda x: x.focus.name)
+
+    def __getattr__(self, name):
+        if name == "source":
+            raise AttributeError(name)
+        return getattr(self.source, name)
+
+    @property
+    def focus(self) -> Wrestler:
+        """The source match's opponent."""
+        return self.source.opponent
+
+    @property
+    def opponent(self) -> Wrestler:
+        """The source match's focus."""
+        return self.source.focus
+
+    @property
+    def result(self) -> base.Result:
+        """The source match's Result, inverted."""
+        return base.Result(-self.source.result.value)
+
+    @property
+    def time_series(self) -> Union[FlippedTimeSeries, LazyTimeSeries]:
+        """Mirrored view of the source time series, nothing is copied."""
+        ts = self.source.time_series
+        if isinstance(ts, LazyTimeSeries):
+            return ts.flipped()
+        return FlippedTimeSeries(ts)
+
+    @property
+    def focus_pts(self) -> int:
+        """Number of points the (new) focus wrestler scored."""
+        return self.source.opp_pts
+
+    @property
+    def opp_pts(self) -> int:
+        """Number of points the (new) opponent scored."""
+        return self.source.focus_pts
+
+    @property
+    def mov(self) -> int:
+        """Margin of Victory."""
+        return -self.source.mov
+
+    @property
+    def td_diff(self) -> int:
+        """Takedown differential."""
+        return -self.source.td_diff
+
+    @property
+    def score_summary(self) -> ScoreSummary:
+        """Point totals of the mirrored time series."""
+        return self.source.score_summary.flipped()
+
+    @property
+    def expected_result(self) -> Optional[base.Result]:
+        """Result implied by the mirrored time series, see `infer_result`."""
+        return infer_result(self.score_summary, self.ruleset)
+
+    def flipped(self) -> Match:
+        """The original, unflipped match."""
+        return self.source
+
+    calculate_pts = Match.calculate_pts
+    to_dict = Match.to_dict
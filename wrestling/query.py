@@ -0,0 +1,363 @@
+#! /usr/bin/python
+
+"""Module for querying collections of Matches.
+
+This module provides the MatchCollection class, which keeps a set of column
+indexes over a sequence of matches, and the MatchQuery class, a small chainable
+query builder.  Predicates that have an index (weight, event kind, result,
+bonus, overtime, opponent team, date range) are resolved through index lookups
+and only the remaining predicates are evaluated by scanning the candidates.
+
+Example:
+    >>>matches = MatchCollection(list_of_matches)
+    >>>query = MatchQuery().weight("165").bonus().between(d1, d2)
+    >>>rows = query.run(matches).to_dict()
+
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union,
+)
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.matches import FlippedMatch, Match
+
+
+INDEXED_COLUMNS = dict(
+    weight=lambda match: match.weight,
+    kind=lambda match: match.event.kind,
+    result=lambda match: match.result,
+    bonus=lambda match: match.result.bonus,
+    overtime=lambda match: match.overtime,
+    opponent_team=lambda match: match.opponent.team,
+)
+"""dict[str, Callable]: Columns maintained as hash indexes by MatchCollection."""
+
+
+def _date_bound(bound: Union[str, date, datetime], end: bool) -> str:
+    """Date key of a query bound, a date-only end bound covers the whole day."""
+    if isinstance(bound, str) and len(bound) == 10:
+        bound = date.fromisoformat(bound)
+    if isinstance(bound, date) and not isinstance(bound, datetime):
+        bound = datetime.combine(bound, time.max if end else time.min)
+    return base.date_key(bound)
+
+
+@attr.s(slots=True, auto_attribs=True, eq=False, order=False)
+class MatchCollection(object):
+    """Indexed, append-only collection of matches.
+
+    Indexes are built lazily on first use of a column and are kept up to date
+    by `extend`, so repeated queries never rescan the whole collection.
+
+    Args:
+        matches (Iterable[Match]): Matches to include in the collection.
+
+    """
+
+    _matches: List[Match] = attr.ib(converter=list, factory=list)
+    _indexes: Dict[str, Dict[Any, List[int]]] = attr.ib(init=False, factory=dict, repr=False)
+    _date_keys: Optional[List[str]] = attr.ib(init=False, default=None, repr=False)
+    _date_positions: List[int] = attr.ib(init=False, factory=list, repr=False)
+
+    @_matches.validator
+    def check_matches(self, attribute, value):
+        """Validates that all items are Match instances."""
+        if not all(isinstance(match, (Match, FlippedMatch)) for match in value):
+            raise TypeError(
+                f"All items in a `MatchCollection` must be `Match` or `FlippedMatch` objects."
+            )
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def __iter__(self) -> Iterator[Match]:
+        return iter(self._matches)
+
+    def __getitem__(self, position: int) -> Match:
+        return self._matches[position]
+
+    def extend(self, matches: Iterable[Match]) -> None:
+        """Appends matches and updates every index that has been built.
+
+        Args:
+            matches: Matches to append.
+
+        """
+        start = len(self._matches)
+        new = list(matches)
+        self.check_matches(None, new)
+        self._matches.extend(new)
+        for column, index in self._indexes.items():
+            getter = INDEXED_COLUMNS[column]
+            for offset, match in enumerate(new, start):
+                index[getter(match)].append(offset)
+        if self._date_keys is not None:
+            for offset, match in enumerate(new, start):
+                key = base.date_key(match.date)
+                at = bisect_right(self._date_keys, key)
+                self._date_keys.insert(at, key)
+                self._date_positions.insert(at, offset)
+
+    def copy(self) -> "MatchCollection":
+        """Independent collection of the same matches, with copies of the built indexes.
+
+        Returns:
+            MatchCollection: Copy that can be extended without affecting this one.
+
+        """
+        other = MatchCollection()
+        other._matches = list(self._matches)
+        for column, index in self._indexes.items():
+            other._indexes[column] = defaultdict(list, {key: list(value) for key, value in index.items()})
+        if self._date_keys is not None:
+            other._date_keys = list(self._date_keys)
+            other._date_positions = list(self._date_positions)
+        return other
+
+    def _build_date_index(self) -> None:
+        pairs = sorted(
+            ((base.date_key(match.date), position) for position, match in enumerate(self._matches)),
+            key=lambda pair: pair[0],
+        )
+        self._date_keys = [pair[0] for pair in pairs]
+        self._date_positions = [pair[1] for pair in pairs]
+
+    def index(self, column: str) -> Dict[Any, List[int]]:
+        """Hash index of a column, mapping values to match positions.
+
+        Args:
+            column: One of the keys of INDEXED_COLUMNS.
+
+        Raises:
+            ValueError: Column is not indexed.
+
+        Returns:
+            Dict: Column values mapped to sorted match positions.
+
+        """
+        if column not in INDEXED_COLUMNS:
+            raise ValueError(
+                f"Expected `column` to be one of {*INDEXED_COLUMNS,}, got {column!r}."
+            )
+        if column not in self._indexes:
+            getter = INDEXED_COLUMNS[column]
+            index = defaultdict(list)
+            for position, match in enumerate(self._matches):
+                index[getter(match)].append(position)
+            self._indexes[column] = index
+        return self._indexes[column]
+
+    def date_range(
+        self, start: Optional[Union[str, date, datetime]], end: Optional[Union[str, date, datetime]]
+    ) -> Set[int]:
+        """Positions of matches whose date falls within [start, end].
+
+        Dates and bounds are compared as ISO formatted datetimes, so
+        datetimes and date strings can be mixed; a date-only end bound
+        includes the whole day.
+
+        Args:
+            start: Inclusive lower bound, None for unbounded.
+            end: Inclusive upper bound, None for unbounded.
+
+        Returns:
+            Set[int]: Match positions.
+
+        """
+        if self._date_keys is None:
+            self._build_date_index()
+        keys = self._date_keys
+        lo = 0 if start is None else bisect_left(keys, _date_bound(start, end=False))
+        hi = len(keys) if end is None else bisect_right(keys, _date_bound(end, end=True))
+        return set(self._date_positions[lo:hi])
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class MatchQuery(object):
+    """Chainable, immutable match query.
+
+    Every builder method returns a new query, so partially built queries can
+    be shared and extended safely.
+
+    Args:
+        lookups (Tuple): Indexed (column, allowed values) predicates.
+        dates (Tuple): Inclusive (start, end) date window.
+        filters (Tuple): Plain callables applied to index candidates.
+
+    """
+
+    lookups: Tuple[Tuple[str, frozenset], ...] = attr.ib(default=(), validator=instance_of(tuple))
+    dates: Tuple[Any, Any] = attr.ib(default=(None, None), validator=instance_of(tuple))
+    filters: Tuple[Callable[[Match], bool], ...] = attr.ib(default=(), validator=instance_of(tuple))
+
+    def _lookup(self, column: str, *values) -> "MatchQuery":
+        return attr.evolve(self, lookups=self.lookups + ((column, frozenset(values)),))
+
+    def weight(self, *weights: Union[str, int]) -> "MatchQuery":
+        """Restricts to one or more weight classes."""
+        return self._lookup("weight", *(str(weight) for weight in weights))
+
+    def kind(self, *kinds: str) -> "MatchQuery":
+        """Restricts to event kinds, e.g. 'Dual Meet' or 'Tournament'."""
+        return self._lookup("kind", *kinds)
+
+    def result(self, *results: base.Result) -> "MatchQuery":
+        """Restricts to one or more Results."""
+        return self._lookup("result", *results)
+
+    def bonus(self, value: bool = True) -> "MatchQuery":
+        """Restricts to matches with (or without) bonus Results."""
+        return self._lookup("bonus", value)
+
+    def overtime(self, value: bool = True) -> "MatchQuery":
+        """Restricts to matches that did (or did not) go to overtime."""
+        return self._lookup("overtime", value)
+
+    def opponent_team(self, *teams: str) -> "MatchQuery":
+        """Restricts to matches against one or more teams."""
+        return self._lookup("opponent_team", *(team.title().strip() for team in teams))
+
+    def between(
+        self,
+        start: Optional[Union[str, date, datetime]] = None,
+        end: Optional[Union[str, date, datetime]] = None,
+    ) -> "MatchQuery":
+        """Restricts to an inclusive date window, either bound may be None.
+
+        A date-only end bound (e.g. '2020-01-31') includes the whole day.
+
+        """
+        return attr.evolve(self, dates=(start, end))
+
+    def where(self, predicate: Callable[[Match], bool]) -> "MatchQuery":
+        """Adds an arbitrary predicate, evaluated after index lookups."""
+        return attr.evolve(self, filters=self.filters + (predicate,))
+
+    def candidates(self, collection: MatchCollection) -> List[int]:
+        """Resolves indexed predicates to sorted match positions.
+
+        Args:
+            collection: Collection to query.
+
+        Returns:
+            List[int]: Positions satisfying every indexed predicate.
+
+        """
+        sets = []
+        for column, values in self.lookups:
+            index = collection.index(column)
+            positions = set()
+            for value in values:
+                positions.update(index.get(value, ()))
+            sets.append(positions)
+        if self.dates != (None, None):
+            sets.append(collection.date_range(*self.dates))
+        if not sets:
+            return list(range(len(collection)))
+        # intersect smallest first to keep the working set small
+        sets.sort(key=len)
+        positions = sets[0]
+        for other in sets[1:]:
+            positions = positions & other
+            if not positions:
+                break
+        return sorted(positions)
+
+    def run(self, collection: MatchCollection) -> "ResultSet":
+        """Binds the query to a collection.
+
+        Args:
+            collection: Collection to query.
+
+        Returns:
+            ResultSet: Lazy result set, evaluated on first access.
+
+        """
+        if not isinstance(collection, MatchCollection):
+            collection = MatchCollection(collection)
+        return ResultSet(query=self, collection=collection)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ResultSet(object):
+    """Lazily evaluated result of a MatchQuery.
+
+    Args:
+        query (MatchQuery): Query to evaluate.
+        collection (MatchCollection): Collection to evaluate against.
+
+    """
+
+    query: MatchQuery = attr.ib(validator=instance_of(MatchQuery))
+    collection: MatchCollection = attr.ib(validator=instance_of(MatchCollection), repr=False)
+    _positions: Optional[List[int]] = attr.ib(init=False, default=None, repr=False)
+
+    @property
+    def positions(self) -> List[int]:
+        """Positions in the collection of the matching matches.
+
+        Returns:
+            List[int]: Sorted match positions.
+
+        """
+        if self._positions is None:
+            positions = self.query.candidates(self.collection)
+            if self.query.filters:
+                positions = [
+                    position
+                    for position in positions
+                    if all(check(self.collection[position]) for check in self.query.filters)
+                ]
+            self._positions = positions
+        return self._positions
+
+    def __iter__(self) -> Iterator[Match]:
+        return (self.collection[position] for position in self.positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def count(self) -> int:
+        """Number of matching matches."""
+        return len(self.positions)
+
+    def values(self, field: str) -> List[Any]:
+        """Column of a single attribute or property over the results.
+
+        Args:
+            field: Attribute or property name on Match, e.g. 'mov'.
+
+        Returns:
+            List: Attribute values in collection order.
+
+        """
+        return [getattr(match, field) for match in self]
+
+    def aggregate(self, field: str, func: Callable[[Sequence], Any] = sum) -> Any:
+        """Applies an aggregate function to a column of the results.
+
+        Args:
+            field: Attribute or property name on Match.
+            func: Aggregate over the list of values, defaults to sum.
+
+        Returns:
+            Any: Aggregated value.
+
+        """
+        return func(self.values(field))
+
+    def to_dict(self, **kwargs) -> List[Union[Dict, Tuple]]:
+        """Exports results via Match.to_dict, forwarding keyword arguments.
+
+        Returns:
+            List: One Match.to_dict() value per result.
+
+        """
+        return [match.to_dict(**kwargs) for match in self]
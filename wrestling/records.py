@@ -0,0 +1,110 @@
+#! /usr/bin/python
+
+"""Module for exporting many Matches as records.
+
+`to_records` produces the same values as `Match.to_dict()` for a whole batch
+of matches, computing only the requested fields.  Point totals come from each
+match's ScoreSummary (computed once by the score pass), Result derived values
+come from lookup tables, and rows can be emitted as tuples, dicts, or column
+lists.
+
+Example:
+    >>>rows = to_records(matches, fields=("focus_name", "weight", "mov"))
+    >>>columns = to_records(matches, fmt="columns")
+
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from wrestling import base
+from wrestling.matches import Match
+from wrestling.scoring import ScoreSummary
+
+_TEXT = {result: result.text for result in base.Result}
+_WIN = {result: result.win for result in base.Result}
+_BONUS = {result: result.bonus for result in base.Result}
+_PIN = {result: result.pin for result in base.Result}
+_TEAM_POINTS = {result: result.team_points for result in base.Result}
+
+Getter = Callable[[Match, Optional[ScoreSummary]], Any]
+
+FIELDS: Dict[str, Getter] = dict(
+    focus_name=lambda m, s: m.focus.name,
+    focus_team=lambda m, s: m.focus.team,
+    opp_name=lambda m, s: m.opponent.name,
+    opp_team=lambda m, s: m.opponent.team,
+    weight=lambda m, s: m.weight,
+    event_name=lambda m, s: m.event.name,
+    event_type=lambda m, s: m.event.kind,
+    date=lambda m, s: str(m.date),
+    text_result=lambda m, s: _TEXT[m.result],
+    num_result=lambda m, s: m.result.value,
+    duration=lambda m, s: m.duration,
+    overtime=lambda m, s: m.overtime,
+    video=lambda m, s: m.video_url,
+    win=lambda m, s: _WIN[m.result],
+    bonus=lambda m, s: _BONUS[m.result],
+    pin=lambda m, s: _PIN[m.result],
+    team_pts=lambda m, s: _TEAM_POINTS[m.result],
+    focus_pts=lambda m, s: s.focus_pts,
+    opp_pts=lambda m, s: s.opp_pts,
+    mov=lambda m, s: s.focus_pts - s.opp_pts,
+    td_diff=lambda m, s: s.td_diff,
+)
+"""dict[str, Callable]: Exportable fields, in `Match.to_dict()` order."""
+
+SUMMARY_FIELDS = frozenset(("focus_pts", "opp_pts", "mov", "td_diff"))
+"""frozenset[str]: Fields read from the match's ScoreSummary."""
+
+FORMATS = ("tuples", "dicts", "columns")
+"""tuple[str]: Output formats accepted by `to_records`."""
+
+
+def to_records(
+    matches: Iterable[Match],
+    fields: Optional[Sequence[str]] = None,
+    fmt: str = "tuples",
+) -> Union[List[Tuple], List[Dict[str, Any]], Dict[str, List[Any]]]:
+    """Exports matches as records.
+
+    Args:
+        matches: Match (or FlippedMatch) instances.
+        fields: Field names from FIELDS, defaults to all of them.
+        fmt: 'tuples' (rows ordered like `fields`), 'dicts' (one dict per
+            match, like `Match.to_dict()`), or 'columns' (one list per field).
+
+    Raises:
+        ValueError: Unknown field or format.
+
+    Returns:
+        Union[List[Tuple], List[Dict], Dict[str, List]]: Records in `fmt`.
+
+    """
+    fields = tuple(FIELDS) if fields is None else tuple(fields)
+    unknown = [field for field in fields if field not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields {*unknown,}, expected any of {*FIELDS,}.")
+    if fmt not in FORMATS:
+        raise ValueError(f"Expected `fmt` to be one of {*FORMATS,}, got {fmt!r}.")
+    getters = [FIELDS[field] for field in fields]
+    needs_summary = not SUMMARY_FIELDS.isdisjoint(fields)
+    if fmt == "columns":
+        columns: List[List[Any]] = [[] for _ in fields]
+        appends = [column.append for column in columns]
+        for match in matches:
+            summary = match.score_summary if needs_summary else None
+            for append, getter in zip(appends, getters):
+                append(getter(match, summary))
+        return dict(zip(fields, columns))
+    if needs_summary:
+        rows = [_row(match, getters) for match in matches]
+    else:
+        rows = [tuple([getter(match, None) for getter in getters]) for match in matches]
+    if fmt == "dicts":
+        return [dict(zip(fields, row)) for row in rows]
+    return rows
+
+
+def _row(match: Match, getters: List[Getter]) -> Tuple:
+    summary = match.score_summary
+    return tuple([getter(match, summary) for getter in getters])
@@ -0,0 +1,375 @@
+#! /usr/bin/python
+
+"""Module for event-sourced replay of Matches from scoring action logs.
+
+Scorers write an append-only log of scoring actions, undos and corrections.
+An ActionLog keeps that log, the resulting effective actions in
+chronological order, and snapshots of the match state (position, period and
+scores) every `snapshot_every` actions.  The state at any time stamp is the
+nearest earlier snapshot advanced by the actions after it, so replay costs
+O(actions since the last snapshot) rather than O(match length).  Undos and
+corrections only drop the snapshots after the action they change, which are
+rebuilt on the next replay.
+
+The final log projects to a regular Match of the log's ruleset, validated
+like any other.
+
+Example:
+    >>>log = ActionLog("college", focus_color="red")
+    >>>takedown = log.record("00:00:30", "red", "T2")
+    >>>log.record("00:01:10", "green", "E1")
+    >>>log.undo(takedown)
+    >>>log.state_at("00:01:00").focus_pts
+    0
+
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import attr
+from attr.validators import in_, instance_of, optional
+
+from wrestling import base, rulesets
+from wrestling.matches import Match, match_class
+from wrestling.scoring import scoring_class
+
+OPERATIONS = ("record", "undo", "correct")
+"""tuple[str]: Operations of a log entry."""
+
+_CHANGEABLE = ("time_stamp", "initiator", "period", "tag")
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class ScoringAction(object):
+    """One scoring action as written by a scorer.
+
+    Args:
+        seq (int): Log sequence number identifying the action.
+        time_stamp (str): Time the action occurred, 'HH:MM:SS'.
+        initiator (str): Who initiated the action, red or green.
+        period (int): Period in which the action occurred.
+        tag (str): Label tag of the action, e.g. 'T2'.
+
+    """
+
+    seq: int = attr.ib(validator=instance_of(int))
+    time_stamp: str = attr.ib(converter=str)
+    initiator: str = attr.ib(validator=[instance_of(str), in_(("red", "green"))])
+    period: int = attr.ib(validator=instance_of(int))
+    tag: str = attr.ib(validator=instance_of(str))
+
+    @property
+    def seconds(self) -> int:
+        """Time stamp in seconds."""
+        return base.seconds_of(self.time_stamp)
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class LogEntry(object):
+    """One append-only log entry.
+
+    Args:
+        op (str): 'record', 'undo' or 'correct'.
+        seq (int): Sequence number of the action the entry applies to.
+        action (Optional[ScoringAction]): New action for 'record' and
+            'correct' entries, None for 'undo'.
+
+    """
+
+    op: str = attr.ib(validator=in_(OPERATIONS))
+    seq: int = attr.ib(validator=instance_of(int))
+    action: Optional[ScoringAction] = attr.ib(
+        default=None, validator=optional(instance_of(ScoringAction))
+    )
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class ReplayState(object):
+    """State of a match after a number of effective actions.
+
+    Args:
+        index (int): Number of effective actions applied.
+        time_stamp (str): Time stamp of the last applied action.
+        period (int): Period of the last applied action.
+        position (str): Focus wrestler's position.
+        focus_pts (int): Focus wrestler's points.
+        opp_pts (int): Opponent's points.
+        td_diff (int): Takedown differential.
+
+    """
+
+    index: int = attr.ib(default=0)
+    time_stamp: str = attr.ib(default="00:00:00")
+    period: int = attr.ib(default=1)
+    position: str = attr.ib(default="neutral")
+    focus_pts: int = attr.ib(default=0)
+    opp_pts: int = attr.ib(default=0)
+    td_diff: int = attr.ib(default=0)
+
+    @property
+    def mov(self) -> int:
+        """Margin of Victory at this point."""
+        return self.focus_pts - self.opp_pts
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ActionLog(object):
+    """Event-sourced scoring log of one match.
+
+    Args:
+        ruleset (Ruleset): Ruleset or registered ruleset name.
+        focus_color (str): Color of the focus wrestler, red or green.
+        snapshot_every (int): Effective actions between state snapshots.
+
+    Raises:
+        ValueError: `snapshot_every` is less than 1.
+
+    """
+
+    ruleset: rulesets.Ruleset = attr.ib(converter=rulesets.get_ruleset, repr=lambda x: x.name)
+    focus_color: str = attr.ib(default="red", validator=in_(("red", "green")))
+    snapshot_every: int = attr.ib(default=32, validator=instance_of(int), repr=False)
+    _entries: List[LogEntry] = attr.ib(init=False, factory=list, repr=False)
+    _actions: Dict[int, ScoringAction] = attr.ib(init=False, factory=dict, repr=False)
+    _keys: List[Tuple[int, int]] = attr.ib(init=False, factory=list, repr=False)
+    _snapshots: List[ReplayState] = attr.ib(init=False, repr=False)
+    _next_seq: int = attr.ib(init=False, default=0, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to start from the initial state."""
+        if self.snapshot_every < 1:
+            raise ValueError(f"`snapshot_every` must be at least 1, got {self.snapshot_every}.")
+        self._snapshots = [ReplayState()]
+
+    @classmethod
+    def from_entries(
+        cls, ruleset: Union[str, rulesets.Ruleset], entries: Iterable[LogEntry], **kwargs
+    ) -> "ActionLog":
+        """Rebuilds a log from stored entries.
+
+        Args:
+            ruleset: Ruleset or registered ruleset name.
+            entries: Log entries in the order they were written.
+            **kwargs: Other ActionLog arguments.
+
+        Returns:
+            ActionLog: The rebuilt log.
+
+        """
+        log = cls(ruleset, **kwargs)
+        for entry in entries:
+            log.append(entry)
+        return log
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def entries(self) -> Tuple[LogEntry, ...]:
+        """Every log entry, in the order written."""
+        return tuple(self._entries)
+
+    @property
+    def actions(self) -> Tuple[ScoringAction, ...]:
+        """Effective actions (after undos and corrections), chronologically."""
+        return tuple(self._actions[seq] for _, seq in self._keys)
+
+    def record(
+        self, time_stamp: Union[time, str], initiator: str, tag: str, period: int = 1
+    ) -> int:
+        """Appends a scoring action.
+
+        Args:
+            time_stamp: Time the action occurred.
+            initiator: Who initiated the action, red or green.
+            tag: Label tag of the action.
+            period: Period in which the action occurred.
+
+        Raises:
+            ValueError: Tag is not a label of the ruleset.
+
+        Returns:
+            int: Sequence number of the action, used to undo or correct it.
+
+        """
+        action = ScoringAction(
+            seq=self._next_seq, time_stamp=time_stamp, initiator=initiator, period=period, tag=tag
+        )
+        self.append(LogEntry(op="record", seq=action.seq, action=action))
+        return action.seq
+
+    def undo(self, seq: int) -> None:
+        """Appends an undo of a previous action.
+
+        Args:
+            seq: Sequence number of the action.
+
+        Raises:
+            ValueError: No effective action has that sequence number.
+
+        """
+        self.append(LogEntry(op="undo", seq=seq))
+
+    def correct(self, seq: int, **changes) -> None:
+        """Appends a correction of a previous action.
+
+        Args:
+            seq: Sequence number of the action.
+            **changes: New values among time_stamp, initiator, period and tag.
+
+        Raises:
+            ValueError: No effective action has that sequence number, or an
+                unknown field is changed.
+
+        """
+        unknown = set(changes) - set(_CHANGEABLE)
+        if unknown:
+            raise ValueError(f"Expected changes to any of {*_CHANGEABLE,}, got {*sorted(unknown),}.")
+        action = attr.evolve(self._effective(seq), **changes)
+        self.append(LogEntry(op="correct", seq=seq, action=action))
+
+    def append(self, entry: LogEntry) -> None:
+        """Applies and appends one log entry.
+
+        Args:
+            entry: Log entry.
+
+        Raises:
+            ValueError: Invalid entry for the current log.
+
+        """
+        if entry.op == "record":
+            if entry.seq < self._next_seq:
+                raise ValueError(f"Action {entry.seq} has already been recorded.")
+            self._check_tag(entry.action)
+            self._insert(entry.action)
+            self._next_seq = entry.seq + 1
+        elif entry.op == "undo":
+            self._remove(self._effective(entry.seq))
+        else:
+            self._check_tag(entry.action)
+            self._remove(self._effective(entry.seq))
+            self._insert(attr.evolve(entry.action, seq=entry.seq))
+        self._entries.append(entry)
+
+    def state_at(self, time_stamp: Optional[Union[time, str]] = None) -> ReplayState:
+        """State after every effective action up to a time stamp.
+
+        Args:
+            time_stamp: Inclusive upper bound, None for the end of the log.
+
+        Returns:
+            ReplayState: State at that time.
+
+        """
+        if time_stamp is None:
+            index = len(self._keys)
+        else:
+            index = bisect_right(self._keys, (base.seconds_of(time_stamp), float("inf")))
+        return self._state(index)
+
+    def replay(self) -> Iterator[ReplayState]:
+        """Streams the state after each effective action.
+
+        Returns:
+            Iterator[ReplayState]: One state per action, chronologically.
+
+        """
+        state = self._snapshots[0]
+        for index in range(len(self._keys)):
+            state = self._advance(state, index, index + 1)
+            yield state
+
+    def to_match(self, **kwargs) -> Match:
+        """Projects the effective actions to a Match of the log's ruleset.
+
+        Args:
+            **kwargs: Match arguments other than `time_series` (id, event,
+                date, result, focus, opponent, weight...).
+
+        Returns:
+            Match: e.g. CollegeMatch or HSMatch instance.
+
+        """
+        scoring_cls, label_cls = scoring_class(self.ruleset), base.label_class(self.ruleset)
+        time_series = tuple(
+            scoring_cls(
+                time_stamp=action.time_stamp,
+                initiator=action.initiator,
+                focus_color=self.focus_color,
+                period=action.period,
+                label=label_cls(action.tag),
+            )
+            for action in self.actions
+        )
+        return match_class(self.ruleset)(time_series=time_series, **kwargs)
+
+    def _check_tag(self, action: ScoringAction) -> None:
+        if action.tag not in self.ruleset.labels:
+            raise ValueError(
+                f"Expected `tag` to be one of {*sorted(self.ruleset.labels),}, got {action.tag!r}."
+            )
+
+    def _effective(self, seq: int) -> ScoringAction:
+        action = self._actions.get(seq)
+        if action is None:
+            raise ValueError(f"No effective action with sequence number {seq}.")
+        return action
+
+    def _insert(self, action: ScoringAction) -> None:
+        key = (action.seconds, action.seq)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._actions[action.seq] = action
+        self._invalidate(index)
+
+    def _remove(self, action: ScoringAction) -> None:
+        index = bisect_left(self._keys, (action.seconds, action.seq))
+        del self._keys[index]
+        del self._actions[action.seq]
+        self._invalidate(index)
+
+    def _invalidate(self, index: int) -> None:
+        # snapshot k covers the first k * snapshot_every actions
+        del self._snapshots[index // self.snapshot_every + 1:]
+
+    def _state(self, index: int) -> ReplayState:
+        every = self.snapshot_every
+        snapshot = index // every
+        while len(self._snapshots) <= snapshot:
+            built = len(self._snapshots)
+            self._snapshots.append(
+                self._advance(self._snapshots[-1], (built - 1) * every, built * every)
+            )
+        return self._advance(self._snapshots[snapshot], snapshot * every, index)
+
+    def _advance(self, state: ReplayState, start: int, stop: int) -> ReplayState:
+        if start >= stop:
+            return state
+        points, next_position = self.ruleset.points, self.ruleset.next_position
+        position, focus_pts, opp_pts, td_diff = (
+            state.position, state.focus_pts, state.opp_pts, state.td_diff
+        )
+        action = None
+        for _, seq in self._keys[start:stop]:
+            action = self._actions[seq]
+            tag = action.tag
+            if action.initiator == self.focus_color:
+                focus_pts += points[tag]
+                td_diff += tag == "T2"
+                position = next_position(position, f"f{tag}")
+            else:
+                opp_pts += points[tag]
+                td_diff -= tag == "T2"
+                position = next_position(position, f"o{tag}")
+        return ReplayState(
+            index=stop,
+            time_stamp=action.time_stamp,
+            period=action.period,
+            position=position,
+            focus_pts=focus_pts,
+            opp_pts=opp_pts,
+            td_diff=td_diff,
+        )
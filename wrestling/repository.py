@@ -0,0 +1,267 @@
+#! /usr/bin/python
+
+"""Module for a thread-safe, read-optimized repository of Matches.
+
+Matches are mutated while they are built (running scores are added to the
+time series, Marks and Labels flip `isvalid`) and cache their ScoreSummary on
+first use, so handing the same instances to many threads is unsafe.  A
+MatchRepository seals every match it stores (finishes all lazy work) and
+publishes its contents as an immutable Snapshot: a tuple of matches, an id
+lookup and a fully indexed MatchCollection.  Readers take the current
+snapshot without any lock and never see it change; writers serialize on a
+lock, build a new snapshot (copy-on-write) and swap it in with a single
+assignment.  Matches are handed out as FrozenMatch views, which refuse
+attribute assignment and the methods that mutate a match.  Only the match
+itself is guarded: its wrestlers, event and scoring events are the stored,
+mutable objects, shared by every reader, and must not be modified.
+
+Example:
+    >>>repository = MatchRepository(season_matches)
+    >>>repository.get("2020-165-001").focus.name  # any thread
+    'Nick Anthony'
+    >>>snapshot = repository.snapshot()  # consistent view across several reads
+    >>>wins = snapshot.query(MatchQuery().weight(165).result(Result.WF))
+    >>>repository.put(corrected_matches)  # readers holding `snapshot` are unaffected
+
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import attr
+from attr.validators import instance_of
+
+from wrestling.matches import Match
+from wrestling.query import INDEXED_COLUMNS, MatchCollection, MatchQuery
+from wrestling.scoring import LazyTimeSeries
+
+_MUTATORS = frozenset(("add_ts_points", "check_weight_input", "defer_time_series"))
+
+
+@attr.s(slots=True, frozen=True, eq=False, order=False, auto_attribs=True)
+class FrozenMatch(object):
+    """Read-only view of a sealed Match.
+
+    Attributes and properties are read from the source match; assigning to
+    the view or calling a mutating method raises.  Nested objects (wrestlers,
+    events, scoring events) are not frozen: they are shared between readers
+    and must be treated as read-only by convention.
+
+    Args:
+        source (Match): Sealed match.
+
+    """
+
+    source: Match = attr.ib(validator=instance_of(Match), repr=lambda x: x.focus.name)
+
+    def __getattr__(self, name):
+        if name == "source":
+            raise AttributeError(name)
+        if name in _MUTATORS:
+            raise AttributeError(f"`{name}` mutates the match and is not available on a `FrozenMatch`.")
+        return getattr(self.source, name)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenMatch):
+            other = other.source
+        return self.source == other
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = object.__hash__
+
+
+def seal(match: Match) -> Match:
+    """Finishes the lazy work of a match so that reading it never writes.
+
+    The score summary is computed and a deferred time series is loaded; it
+    stays loaded as long as nobody calls its `unload` method.
+
+    Args:
+        match: Match instance.
+
+    Returns:
+        Match: The same match.
+
+    """
+    match.score_summary
+    ts = getattr(match, "time_series")
+    if isinstance(ts, LazyTimeSeries):
+        ts.events
+    return match
+
+
+@attr.s(slots=True, frozen=True, eq=False, order=False, auto_attribs=True)
+class Snapshot(object):
+    """Immutable contents of a repository at one version.
+
+    Args:
+        version (int): Number of writes before this snapshot.
+        matches (Tuple[FrozenMatch]): Matches, in insertion order.
+        positions (Mapping[str, int]): Match ids mapped to positions.
+        collection (MatchCollection): Sealed matches with every index built.
+
+    """
+
+    version: int = attr.ib()
+    matches: Tuple[FrozenMatch, ...] = attr.ib(repr=lambda x: f"{len(x)} matches")
+    positions: Mapping[str, int] = attr.ib(converter=MappingProxyType, repr=False)
+    collection: MatchCollection = attr.ib(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def __iter__(self) -> Iterator[FrozenMatch]:
+        return iter(self.matches)
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self.positions
+
+    def get(self, match_id: str) -> Optional[FrozenMatch]:
+        """Match by id, None if not stored."""
+        position = self.positions.get(match_id)
+        return None if position is None else self.matches[position]
+
+    def query(self, query: MatchQuery) -> List[FrozenMatch]:
+        """Runs a query against the prebuilt indexes.
+
+        Args:
+            query: Match query; its `where` predicates receive the sealed
+                matches and must not modify them.
+
+        Returns:
+            List[FrozenMatch]: Matching matches, in insertion order.
+
+        """
+        return [self.matches[position] for position in query.run(self.collection).positions]
+
+
+def _build_snapshot(version: int, matches: List[Match], base: Optional[MatchCollection] = None) -> Snapshot:
+    if base is None:
+        collection = MatchCollection(matches)
+    else:
+        collection = base.copy()
+        collection.extend(matches[len(base):])
+    # build every index up front, readers must never write to the collection
+    for column in INDEXED_COLUMNS:
+        collection.index(column)
+    collection.date_range(None, None)
+    return Snapshot(
+        version=version,
+        matches=tuple(FrozenMatch(match) for match in matches),
+        positions={match._id: position for position, match in enumerate(matches)},
+        collection=collection,
+    )
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class MatchRepository(object):
+    """Shared store of matches with lock-free reads and copy-on-write writes.
+
+    Every read goes through the current Snapshot, so a single call is always
+    consistent; take a `snapshot()` to make several reads consistent with
+    each other.  Writes cost time linear in the size of the repository, so
+    batch them (`put` takes many matches).
+
+    Args:
+        matches (Iterable[Match]): Initial matches.
+
+    Raises:
+        TypeError: Items must be Match instances.
+
+    """
+
+    _matches: Iterable[Match] = attr.ib(factory=tuple, repr=False)
+    _snapshot: Snapshot = attr.ib(init=False, repr=lambda x: f"{len(x)} matches, version {x.version}")
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False)
+
+    def __attrs_post_init__(self):
+        """Seals the initial matches and publishes the first snapshot."""
+        self._snapshot = _build_snapshot(0, [seal(match) for match in _unique(self._matches)])
+        # the snapshot is the only copy kept
+        self._matches = ()
+
+    def snapshot(self) -> Snapshot:
+        """Current contents, unaffected by later writes."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Number of writes so far."""
+        return self._snapshot.version
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __iter__(self) -> Iterator[FrozenMatch]:
+        return iter(self._snapshot)
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._snapshot
+
+    def get(self, match_id: str) -> Optional[FrozenMatch]:
+        """Match by id, None if not stored."""
+        return self._snapshot.get(match_id)
+
+    def query(self, query: MatchQuery) -> List[FrozenMatch]:
+        """Runs a query against the current snapshot, see `Snapshot.query`."""
+        return self._snapshot.query(query)
+
+    def put(self, matches: Iterable[Match]) -> Snapshot:
+        """Adds matches, replacing stored matches with the same id.
+
+        The matches are sealed and must not be modified afterwards.
+
+        Args:
+            matches: Match instances.
+
+        Raises:
+            TypeError: Items must be Match instances.
+
+        Returns:
+            Snapshot: The published snapshot.
+
+        """
+        new = [seal(match) for match in _unique(matches)]
+        with self._lock:
+            current = self._snapshot
+            stored = [match.source for match in current.matches]
+            appended = []
+            for match in new:
+                position = current.positions.get(match._id)
+                if position is None:
+                    appended.append(match)
+                else:
+                    stored[position] = match
+            # indexes can be copied and extended unless a stored match changed
+            base = current.collection if len(appended) == len(new) else None
+            self._snapshot = _build_snapshot(current.version + 1, stored + appended, base)
+            return self._snapshot
+
+    def remove(self, match_ids: Iterable[str]) -> Snapshot:
+        """Removes matches by id, ignoring ids that are not stored.
+
+        Args:
+            match_ids: Match ids.
+
+        Returns:
+            Snapshot: The published snapshot.
+
+        """
+        match_ids = set(match_ids)
+        with self._lock:
+            current = self._snapshot
+            kept = [match.source for match in current.matches if match._id not in match_ids]
+            self._snapshot = _build_snapshot(current.version + 1, kept)
+            return self._snapshot
+
+
+def _unique(matches: Iterable[Match]) -> List[Match]:
+    latest = {}
+    for match in matches:
+        if not isinstance(match, Match):
+            raise TypeError(f"Expected `Match` objects, got {type(match).__name__}.")
+        latest[match._id] = match
+    return list(latest.values())
@@ -0,0 +1,326 @@
+#! /usr/bin/python
+
+"""Module for wrestling rulesets.
+
+A Ruleset describes one style of wrestling as data: its scoring labels and
+their point values, which labels are valid in each position and how they move
+wrestlers between positions, the match duration and the period structure.
+Rulesets are compiled once into lookup tables that labels, scoring events,
+sequence validation and matches share, and are kept in a registry so new
+styles can be added without new classes.
+
+Example:
+    >>>college = get_ruleset("college")
+    >>>college.points["T2"]
+    2
+
+"""
+
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union
+
+import attr
+from attr.validators import instance_of
+
+POSITIONS = ("neutral", "top", "bottom")
+"""tuple[str]: Positions, from the focus wrestler's perspective."""
+
+
+@attr.s(slots=True, frozen=True, eq=False, auto_attribs=True)
+class Ruleset(object):
+    """Compiled ruleset for one style of wrestling.
+
+    Args:
+        name (str): Registry name, e.g. 'college'.
+        title (str): Display name, e.g. 'College'.
+        points (Mapping[str, int]): Label tags and their point values.
+        always (Tuple[str]): Formatted labels valid in every position.
+        position_moves (Mapping[str, Tuple[str]]): Formatted labels valid only
+            in a given position.
+        transitions (Mapping[str, Mapping[str, str]]): Formatted labels that
+            move the focus wrestler from a position to another.
+        duration (int): Regulation match length in seconds.
+        periods (Tuple[int]): Regulation period lengths in seconds.
+        tech_margin (Optional[int]): Lead ending the match by technical
+            superiority, None if the style has none.
+        caution_labels (FrozenSet[str]): Label tags that are cautions; their
+            points go to the initiator and the caution to the other wrestler.
+        criteria (bool): Whether ties are broken on criteria.
+        major_margin (Optional[int]): Lead at which a decision becomes a
+            major decision, None if the style has none.
+        terminal_labels (FrozenSet[str]): Label tags that end the match.
+
+    """
+
+    name: str = attr.ib(validator=instance_of(str))
+    title: str = attr.ib(validator=instance_of(str))
+    points: Mapping[str, int] = attr.ib(converter=lambda x: MappingProxyType(dict(x)), repr=False)
+    always: FrozenSet[str] = attr.ib(converter=frozenset, repr=False)
+    position_moves: Mapping[str, FrozenSet[str]] = attr.ib(
+        converter=lambda x: MappingProxyType({k: frozenset(v) for k, v in x.items()}), repr=False
+    )
+    transitions: Mapping[str, Mapping[str, str]] = attr.ib(
+        converter=lambda x: MappingProxyType({k: MappingProxyType(dict(v)) for k, v in x.items()}),
+        repr=False,
+    )
+    duration: int = attr.ib(validator=instance_of(int))
+    periods: Tuple[int, ...] = attr.ib(converter=tuple, repr=False)
+    tech_margin: Optional[int] = attr.ib(default=None, repr=False)
+    caution_labels: FrozenSet[str] = attr.ib(default=(), converter=frozenset, repr=False)
+    criteria: bool = attr.ib(default=False, validator=instance_of(bool), repr=False)
+    major_margin: Optional[int] = attr.ib(default=None, repr=False)
+    terminal_labels: FrozenSet[str] = attr.ib(
+        default=("FALL", "TECH", "FORFEIT", "DEFAULT", "DISQ"), converter=frozenset, repr=False
+    )
+    # compiled tables
+    labels: FrozenSet[str] = attr.ib(init=False, repr=False)
+    moves: Mapping[str, FrozenSet[str]] = attr.ib(init=False, repr=False)
+    label_codes: Mapping[str, int] = attr.ib(init=False, repr=False)
+    period_starts: Tuple[int, ...] = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to compile the lookup tables."""
+        for position in POSITIONS:
+            if position not in self.position_moves or position not in self.transitions:
+                raise ValueError(
+                    f"Ruleset {self.name!r} must define moves and transitions for "
+                    f"every position in {*POSITIONS,}."
+                )
+        object.__setattr__(self, "labels", frozenset(self.points))
+        object.__setattr__(
+            self,
+            "moves",
+            MappingProxyType(
+                {
+                    # moves of labels the style does not score (e.g. riding time) are dropped
+                    position: frozenset(
+                        label
+                        for label in self.always | self.position_moves[position]
+                        if label[1:] in self.points
+                    )
+                    for position in POSITIONS
+                }
+            ),
+        )
+        object.__setattr__(
+            self, "label_codes", MappingProxyType({tag: code for code, tag in enumerate(self.points)})
+        )
+        starts, elapsed = [], 0
+        for length in self.periods:
+            starts.append(elapsed)
+            elapsed += length
+        object.__setattr__(self, "period_starts", tuple(starts))
+
+    @property
+    def sequences(self) -> Dict[str, set]:
+        """Valid next moves per position, in the legacy `*_SEQUENCES` layout.
+
+        Returns:
+            Dict[str, set]: Moves per position plus the 'always' moves.
+
+        """
+        sequences = {position: set(self.moves[position]) for position in POSITIONS}
+        sequences["always"] = {label for label in self.always if label[1:] in self.points}
+        return sequences
+
+    def next_position(self, position: str, formatted_label: str) -> str:
+        """Position after a formatted label is applied.
+
+        Args:
+            position: Current position.
+            formatted_label: Label with focus (f) or opponent (o) prefix.
+
+        Returns:
+            str: Next position.
+
+        """
+        return self.transitions[position].get(formatted_label, position)
+
+
+_ALWAYS = (
+    "fBOT", "fTOP", "fNEU", "fDEFER", "oBOT", "oTOP", "oNEU", "oDEFER",
+    "fC", "fP1", "fP2", "fWS", "fS1", "fS2", "oC", "oP1", "oP2", "oWS", "oS1", "oS2",
+    "fRT1", "oRT1",
+)
+
+_FOLKSTYLE_TRANSITIONS = dict(
+    neutral=dict(fT2="top", oBOT="top", fTOP="top", oT2="bottom", fBOT="bottom", oTOP="bottom"),
+    top=dict(oE1="neutral", fNEU="neutral", oNEU="neutral", oR2="bottom", fBOT="bottom", oTOP="bottom"),
+    bottom=dict(fE1="neutral", fNEU="neutral", oNEU="neutral", fR2="top", oBOT="top", fTOP="top"),
+)
+
+_FOLKSTYLE_POINTS = dict(
+    START=0, T2=2, E1=1, R2=2, N2=2, C=0, P1=1, P2=2, WS=0, S1=1, S2=2,
+    BOT=0, TOP=0, NEU=0, DEFER=0, FALL=0, TECH=0, FORFEIT=0, DEFAULT=0, DISQ=0,
+)
+
+COLLEGE = Ruleset(
+    name="college",
+    title="College",
+    points=dict(_FOLKSTYLE_POINTS, N4=4, RT1=1),
+    always=_ALWAYS,
+    position_moves=dict(
+        neutral=("fT2", "oT2"),
+        top=("fN2", "fN4", "oE1", "oR2"),
+        bottom=("oN2", "oN4", "fE1", "fR2"),
+    ),
+    transitions=_FOLKSTYLE_TRANSITIONS,
+    duration=420,
+    periods=(180, 120, 120),
+    tech_margin=15,
+    major_margin=8,
+)
+"""Ruleset: College (folkstyle) ruleset."""
+
+HIGH_SCHOOL = Ruleset(
+    name="high school",
+    title="High School",
+    points=dict(_FOLKSTYLE_POINTS, N3=3),
+    always=_ALWAYS,
+    position_moves=dict(
+        neutral=("fT2", "oT2"),
+        top=("fN2", "fN3", "oE1", "oR2"),
+        bottom=("oN2", "oN3", "fE1", "fR2"),
+    ),
+    transitions=_FOLKSTYLE_TRANSITIONS,
+    duration=360,
+    periods=(120, 120, 120),
+    tech_margin=15,
+    major_margin=8,
+)
+"""Ruleset: High school (folkstyle) ruleset."""
+
+_INTERNATIONAL_ALWAYS = (
+    "fBOT", "fTOP", "fNEU", "oBOT", "oTOP", "oNEU",
+    "fPA1", "oPA1", "fC1", "fC2", "oC1", "oC2",
+)
+
+_INTERNATIONAL_TRANSITIONS = dict(
+    neutral=dict(
+        fT2="top", fTH4="top", fTH5="top", oBOT="top", fTOP="top",
+        oT2="bottom", oTH4="bottom", oTH5="bottom", fBOT="bottom", oTOP="bottom",
+    ),
+    top=dict(
+        fNEU="neutral", oNEU="neutral",
+        oR1="bottom", oTH4="bottom", oTH5="bottom", fBOT="bottom", oTOP="bottom",
+    ),
+    bottom=dict(
+        fNEU="neutral", oNEU="neutral",
+        fR1="top", fTH4="top", fTH5="top", oBOT="top", fTOP="top",
+    ),
+)
+
+_INTERNATIONAL_POINTS = dict(
+    START=0,
+    T2=2,  # takedown
+    R1=1,  # reversal
+    EX2=2,  # exposure / danger position
+    SO1=1,  # step out
+    TH4=4,  # throw
+    TH5=5,  # grand amplitude throw
+    PA1=1,  # passivity / activity period point
+    C1=1,  # caution, point to the initiator
+    C2=2,  # caution on a fleeing hold, points to the initiator
+    BOT=0,
+    TOP=0,
+    NEU=0,
+    FALL=0,
+    TECH=0,
+    FORFEIT=0,
+    DEFAULT=0,
+    DISQ=0,
+)
+
+_INTERNATIONAL_MOVES = dict(
+    neutral=("fT2", "oT2", "fSO1", "oSO1", "fTH4", "oTH4", "fTH5", "oTH5"),
+    top=("fEX2", "fTH4", "fTH5", "oR1", "oTH4", "oTH5"),
+    bottom=("oEX2", "oTH4", "oTH5", "fR1", "fTH4", "fTH5"),
+)
+
+FREESTYLE = Ruleset(
+    name="freestyle",
+    title="Freestyle",
+    points=_INTERNATIONAL_POINTS,
+    always=_INTERNATIONAL_ALWAYS,
+    position_moves=_INTERNATIONAL_MOVES,
+    transitions=_INTERNATIONAL_TRANSITIONS,
+    duration=360,
+    periods=(180, 180),
+    tech_margin=10,
+    caution_labels=("C1", "C2"),
+    criteria=True,
+)
+"""Ruleset: International freestyle ruleset."""
+
+GRECO = Ruleset(
+    name="greco",
+    title="Greco-Roman",
+    points=_INTERNATIONAL_POINTS,
+    always=_INTERNATIONAL_ALWAYS,
+    position_moves=_INTERNATIONAL_MOVES,
+    transitions=_INTERNATIONAL_TRANSITIONS,
+    duration=360,
+    periods=(180, 180),
+    tech_margin=8,
+    caution_labels=("C1", "C2"),
+    criteria=True,
+)
+"""Ruleset: Greco-Roman ruleset."""
+
+_REGISTRY: Dict[str, Ruleset] = {}
+
+
+def register_ruleset(ruleset: Ruleset, aliases: Iterable[str] = ()) -> Ruleset:
+    """Adds a ruleset to the registry.
+
+    Args:
+        ruleset: Compiled ruleset.
+        aliases: Additional names the ruleset can be looked up by.
+
+    Raises:
+        ValueError: A different ruleset is already registered under a name.
+
+    Returns:
+        Ruleset: The registered ruleset.
+
+    """
+    names = (ruleset.name, *aliases)
+    for name in names:
+        existing = _REGISTRY.get(name)
+        if existing is not None and existing is not ruleset:
+            raise ValueError(f"A ruleset is already registered as {name!r}.")
+    for name in names:
+        _REGISTRY[name] = ruleset
+    return ruleset
+
+
+def get_ruleset(name: Union[str, Ruleset]) -> Ruleset:
+    """Looks up a registered ruleset.
+
+    Args:
+        name: Registry name or alias, a Ruleset is returned unchanged.
+
+    Raises:
+        ValueError: No ruleset is registered under the name.
+
+    Returns:
+        Ruleset: The ruleset.
+
+    """
+    if isinstance(name, Ruleset):
+        return name
+    ruleset = _REGISTRY.get(name)
+    if ruleset is None:
+        raise ValueError(f"Expected `ruleset` to be one of {*_REGISTRY,}, got {name!r}.")
+    return ruleset
+
+
+def registered_rulesets() -> Tuple[str, ...]:
+    """Names and aliases of every registered ruleset."""
+    return tuple(_REGISTRY)
+
+
+register_ruleset(COLLEGE, aliases=("folkstyle",))
+register_ruleset(HIGH_SCHOOL, aliases=("hs",))
+register_ruleset(FREESTYLE)
+register_ruleset(GRECO, aliases=("greco-roman",))
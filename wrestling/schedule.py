@@ -0,0 +1,321 @@
+#! /usr/bin/python
+
+"""Module for strength of schedule and opponent-adjusted ratings.
+
+A ScheduleGraph is a sparse wrestler-vs-wrestler graph stored as coordinate
+lists, one directed entry per wrestler per bout, weighted by the bout's
+margin from that wrestler's perspective (the Result level, 1 for a decision
+up to 4 for a fall, or the points `mov`).  From it the module computes each
+wrestler's win %, opponents' win % (OWP), opponents' opponents' win % (OOWP)
+and a least-squares (Massey) rating solving
+
+    (L + ridge * I) r = b
+
+where L is the graph Laplacian and b the summed margins, with a Jacobi
+preconditioned conjugate gradient.  Every step is a sparse scatter over the
+edge lists, so the cost is linear in the number of bouts per iteration.
+
+numpy and scipy are optional (`pip install wrestling[fast]`).  With numpy the
+scatters use `numpy.bincount`, with scipy the system is solved by
+`scipy.sparse.linalg.cg`; without them the same algorithms run in pure
+Python, which is fine for conference sized graphs but slow for national
+ones.
+
+Example:
+    >>>graph = ScheduleGraph.from_matches(matches)
+    >>>table = graph.table()
+    >>>table[wrestler].rating
+
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import attr
+from attr.validators import in_
+
+from wrestling import base
+from wrestling.matches import Match
+from wrestling.wrestlers import Wrestler
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+try:
+    from scipy import sparse
+    from scipy.sparse import linalg as sparse_linalg
+except ImportError:  # pragma: no cover - optional dependency
+    sparse = sparse_linalg = None
+
+MARGINS = ("result", "mov")
+"""tuple[str]: Edge weightings, Result level or points margin of victory."""
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class ScheduleStats(object):
+    """Schedule metrics of one wrestler.
+
+    Args:
+        wins (int): Bouts won.
+        losses (int): Bouts lost.
+        win_pct (float): Share of bouts won.
+        owp (float): Mean win % of the opponents faced, per bout.
+        oowp (float): Mean OWP of the opponents faced, per bout.
+        rating (float): Opponent-adjusted least-squares rating.
+
+    """
+
+    wins: int = attr.ib()
+    losses: int = attr.ib()
+    win_pct: float = attr.ib()
+    owp: float = attr.ib()
+    oowp: float = attr.ib()
+    rating: float = attr.ib()
+
+    @property
+    def strength(self) -> float:
+        """Strength of schedule, (2 * OWP + OOWP) / 3."""
+        return (2 * self.owp + self.oowp) / 3
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ScheduleGraph(object):
+    """Sparse wrestler-vs-wrestler graph of bouts.
+
+    Wrestlers are identified by name and team (Wrestler equality).  No
+    contests carry no margin and are skipped.
+
+    Args:
+        margin (str): 'result' to weight bouts by Result level, 'mov' by the
+            points margin of victory.
+
+    """
+
+    margin: str = attr.ib(default="result", validator=in_(MARGINS))
+    wrestlers: List[Wrestler] = attr.ib(init=False, factory=list, repr=lambda x: f"{len(x)} wrestlers")
+    index: Dict[Wrestler, int] = attr.ib(init=False, factory=dict, repr=False)
+    _rows: List[int] = attr.ib(init=False, factory=list, repr=False)
+    _cols: List[int] = attr.ib(init=False, factory=list, repr=False)
+    _margins: List[float] = attr.ib(init=False, factory=list, repr=False)
+    _wins: List[int] = attr.ib(init=False, factory=list, repr=False)
+    _games: List[int] = attr.ib(init=False, factory=list, repr=False)
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Match], margin: str = "result") -> "ScheduleGraph":
+        """Builds a graph from matches.
+
+        Args:
+            matches: Match instances, one report per bout.
+            margin: Edge weighting, see MARGINS.
+
+        Returns:
+            ScheduleGraph: The graph.
+
+        """
+        graph = cls(margin=margin)
+        graph.extend(matches)
+        return graph
+
+    @property
+    def bouts(self) -> int:
+        """Number of bouts in the graph."""
+        return len(self._rows) // 2
+
+    def _node(self, wrestler: Wrestler) -> int:
+        node = self.index.get(wrestler)
+        if node is None:
+            node = self.index[wrestler] = len(self.wrestlers)
+            self.wrestlers.append(wrestler)
+            self._wins.append(0)
+            self._games.append(0)
+        return node
+
+    def add(self, match: Match) -> None:
+        """Adds one bout.
+
+        Args:
+            match: Match (or FlippedMatch) instance.
+
+        """
+        result = match.result
+        if result == base.Result.NC:
+            return
+        focus, opponent = self._node(match.focus), self._node(match.opponent)
+        margin = result.value if self.margin == "result" else match.mov
+        self._rows += (focus, opponent)
+        self._cols += (opponent, focus)
+        self._margins += (margin, -margin)
+        self._wins[focus if result.value > 0 else opponent] += 1
+        self._games[focus] += 1
+        self._games[opponent] += 1
+
+    def extend(self, matches: Iterable[Match]) -> None:
+        """Adds many bouts."""
+        for match in matches:
+            self.add(match)
+
+    def win_pct(self) -> List[float]:
+        """Win % of every wrestler, by node index."""
+        return [wins / games if games else 0.0 for wins, games in zip(self._wins, self._games)]
+
+    def owp(self, win_pct: Optional[Sequence[float]] = None) -> List[float]:
+        """Opponents' win % of every wrestler, by node index.
+
+        Args:
+            win_pct: Precomputed `win_pct()`.
+
+        Returns:
+            List[float]: Mean win % of the opponents faced, per bout.
+
+        """
+        return self._neighbor_mean(self.win_pct() if win_pct is None else win_pct)
+
+    def oowp(self, owp: Optional[Sequence[float]] = None) -> List[float]:
+        """Opponents' opponents' win % of every wrestler, by node index.
+
+        Args:
+            owp: Precomputed `owp()`.
+
+        Returns:
+            List[float]: Mean OWP of the opponents faced, per bout.
+
+        """
+        return self._neighbor_mean(self.owp() if owp is None else owp)
+
+    def ratings(self, ridge: float = 1e-3, tol: float = 1e-8, max_iter: int = 1000) -> List[float]:
+        """Least-squares (Massey) ratings, by node index.
+
+        A rating difference predicts the margin between two wrestlers; the
+        ridge term keeps the system definite and centers every connected
+        group of wrestlers on zero.
+
+        Args:
+            ridge: Regularization added to the Laplacian diagonal.
+            tol: Relative residual at which the solver stops.
+            max_iter: Maximum solver iterations.
+
+        Raises:
+            ValueError: `ridge` is not positive.
+
+        Returns:
+            List[float]: Rating of every wrestler.
+
+        """
+        if ridge <= 0:
+            raise ValueError(f"`ridge` must be positive, got {ridge}.")
+        if not self.wrestlers:
+            return []
+        diagonal = [games + ridge for games in self._games]
+        rhs = self._scatter(self._margins)
+        if sparse is not None:
+            n = len(self.wrestlers)
+            adjacency = sparse.csr_matrix(
+                (numpy.ones(len(self._rows)), (self._rows, self._cols)), shape=(n, n)
+            )
+            system = sparse.diags(diagonal) - adjacency
+            preconditioner = sparse.diags(1.0 / numpy.asarray(diagonal))
+            try:
+                solution, _ = sparse_linalg.cg(
+                    system, numpy.asarray(rhs), M=preconditioner, maxiter=max_iter, rtol=tol
+                )
+            except TypeError:  # scipy < 1.12 names it `tol`
+                solution, _ = sparse_linalg.cg(
+                    system, numpy.asarray(rhs), M=preconditioner, maxiter=max_iter, tol=tol
+                )
+            return solution.tolist()
+        return self._conjugate_gradient(diagonal, rhs, tol, max_iter)
+
+    def table(self, **kwargs) -> Dict[Wrestler, ScheduleStats]:
+        """Schedule metrics of every wrestler.
+
+        Args:
+            **kwargs: Arguments of `ratings`.
+
+        Returns:
+            Dict[Wrestler, ScheduleStats]: Metrics per wrestler.
+
+        """
+        win_pct = self.win_pct()
+        owp = self.owp(win_pct)
+        oowp = self.oowp(owp)
+        ratings = self.ratings(**kwargs)
+        return {
+            wrestler: ScheduleStats(
+                wins=self._wins[node],
+                losses=self._games[node] - self._wins[node],
+                win_pct=win_pct[node],
+                owp=owp[node],
+                oowp=oowp[node],
+                rating=ratings[node],
+            )
+            for node, wrestler in enumerate(self.wrestlers)
+        }
+
+    def _scatter(self, weights: Sequence[float]) -> List[float]:
+        # sums of `weights` per row: y[row] += weight for every entry
+        n = len(self.wrestlers)
+        if numpy is not None:
+            return numpy.bincount(self._rows, weights=weights, minlength=n).tolist()
+        sums = [0.0] * n
+        for row, weight in zip(self._rows, weights):
+            sums[row] += weight
+        return sums
+
+    def _gather(self, values: Sequence[float]) -> List[float]:
+        # (A @ values)[row] = sum of values[col] over the row's entries
+        n = len(self.wrestlers)
+        if numpy is not None:
+            gathered = numpy.asarray(values, dtype=float)[self._cols]
+            return numpy.bincount(self._rows, weights=gathered, minlength=n).tolist()
+        sums = [0.0] * n
+        for row, col in zip(self._rows, self._cols):
+            sums[row] += values[col]
+        return sums
+
+    def _neighbor_mean(self, values: Sequence[float]) -> List[float]:
+        return [
+            total / games if games else 0.0
+            for total, games in zip(self._gather(values), self._games)
+        ]
+
+    def _conjugate_gradient(
+        self, diagonal: List[float], rhs: List[float], tol: float, max_iter: int
+    ) -> List[float]:
+        n = len(diagonal)
+        solution = [0.0] * n
+        residual = list(rhs)
+        z = [r / d for r, d in zip(residual, diagonal)]
+        direction = list(z)
+        rz = sum(r * zi for r, zi in zip(residual, z))
+        threshold = tol * tol * sum(r * r for r in rhs)
+        for _ in range(max_iter):
+            if sum(r * r for r in residual) <= threshold:
+                break
+            neighbors = self._gather(direction)
+            product = [d * p - a for d, p, a in zip(diagonal, direction, neighbors)]
+            step = rz / sum(p * q for p, q in zip(direction, product))
+            solution = [x + step * p for x, p in zip(solution, direction)]
+            residual = [r - step * q for r, q in zip(residual, product)]
+            z = [r / d for r, d in zip(residual, diagonal)]
+            rz_next = sum(r * zi for r, zi in zip(residual, z))
+            direction = [zi + (rz_next / rz) * p for zi, p in zip(z, direction)]
+            rz = rz_next
+        return solution
+
+
+def strength_of_schedule(
+    matches: Iterable[Match], margin: str = "result", **kwargs
+) -> Dict[Wrestler, ScheduleStats]:
+    """Schedule metrics of every wrestler in a set of matches.
+
+    Args:
+        matches: Match instances, one report per bout.
+        margin: Edge weighting, see MARGINS.
+        **kwargs: Arguments of `ScheduleGraph.ratings`.
+
+    Returns:
+        Dict[Wrestler, ScheduleStats]: Metrics per wrestler.
+
+    """
+    return ScheduleGraph.from_matches(matches, margin=margin).table(**kwargs)
@@ -22,13 +22,15 @@ Todo:
 """
 
 import abc
+import pickle
+import zlib
 from datetime import time
-from typing import Dict, Union
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Type, Union
 
 import attr
 from attr.validators import in_, instance_of
 
-from wrestling import base
+from wrestling import base, rulesets
 from wrestling.base import CollegeLabel, HSLabel
 
 
@@ -59,6 +61,7 @@ class ScoringEvent(object):
     period: int = attr.ib(validator=instance_of(int), order=False, repr=False)
     focus_score: int = attr.ib(default=0, init=False, order=False, eq=False)
     opp_score: int = attr.ib(default=0, init=False, order=False, eq=False)
+    ruleset = rulesets.COLLEGE
 
     @property
     @abc.abstractmethod
@@ -134,6 +137,7 @@ class CollegeScoring(ScoringEvent):
     label: base.CollegeLabel = attr.ib(
         validator=instance_of(base.CollegeLabel), order=False, repr=lambda x: x.tag
     )
+    ruleset = rulesets.COLLEGE
 
 
 @attr.s(slots=True, eq=True, order=True, auto_attribs=True, kw_only=True)
@@ -147,3 +151,439 @@ class HSScoring(ScoringEvent):
     label: base.HSLabel = attr.ib(
         validator=instance_of(base.HSLabel), order=False, repr=lambda x: x.tag
     )
+    ruleset = rulesets.HIGH_SCHOOL
+
+
+_SCORING_CLASSES: Dict[str, Type[ScoringEvent]] = {
+    rulesets.COLLEGE.name: CollegeScoring,
+    rulesets.HIGH_SCHOOL.name: HSScoring,
+}
+
+
+def scoring_class(ruleset: Union[str, rulesets.Ruleset]) -> Type[ScoringEvent]:
+    """Scoring Event class for a registered ruleset, created on first use.
+
+    Args:
+        ruleset: Ruleset or registered ruleset name.
+
+    Returns:
+        Type[ScoringEvent]: Scoring Event subclass whose label is bound to the ruleset.
+
+    """
+    ruleset = rulesets.get_ruleset(ruleset)
+    if ruleset.name not in _SCORING_CLASSES:
+        label_cls = base.label_class(ruleset)
+        name = "".join(part.title() for part in ruleset.name.split()) + "Scoring"
+        namespace = {
+            "__annotations__": {"label": label_cls},
+            "__module__": __name__,
+            "label": attr.ib(validator=instance_of(label_cls), order=False, repr=lambda x: x.tag),
+            "ruleset": ruleset,
+        }
+        cls = attr.s(slots=True, eq=True, order=True, auto_attribs=True, kw_only=True)(
+            type(name, (ScoringEvent,), namespace)
+        )
+        # module level name so instances can be pickled
+        globals()[name] = _SCORING_CLASSES[ruleset.name] = cls
+    return _SCORING_CLASSES[ruleset.name]
+
+
+_LAZY_CLASSES = {
+    "FreestyleScoring": "freestyle",
+    "GrecoScoring": "greco",
+}
+"""dict[str, str]: Classes for additional rulesets, created by `scoring_class` on first access."""
+
+
+def __getattr__(name: str):
+    """Creates the classes of additional rulesets on first access."""
+    if name in _LAZY_CLASSES:
+        return scoring_class(_LAZY_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class ScoreSummary(object):
+    """Precomputed totals of a time series.
+
+    Args:
+        focus_pts (int): Points scored by the focus wrestler.
+        opp_pts (int): Points scored by the opponent.
+        td_diff (int): Focus takedowns minus opponent takedowns.
+        labels_valid (bool): Whether every label in the series is valid.
+        length (int): Number of scoring events in the series.
+        tech_index (int): Index of the event at which the ruleset's technical
+            superiority margin was first reached, -1 if never.
+        focus_best (int): Highest single action value scored by the focus.
+        opp_best (int): Highest single action value scored by the opponent.
+        focus_cautions (int): Cautions given to the focus wrestler.
+        opp_cautions (int): Cautions given to the opponent.
+        last_scorer (str): 'f' or 'o' for who scored last, '' if nobody scored.
+        terminal (str): Formatted label of the last match ending action, e.g.
+            'fFALL', '' if there is none.
+
+    """
+
+    focus_pts: int = attr.ib(validator=instance_of(int))
+    opp_pts: int = attr.ib(validator=instance_of(int))
+    td_diff: int = attr.ib(validator=instance_of(int))
+    labels_valid: bool = attr.ib(default=True, validator=instance_of(bool))
+    length: int = attr.ib(default=0, validator=instance_of(int))
+    tech_index: int = attr.ib(default=-1, validator=instance_of(int))
+    focus_best: int = attr.ib(default=0, validator=instance_of(int))
+    opp_best: int = attr.ib(default=0, validator=instance_of(int))
+    focus_cautions: int = attr.ib(default=0, validator=instance_of(int))
+    opp_cautions: int = attr.ib(default=0, validator=instance_of(int))
+    last_scorer: str = attr.ib(default="", validator=in_(("", "f", "o")))
+    terminal: str = attr.ib(default="", validator=instance_of(str))
+
+    @classmethod
+    def from_time_series(
+        cls,
+        time_series: Iterable[ScoringEvent],
+        ruleset: Optional[rulesets.Ruleset] = None,
+    ) -> "ScoreSummary":
+        """Computes every summary field in a single pass.
+
+        Args:
+            time_series: Scoring events.
+            ruleset: Ruleset for technical superiority and cautions, defaults
+                to the ruleset of the events' class.
+
+        Returns:
+            ScoreSummary: Totals of the series.
+
+        """
+        return summarize(time_series, ruleset)
+
+    @property
+    def criteria_leader(self) -> str:
+        """Who wins on criteria, used to break ties in international styles.
+
+        Criteria are, in order: the highest value single action, the fewest
+        cautions, the last point scored.
+
+        Returns:
+            str: 'f' or 'o', '' if the criteria cannot separate the wrestlers.
+
+        """
+        if self.focus_best != self.opp_best:
+            return "f" if self.focus_best > self.opp_best else "o"
+        if self.focus_cautions != self.opp_cautions:
+            return "f" if self.focus_cautions < self.opp_cautions else "o"
+        return self.last_scorer
+
+    def flipped(self) -> "ScoreSummary":
+        """Summary from the opponent's perspective.
+
+        Returns:
+            ScoreSummary: Mirrored summary.
+
+        """
+        return attr.evolve(
+            self,
+            focus_pts=self.opp_pts,
+            opp_pts=self.focus_pts,
+            td_diff=-self.td_diff,
+            focus_best=self.opp_best,
+            opp_best=self.focus_best,
+            focus_cautions=self.opp_cautions,
+            opp_cautions=self.focus_cautions,
+            last_scorer={"f": "o", "o": "f"}.get(self.last_scorer, ""),
+            terminal=(
+                ("o" if self.terminal[0] == "f" else "f") + self.terminal[1:]
+                if self.terminal
+                else ""
+            ),
+        )
+
+
+def summarize(
+    time_series: Iterable[ScoringEvent],
+    ruleset: Optional[rulesets.Ruleset] = None,
+    assign_scores: bool = False,
+) -> ScoreSummary:
+    """Single pass over a time series computing its ScoreSummary.
+
+    Points are credited to the initiator of an action.  For caution labels
+    the initiator is the wrestler awarded the points, so the caution is
+    counted against the other wrestler.
+
+    Args:
+        time_series: Scoring events.
+        ruleset: Ruleset for technical superiority and cautions, defaults to
+            the ruleset of the events' class.
+        assign_scores: If True, also set the running `focus_score` and
+            `opp_score` of every event.
+
+    Returns:
+        ScoreSummary: Totals of the series.
+
+    """
+    tech_margin = cautions = terminals = None
+    focus_pts = opp_pts = td_diff = length = focus_best = opp_best = 0
+    focus_cautions = opp_cautions = 0
+    tech_index = -1
+    last_scorer = terminal = ""
+    labels_valid = True
+    for score in time_series:
+        if ruleset is None:
+            ruleset = score.ruleset
+        if cautions is None:
+            tech_margin, cautions = ruleset.tech_margin, ruleset.caution_labels
+            terminals = ruleset.terminal_labels
+        label = score.label
+        value = label.point_value
+        tag = label.tag
+        if not label.isvalid:
+            labels_valid = False
+        if score.focus_color == score.initiator:
+            focus_pts += value
+            if value:
+                last_scorer = "f"
+                if value > focus_best:
+                    focus_best = value
+            if tag == "T2":
+                td_diff += 1
+            elif tag in cautions:
+                opp_cautions += 1
+            elif tag in terminals:
+                terminal = f"f{tag}"
+        else:
+            opp_pts += value
+            if value:
+                last_scorer = "o"
+                if value > opp_best:
+                    opp_best = value
+            if tag == "T2":
+                td_diff -= 1
+            elif tag in cautions:
+                focus_cautions += 1
+            elif tag in terminals:
+                terminal = f"o{tag}"
+        if assign_scores:
+            score.focus_score = focus_pts
+            score.opp_score = opp_pts
+        if tech_index < 0 and tech_margin and abs(focus_pts - opp_pts) >= tech_margin:
+            tech_index = length
+        length += 1
+    return ScoreSummary(
+        focus_pts=focus_pts,
+        opp_pts=opp_pts,
+        td_diff=td_diff,
+        labels_valid=labels_valid,
+        length=length,
+        tech_index=tech_index,
+        focus_best=focus_best,
+        opp_best=opp_best,
+        focus_cautions=focus_cautions,
+        opp_cautions=opp_cautions,
+        last_scorer=last_scorer,
+        terminal=terminal,
+    )
+
+
+def compress_time_series(time_series: Sequence[ScoringEvent], level: int = 6) -> bytes:
+    """Serializes scoring events into a zlib compressed blob.
+
+    Args:
+        time_series: Scoring events.
+        level: zlib compression level.
+
+    Returns:
+        bytes: Compressed blob, see `decompress_time_series`.
+
+    """
+    return zlib.compress(pickle.dumps(tuple(time_series), pickle.HIGHEST_PROTOCOL), level)
+
+
+def decompress_time_series(blob: bytes) -> Tuple[ScoringEvent]:
+    """Restores scoring events from a `compress_time_series` blob.
+
+    Args:
+        blob: Compressed blob.
+
+    Returns:
+        Tuple: Scoring events.
+
+    """
+    return pickle.loads(zlib.decompress(blob))
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class LazyTimeSeries(object):
+    """Deferred, read-only sequence of scoring events.
+
+    The events are produced by `loader` (a file offset reader, a database
+    query, a compressed blob...) the first time the sequence is iterated,
+    indexed or measured; the precomputed `summary` answers point totals
+    without loading anything.  The loader must return the events exactly as
+    a constructed Match stores them (validated, scored, 'START' first).
+
+    Args:
+        loader (Callable): Zero argument callable returning the events.
+        summary (ScoreSummary): Precomputed totals of the events.
+
+    """
+
+    loader: Callable[[], Tuple[ScoringEvent]] = attr.ib(repr=False)
+    summary: ScoreSummary = attr.ib(validator=instance_of(ScoreSummary))
+    _events: Optional[Tuple[ScoringEvent]] = attr.ib(init=False, default=None, repr=False)
+
+    @classmethod
+    def from_blob(cls, blob: bytes, summary: ScoreSummary) -> "LazyTimeSeries":
+        """Lazy series backed by a `compress_time_series` blob.
+
+        Args:
+            blob: Compressed blob.
+            summary: Precomputed totals of the events.
+
+        Returns:
+            LazyTimeSeries: Series decompressing the blob on first access.
+
+        """
+        return cls(loader=lambda: decompress_time_series(blob), summary=summary)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the events have been materialized."""
+        return self._events is not None
+
+    @property
+    def events(self) -> Tuple[ScoringEvent]:
+        """Materialized events, loading them on first access.
+
+        Returns:
+            Tuple: Scoring events.
+
+        """
+        if self._events is None:
+            self._events = tuple(self.loader())
+        return self._events
+
+    def unload(self) -> None:
+        """Drops materialized events, they will be reloaded on next access."""
+        self._events = None
+
+    def __len__(self) -> int:
+        return self.summary.length if self._events is None else len(self._events)
+
+    def __iter__(self) -> Iterator[ScoringEvent]:
+        return iter(self.events)
+
+    def __getitem__(self, item):
+        return self.events[item]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyTimeSeries):
+            other = other.events
+        return self.events == other
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def flipped(self) -> "LazyTimeSeries":
+        """Deferred view of the series from the opponent's perspective.
+
+        Returns:
+            LazyTimeSeries: Mirrored series sharing this series' loader.
+
+        """
+        return LazyTimeSeries(
+            loader=lambda: tuple(FlippedTimeSeries(self.events)), summary=self.summary.flipped()
+        )
+
+
+_OTHER_COLOR = {"red": "green", "green": "red"}
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class FlippedScoring(object):
+    """Read-only view of a ScoringEvent from the opponent's perspective.
+
+    Args:
+        source (ScoringEvent): Event being mirrored.
+
+    """
+
+    source: ScoringEvent = attr.ib(validator=instance_of(ScoringEvent))
+
+    @property
+    def time_stamp(self) -> Union[time, str]:
+        """Time the action occured."""
+        return self.source.time_stamp
+
+    @property
+    def initiator(self) -> str:
+        """Who initiated the action, red or green."""
+        return self.source.initiator
+
+    @property
+    def focus_color(self) -> str:
+        """Color of the (new) focus wrestler."""
+        return _OTHER_COLOR[self.source.focus_color]
+
+    @property
+    def period(self) -> int:
+        """Period in which the action occured."""
+        return self.source.period
+
+    @property
+    def label(self) -> base.Mark:
+        """Label of the action that occurred."""
+        return self.source.label
+
+    @property
+    def ruleset(self) -> rulesets.Ruleset:
+        """Ruleset of the source event."""
+        return self.source.ruleset
+
+    @property
+    def focus_score(self) -> int:
+        """Running score of the (new) focus wrestler."""
+        return self.source.opp_score
+
+    @property
+    def opp_score(self) -> int:
+        """Running score of the (new) opponent."""
+        return self.source.focus_score
+
+    @property
+    def formatted_time(self) -> str:
+        """Minute:Second string formatted time_stamp."""
+        return self.source.formatted_time
+
+    @property
+    def formatted_label(self) -> str:
+        """Label with the focus (f) / opponent (o) prefix swapped."""
+        label = self.source.formatted_label
+        return ("o" if label[0] == "f" else "f") + label[1:]
+
+    def flipped(self) -> ScoringEvent:
+        """The original, unflipped event."""
+        return self.source
+
+    to_dict = ScoringEvent.to_dict
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class FlippedTimeSeries(object):
+    """Read-only sequence mirroring a time series without copying it.
+
+    Args:
+        source (Sequence): Scoring events being mirrored.
+
+    """
+
+    source: Sequence[ScoringEvent] = attr.ib()
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __iter__(self) -> Iterator[FlippedScoring]:
+        return (FlippedScoring(score) for score in self.source)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return tuple(FlippedScoring(score) for score in self.source[item])
+        return FlippedScoring(self.source[item])
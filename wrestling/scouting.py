@@ -0,0 +1,305 @@
+#! /usr/bin/python
+
+"""Module for scouting reports built from precomputed action profiles.
+
+A ProfileStore scans an archive once, reading every time series from both
+wrestlers' perspectives, and keeps one ActionProfile of plain integer tallies
+per wrestler: points scored and allowed per period, counts of every action
+(`formatted_label` tags) for and against, time wrestled, escapes and
+reversals with the time spent on bottom before each escape (positions are
+tracked with the match's ruleset), and pairs of consecutive scoring actions.
+Profiles serialize to compact zlib compressed JSON, and reports are rendered
+from the tallies on demand, so a whole bracket needs no second pass over the
+archive.
+
+Example:
+    >>>store = ProfileStore()
+    >>>store.update(archive)
+    >>>store.save("profiles.json.z")
+    >>>for wrestler in bracket:
+    >>>    print(store.report(wrestler))
+
+"""
+
+import json
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.matches import Match
+from wrestling.wrestlers import Wrestler
+
+_FLIP = {"f": "o", "o": "f"}
+_MIRROR = {"neutral": "neutral", "top": "bottom", "bottom": "top"}
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ActionProfile(object):
+    """Action tallies of one wrestler over an archive.
+
+    Actions are tags of formatted labels: 'fT2' counts in `actions` as 'T2',
+    'oT2' in `against`.  Sequences are pairs of consecutive point scoring
+    formatted labels from this wrestler's perspective, e.g. ('oT2', 'fE1').
+
+    Args:
+        wrestler (Wrestler): Profiled wrestler.
+        matches (int): Matches scanned.
+        seconds (int): Time wrestled, up to the last action of matches ended
+            by fall or technical superiority.
+        scored (Dict[int, int]): Points scored per period.
+        allowed (Dict[int, int]): Points allowed per period.
+        actions (Dict[str, int]): Counts of this wrestler's actions.
+        against (Dict[str, int]): Counts of opponents' actions.
+        escapes (int): Escapes from bottom.
+        escape_seconds (int): Total time on bottom before those escapes.
+        reversals (int): Reversals from bottom.
+        sequences (Dict[Tuple[str, str], int]): Counts of scoring pairs.
+
+    """
+
+    wrestler: Wrestler = attr.ib(validator=instance_of(Wrestler), repr=lambda x: x.name)
+    matches: int = attr.ib(default=0)
+    seconds: int = attr.ib(default=0, repr=False)
+    scored: Dict[int, int] = attr.ib(factory=dict, repr=False)
+    allowed: Dict[int, int] = attr.ib(factory=dict, repr=False)
+    actions: Dict[str, int] = attr.ib(factory=dict, repr=False)
+    against: Dict[str, int] = attr.ib(factory=dict, repr=False)
+    escapes: int = attr.ib(default=0, repr=False)
+    escape_seconds: int = attr.ib(default=0, repr=False)
+    reversals: int = attr.ib(default=0, repr=False)
+    sequences: Dict[Tuple[str, str], int] = attr.ib(factory=dict, repr=False)
+
+    @property
+    def minutes(self) -> float:
+        """Time wrestled in minutes."""
+        return self.seconds / 60
+
+    @property
+    def takedowns_per_minute(self) -> float:
+        """Takedowns scored per minute wrestled."""
+        return self.actions.get("T2", 0) / self.minutes if self.seconds else 0.0
+
+    @property
+    def takedowns_allowed_per_minute(self) -> float:
+        """Takedowns allowed per minute wrestled."""
+        return self.against.get("T2", 0) / self.minutes if self.seconds else 0.0
+
+    @property
+    def mean_escape_seconds(self) -> Optional[float]:
+        """Average time on bottom before an escape, None without escapes."""
+        return self.escape_seconds / self.escapes if self.escapes else None
+
+    def period_shares(self) -> Dict[int, float]:
+        """Share of scored points per period."""
+        total = sum(self.scored.values())
+        return {period: points / total for period, points in sorted(self.scored.items())} if total else {}
+
+    def top_sequences(self, n: int = 3) -> List[Tuple[Tuple[str, str], int]]:
+        """Most common scoring pairs, with their counts."""
+        return Counter(self.sequences).most_common(n)
+
+    def merge(self, other: "ActionProfile") -> None:
+        """Adds the tallies of another profile of the same wrestler."""
+        self.matches += other.matches
+        self.seconds += other.seconds
+        self.escapes += other.escapes
+        self.escape_seconds += other.escape_seconds
+        self.reversals += other.reversals
+        for mine, theirs in (
+            (self.scored, other.scored),
+            (self.allowed, other.allowed),
+            (self.actions, other.actions),
+            (self.against, other.against),
+            (self.sequences, other.sequences),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+
+    def to_dict(self) -> Dict:
+        """Creates a JSON serializable dictionary representation of the profile."""
+        return dict(
+            name=self.wrestler.name,
+            team=self.wrestler.team,
+            matches=self.matches,
+            seconds=self.seconds,
+            scored=self.scored,
+            allowed=self.allowed,
+            actions=self.actions,
+            against=self.against,
+            escapes=self.escapes,
+            escape_seconds=self.escape_seconds,
+            reversals=self.reversals,
+            sequences={f"{a}>{b}": count for (a, b), count in self.sequences.items()},
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ActionProfile":
+        """Creates a profile from `to_dict` output (as read back from JSON)."""
+        return cls(
+            wrestler=Wrestler(name=data["name"], team=data["team"]),
+            matches=data["matches"],
+            seconds=data["seconds"],
+            scored={int(period): points for period, points in data["scored"].items()},
+            allowed={int(period): points for period, points in data["allowed"].items()},
+            actions=dict(data["actions"]),
+            against=dict(data["against"]),
+            escapes=data["escapes"],
+            escape_seconds=data["escape_seconds"],
+            reversals=data["reversals"],
+            sequences={tuple(pair.split(">")): count for pair, count in data["sequences"].items()},
+        )
+
+
+def _scan(match: Match) -> Tuple[ActionProfile, ActionProfile]:
+    """Profiles of the focus and the opponent from one match."""
+    focus = ActionProfile(wrestler=match.focus, matches=1)
+    opponent = ActionProfile(wrestler=match.opponent, matches=1)
+    profiles = dict(f=focus, o=opponent)
+    ruleset = match.ruleset
+    position = "neutral"  # of the focus
+    bottom_since = dict(f=None, o=None)
+    previous = dict(f=None, o=None)
+    seconds = 0
+    for score in match.time_series:
+        label = score.label
+        tag = label.tag
+        if tag == "START":
+            continue
+        seconds = base.seconds_of(score.time_stamp)
+        side = "f" if score.initiator == score.focus_color else "o"
+        other = _FLIP[side]
+        actor, target = profiles[side], profiles[other]
+        actor.actions[tag] = actor.actions.get(tag, 0) + 1
+        target.against[tag] = target.against.get(tag, 0) + 1
+        value = label.point_value
+        if value:
+            actor.scored[score.period] = actor.scored.get(score.period, 0) + value
+            target.allowed[score.period] = target.allowed.get(score.period, 0) + value
+            for perspective, prefix in ((side, "f"), (other, "o")):
+                current = f"{prefix}{tag}"
+                if previous[perspective] is not None:
+                    pair = (previous[perspective], current)
+                    profile = profiles[perspective]
+                    profile.sequences[pair] = profile.sequences.get(pair, 0) + 1
+                previous[perspective] = current
+        new_position = ruleset.next_position(position, f"{side}{tag}")
+        if new_position != position:
+            for perspective, old, new in (
+                ("f", position, new_position),
+                ("o", _MIRROR[position], _MIRROR[new_position]),
+            ):
+                if new == "bottom":
+                    bottom_since[perspective] = seconds
+                elif old == "bottom":
+                    if perspective == side and tag == "E1" and bottom_since[perspective] is not None:
+                        profiles[perspective].escapes += 1
+                        profiles[perspective].escape_seconds += seconds - bottom_since[perspective]
+                    elif perspective == side and tag == "R2":
+                        profiles[perspective].reversals += 1
+                    bottom_since[perspective] = None
+            position = new_position
+    ended_early = abs(match.result.value) >= base.Result.WT.value
+    focus.seconds = opponent.seconds = seconds if ended_early else max(match.duration, seconds)
+    return focus, opponent
+
+
+def render(profile: ActionProfile, top: int = 3) -> str:
+    """Plain text scouting report of a profile.
+
+    Args:
+        profile: Action profile.
+        top: Number of actions and sequences listed.
+
+    Returns:
+        str: Report text.
+
+    """
+    lines = [f"{profile.wrestler.name} ({profile.wrestler.team}), {profile.matches} matches"]
+    shares = ", ".join(f"P{period} {share:.0%}" for period, share in profile.period_shares().items())
+    lines.append(f"  scoring by period: {shares or 'no points'}")
+    lines.append(
+        f"  takedowns/min: {profile.takedowns_per_minute:.2f} for, "
+        f"{profile.takedowns_allowed_per_minute:.2f} against"
+    )
+    escape = profile.mean_escape_seconds
+    lines.append(
+        f"  bottom: {profile.escapes} escapes"
+        + (f" after {escape:.0f}s on average" if escape is not None else "")
+        + f", {profile.reversals} reversals"
+    )
+    actions = ", ".join(f"{tag} x{count}" for tag, count in Counter(profile.actions).most_common(top))
+    lines.append(f"  top actions: {actions or 'none'}")
+    sequences = ", ".join(f"{a} -> {b} x{count}" for (a, b), count in profile.top_sequences(top))
+    lines.append(f"  common sequences: {sequences or 'none'}")
+    return "\n".join(lines)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ProfileStore(object):
+    """Action profiles of every wrestler in an archive.
+
+    Args:
+        profiles (Dict[Wrestler, ActionProfile]): Profiles by wrestler.
+
+    """
+
+    profiles: Dict[Wrestler, ActionProfile] = attr.ib(factory=dict, repr=lambda x: f"{len(x)} wrestlers")
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def __contains__(self, wrestler: Wrestler) -> bool:
+        return wrestler in self.profiles
+
+    def update(self, matches: Iterable[Match]) -> None:
+        """Adds the actions of matches to the profiles of both wrestlers.
+
+        Args:
+            matches: Match instances.
+
+        """
+        profiles = self.profiles
+        for match in matches:
+            for scanned in _scan(match):
+                profile = profiles.get(scanned.wrestler)
+                if profile is None:
+                    profiles[scanned.wrestler] = scanned
+                else:
+                    profile.merge(scanned)
+
+    def profile(self, wrestler: Wrestler) -> Optional[ActionProfile]:
+        """Profile of a wrestler, None if not scanned."""
+        return self.profiles.get(wrestler)
+
+    def report(self, wrestler: Wrestler, top: int = 3) -> str:
+        """Renders the scouting report of a wrestler, see `render`.
+
+        Raises:
+            KeyError: Wrestler was not scanned.
+
+        """
+        return render(self.profiles[wrestler], top)
+
+    def reports(self, wrestlers: Iterable[Wrestler], top: int = 3) -> Dict[Wrestler, str]:
+        """Reports of the scanned wrestlers among `wrestlers`, e.g. a bracket."""
+        return {
+            wrestler: render(self.profiles[wrestler], top) for wrestler in wrestlers if wrestler in self.profiles
+        }
+
+    def save(self, path: str) -> None:
+        """Writes the profiles as zlib compressed JSON."""
+        data = json.dumps([profile.to_dict() for profile in self.profiles.values()], separators=(",", ":"))
+        with open(path, "wb") as file:
+            file.write(zlib.compress(data.encode(), 9))
+
+    @classmethod
+    def load(cls, path: str) -> "ProfileStore":
+        """Reads profiles written by `save`."""
+        with open(path, "rb") as file:
+            data = json.loads(zlib.decompress(file.read()))
+        profiles = (ActionProfile.from_dict(item) for item in data)
+        return cls({profile.wrestler: profile for profile in profiles})
@@ -0,0 +1,6 @@
+"""Storage backends for persisting Matches.
+
+Backends live in their own submodules so that importing the package does
+not pull in any database drivers until a backend is actually used.
+
+"""
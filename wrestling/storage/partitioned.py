@@ -0,0 +1,357 @@
+#! /usr/bin/python
+
+"""Module for match storage partitioned by weight class and date bucket.
+
+Almost every query is scoped by weight and a date window, so a
+PartitionedCollection splits matches into partitions keyed by (weight, date
+bucket), each an indexed MatchCollection with summary statistics kept up to
+date as matches are added.  Queries only run against the partitions whose
+weight and bucket can satisfy them.
+
+On disk, every partition is one zlib compressed pickle at
+`<directory>/<weight>/<bucket>.matches` and a `manifest.json` holds the
+partition keys and statistics, so a store can be opened, pruned and
+summarized without reading any matches.  Saving only rewrites the partitions
+that changed since the last save.
+
+Example:
+    >>>store = PartitionedCollection(granularity="month")
+    >>>store.extend(this_weeks_matches)
+    >>>store.save("archive")
+    >>>store = PartitionedCollection.open("archive")
+    >>>for match in store.query(MatchQuery().weight(165).between("2020-01-01", "2020-02-01")):
+    >>>    print(match.focus.name)
+
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import attr
+from attr.validators import in_
+
+from wrestling import base
+from wrestling.matches import Match
+from wrestling.query import MatchCollection, MatchQuery
+
+GRANULARITIES = ("year", "month", "week")
+"""tuple[str]: Supported date bucket sizes."""
+
+MANIFEST = "manifest.json"
+"""str: File name of the partition manifest."""
+
+PartitionKey = Tuple[str, str]
+
+
+def date_bucket(date: Union[str, datetime], granularity: str = "month") -> str:
+    """Date bucket of a date.
+
+    Buckets sort in date order: 'YYYY', 'YYYY-MM' or ISO week 'YYYY-Www'.
+
+    Args:
+        date: Datetime or ISO formatted date string.
+        granularity: One of GRANULARITIES.
+
+    Raises:
+        ValueError: Unknown granularity.
+
+    Returns:
+        str: Bucket name.
+
+    """
+    text = base.date_key(date)
+    if granularity == "year":
+        return text[:4]
+    if granularity == "month":
+        return text[:7]
+    if granularity == "week":
+        year, week, _ = datetime.fromisoformat(text[:10]).isocalendar()
+        return f"{year}-W{week:02d}"
+    raise ValueError(f"Expected `granularity` to be one of {*GRANULARITIES,}, got {granularity!r}.")
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class PartitionStats(object):
+    """Summary statistics of one partition.
+
+    Args:
+        count (int): Number of matches.
+        wins (int): Focus wrestler wins.
+        bonus_wins (int): Focus wrestler wins with bonus.
+        focus_pts (int): Points scored by the focus wrestlers.
+        opp_pts (int): Points scored by the opponents.
+        first_date (str): Earliest match date.
+        last_date (str): Latest match date.
+
+    """
+
+    count: int = attr.ib(default=0)
+    wins: int = attr.ib(default=0)
+    bonus_wins: int = attr.ib(default=0)
+    focus_pts: int = attr.ib(default=0)
+    opp_pts: int = attr.ib(default=0)
+    first_date: str = attr.ib(default="")
+    last_date: str = attr.ib(default="")
+
+    def updated(self, matches: Iterable[Match]) -> "PartitionStats":
+        """Statistics including additional matches.
+
+        Args:
+            matches: Matches added to the partition.
+
+        Returns:
+            PartitionStats: New statistics.
+
+        """
+        count, wins, bonus_wins = self.count, self.wins, self.bonus_wins
+        focus_pts, opp_pts = self.focus_pts, self.opp_pts
+        dates = [self.first_date, self.last_date] if self.count else []
+        for match in matches:
+            value = match.result.value
+            summary = match.score_summary
+            count += 1
+            wins += value > 0
+            bonus_wins += value > 1
+            focus_pts += summary.focus_pts
+            opp_pts += summary.opp_pts
+            dates.append(base.date_key(match.date))
+        return PartitionStats(
+            count=count,
+            wins=wins,
+            bonus_wins=bonus_wins,
+            focus_pts=focus_pts,
+            opp_pts=opp_pts,
+            first_date=min(dates, default=""),
+            last_date=max(dates, default=""),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Creates a dictionary representation of the statistics."""
+        return attr.asdict(self)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class Partition(object):
+    """Matches of one (weight, date bucket) partition.
+
+    Args:
+        key (Tuple[str, str]): (weight, bucket).
+        stats (PartitionStats): Summary statistics.
+        path (Optional[str]): File backing the partition, None if unsaved.
+
+    """
+
+    key: PartitionKey = attr.ib()
+    stats: PartitionStats = attr.ib(factory=PartitionStats, repr=lambda x: f"{x.count} matches")
+    path: Optional[str] = attr.ib(default=None, repr=False)
+    dirty: bool = attr.ib(default=False, repr=False)
+    _collection: Optional[MatchCollection] = attr.ib(default=None, repr=False)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the matches are in memory."""
+        return self._collection is not None
+
+    @property
+    def collection(self) -> MatchCollection:
+        """Indexed matches, read from `path` on first access."""
+        if self._collection is None:
+            matches = []
+            if self.path is not None:
+                with open(self.path, "rb") as file:
+                    matches = pickle.loads(zlib.decompress(file.read()))
+            self._collection = MatchCollection(matches)
+        return self._collection
+
+    def extend(self, matches: List[Match]) -> None:
+        """Adds matches and updates the statistics."""
+        self.collection.extend(matches)
+        self.stats = self.stats.updated(matches)
+        self.dirty = True
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class PartitionedCollection(object):
+    """Matches partitioned by weight class and date bucket.
+
+    Args:
+        granularity (str): Date bucket size, one of GRANULARITIES.
+        directory (Optional[str]): Directory the store was opened from or
+            last saved to.
+
+    """
+
+    granularity: str = attr.ib(default="month", validator=in_(GRANULARITIES))
+    directory: Optional[str] = attr.ib(default=None, repr=False)
+    _partitions: Dict[PartitionKey, Partition] = attr.ib(
+        init=False, factory=dict, repr=lambda x: f"{len(x)} partitions"
+    )
+
+    @classmethod
+    def open(cls, directory: str) -> "PartitionedCollection":
+        """Opens a saved store, reading only its manifest.
+
+        Args:
+            directory: Directory written by `save`.
+
+        Returns:
+            PartitionedCollection: Store with lazily loaded partitions.
+
+        """
+        with open(os.path.join(directory, MANIFEST)) as file:
+            manifest = json.load(file)
+        store = cls(granularity=manifest["granularity"], directory=directory)
+        for entry in manifest["partitions"]:
+            key = (entry["weight"], entry["bucket"])
+            store._partitions[key] = Partition(
+                key=key,
+                stats=PartitionStats(**entry["stats"]),
+                path=os.path.join(directory, entry["file"]),
+            )
+        return store
+
+    def __len__(self) -> int:
+        return sum(partition.stats.count for partition in self._partitions.values())
+
+    def __iter__(self) -> Iterator[Match]:
+        for key in sorted(self._partitions):
+            yield from self._partitions[key].collection
+
+    def key_of(self, match: Match) -> PartitionKey:
+        """Partition key of a match."""
+        return match.weight, date_bucket(match.date, self.granularity)
+
+    def extend(self, matches: Iterable[Match]) -> None:
+        """Adds matches to their partitions.
+
+        Args:
+            matches: Match instances.
+
+        """
+        groups: Dict[PartitionKey, List[Match]] = {}
+        for match in matches:
+            groups.setdefault(self.key_of(match), []).append(match)
+        for key, group in groups.items():
+            partition = self._partitions.get(key)
+            if partition is None:
+                partition = self._partitions[key] = Partition(key=key)
+            partition.extend(group)
+
+    def partitions(
+        self,
+        weights: Optional[Iterable[Union[str, int]]] = None,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> List[Partition]:
+        """Partitions that can hold matches of the given weights and window.
+
+        Args:
+            weights: Weight classes, None for all.
+            start: Inclusive lower date bound, None for unbounded.
+            end: Inclusive upper date bound, None for unbounded.
+
+        Returns:
+            List[Partition]: Remaining partitions, sorted by key.
+
+        """
+        weights = None if weights is None else {str(weight) for weight in weights}
+        low = None if start is None else date_bucket(start, self.granularity)
+        high = None if end is None else date_bucket(end, self.granularity)
+        return [
+            self._partitions[key]
+            for key in sorted(self._partitions)
+            if (weights is None or key[0] in weights)
+            and (low is None or key[1] >= low)
+            and (high is None or key[1] <= high)
+        ]
+
+    def query(self, query: MatchQuery) -> Iterator[Match]:
+        """Runs a query against the partitions it can match.
+
+        Weight lookups and the date window of the query prune partitions;
+        the whole query then runs on each remaining partition.
+
+        Args:
+            query: Match query.
+
+        Returns:
+            Iterator[Match]: Matching matches, by partition key.
+
+        """
+        weights = None
+        for column, values in query.lookups:
+            if column == "weight":
+                weights = set(values) if weights is None else weights & values
+        for partition in self.partitions(weights, *query.dates):
+            yield from query.run(partition.collection)
+
+    def stats(
+        self,
+        weights: Optional[Iterable[Union[str, int]]] = None,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> Dict[PartitionKey, PartitionStats]:
+        """Statistics of the partitions matching a weight and date scope.
+
+        Reads no matches.
+
+        Returns:
+            Dict[Tuple[str, str], PartitionStats]: Statistics per partition.
+
+        """
+        return {partition.key: partition.stats for partition in self.partitions(weights, start, end)}
+
+    def save(self, directory: Optional[str] = None) -> int:
+        """Writes changed partitions and the manifest.
+
+        Args:
+            directory: Target directory, defaults to `directory`.  Saving to
+                a new directory writes every partition.
+
+        Raises:
+            ValueError: No directory given or known.
+
+        Returns:
+            int: Number of partitions written.
+
+        """
+        directory = directory or self.directory
+        if directory is None:
+            raise ValueError("Expected a `directory` to save the partitions to.")
+        moved = directory != self.directory
+        written = 0
+        entries = []
+        for key in sorted(self._partitions):
+            partition = self._partitions[key]
+            weight, bucket = key
+            file_name = os.path.join(quote(weight, safe=""), f"{bucket}.matches")
+            if partition.dirty or moved:
+                path = os.path.join(directory, file_name)
+                blob = zlib.compress(pickle.dumps(list(partition.collection), pickle.HIGHEST_PROTOCOL))
+                _write_atomic(path, blob)
+                partition.path, partition.dirty = path, False
+                written += 1
+            entries.append(dict(weight=weight, bucket=bucket, file=file_name, stats=partition.stats.to_dict()))
+        manifest = dict(granularity=self.granularity, partitions=entries)
+        _write_atomic(os.path.join(directory, MANIFEST), json.dumps(manifest, indent=1).encode())
+        self.directory = directory
+        return written
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
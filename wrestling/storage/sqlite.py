@@ -0,0 +1,537 @@
+#! /usr/bin/python
+
+"""Module for the SQLite storage backend.
+
+This module persists Matches to a normalized SQLite schema (wrestlers, events,
+matches and scoring events).  Inserts are batched with `executemany` inside a
+single transaction and reuse one connection per store.  Queries stream rows
+from an indexed `matches` table and return StoredMatch records whose scoring
+events are only read from the database when first accessed.
+
+Example:
+    >>>with SQLiteStore("season.db") as store:
+    >>>    store.insert_matches(matches)
+    >>>    for record in store.select(weight="165"):
+    >>>        print(record.focus_name, record.mov)
+
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base
+from wrestling.events import Event
+from wrestling.matches import Match, match_class, score_time_series
+from wrestling.scoring import LazyTimeSeries, ScoreSummary, ScoringEvent, scoring_class
+from wrestling.sequence import isvalid_sequence
+from wrestling.wrestlers import Wrestler
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wrestlers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    team TEXT NOT NULL,
+    grade_int INTEGER NOT NULL DEFAULT -1,
+    UNIQUE (name, team)
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    UNIQUE (name, kind)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    match_id TEXT NOT NULL,
+    level TEXT NOT NULL,
+    base_url TEXT,
+    event_id INTEGER NOT NULL REFERENCES events (id),
+    date TEXT NOT NULL,
+    date_is_datetime INTEGER NOT NULL,
+    result INTEGER NOT NULL,
+    overtime INTEGER NOT NULL,
+    focus_id INTEGER NOT NULL REFERENCES wrestlers (id),
+    opponent_id INTEGER NOT NULL REFERENCES wrestlers (id),
+    weight TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    focus_pts INTEGER NOT NULL,
+    opp_pts INTEGER NOT NULL,
+    td_diff INTEGER NOT NULL,
+    labels_valid INTEGER NOT NULL,
+    num_events INTEGER NOT NULL,
+    tech_index INTEGER NOT NULL,
+    focus_best INTEGER NOT NULL,
+    opp_best INTEGER NOT NULL,
+    focus_cautions INTEGER NOT NULL,
+    opp_cautions INTEGER NOT NULL,
+    last_scorer TEXT NOT NULL,
+    terminal TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scoring_events (
+    match_id INTEGER NOT NULL REFERENCES matches (id),
+    seq INTEGER NOT NULL,
+    time_stamp TEXT NOT NULL,
+    initiator TEXT NOT NULL,
+    focus_color TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (match_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_matches_weight_date ON matches (weight, date);
+CREATE INDEX IF NOT EXISTS ix_matches_date ON matches (date);
+CREATE INDEX IF NOT EXISTS ix_matches_event ON matches (event_id);
+CREATE INDEX IF NOT EXISTS ix_matches_focus ON matches (focus_id);
+CREATE INDEX IF NOT EXISTS ix_matches_opponent ON matches (opponent_id);
+"""
+"""str: DDL for the normalized schema, safe to run on an existing database."""
+
+
+_SELECT = """
+SELECT m.id, m.match_id, m.level, m.base_url, e.name, e.kind, m.date,
+       m.date_is_datetime, m.result, m.overtime, f.name, f.team, f.grade_int,
+       o.name, o.team, o.grade_int, m.weight, m.duration, m.focus_pts,
+       m.opp_pts, m.td_diff, m.labels_valid, m.num_events, m.tech_index,
+       m.focus_best, m.opp_best, m.focus_cautions, m.opp_cautions,
+       m.last_scorer, m.terminal
+FROM matches AS m
+JOIN events AS e ON e.id = m.event_id
+JOIN wrestlers AS f ON f.id = m.focus_id
+JOIN wrestlers AS o ON o.id = m.opponent_id
+"""
+
+
+def match_level(match: Match) -> str:
+    """Storage level of a match, the name of its ruleset.
+
+    Args:
+        match: Match instance.
+
+    Raises:
+        TypeError: Not a Match instance.
+
+    Returns:
+        str: Registered ruleset name, e.g. 'college' or 'high school'.
+
+    """
+    if not isinstance(match, Match):
+        raise TypeError(f"Expected a `Match` instance, got {type(match)!r}.")
+    return match.ruleset.name
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class StoredMatch(object):
+    """Lightweight record of a match read from a SQLiteStore.
+
+    The ScoreSummary fields are read with the row; the scoring events are
+    only fetched when `time_series` or `to_match` is first used.
+
+    """
+
+    store: "SQLiteStore" = attr.ib(repr=False)
+    rowid: int = attr.ib(repr=False)
+    id: str = attr.ib(repr=False)
+    level: str = attr.ib()
+    base_url: Optional[str] = attr.ib(repr=False)
+    event: Event = attr.ib(repr=lambda x: x.name)
+    date: Union[str, datetime] = attr.ib(repr=False)
+    result: base.Result = attr.ib(repr=lambda x: x.text)
+    overtime: bool = attr.ib(repr=False)
+    focus: Wrestler = attr.ib(repr=lambda x: x.name)
+    opponent: Wrestler = attr.ib(repr=lambda x: x.name)
+    weight: str = attr.ib()
+    duration: int = attr.ib(repr=False)
+    focus_pts: int = attr.ib(repr=False)
+    opp_pts: int = attr.ib(repr=False)
+    td_diff: int = attr.ib(repr=False)
+    labels_valid: bool = attr.ib(repr=False)
+    num_events: int = attr.ib(repr=False)
+    tech_index: int = attr.ib(default=-1, repr=False)
+    focus_best: int = attr.ib(default=0, repr=False)
+    opp_best: int = attr.ib(default=0, repr=False)
+    focus_cautions: int = attr.ib(default=0, repr=False)
+    opp_cautions: int = attr.ib(default=0, repr=False)
+    last_scorer: str = attr.ib(default="", repr=False)
+    terminal: str = attr.ib(default="", repr=False)
+    _time_series: Optional[Tuple] = attr.ib(default=None, init=False, repr=False)
+
+    @property
+    def mov(self) -> int:
+        """Margin of Victory.
+
+        Returns:
+            int: Difference between focus_points and opponent_points
+
+        """
+        return self.focus_pts - self.opp_pts
+
+    @property
+    def summary(self) -> ScoreSummary:
+        """ScoreSummary of the stored time series, without reading it."""
+        return ScoreSummary(
+            focus_pts=self.focus_pts,
+            opp_pts=self.opp_pts,
+            td_diff=self.td_diff,
+            labels_valid=self.labels_valid,
+            length=self.num_events,
+            tech_index=self.tech_index,
+            focus_best=self.focus_best,
+            opp_best=self.opp_best,
+            focus_cautions=self.focus_cautions,
+            opp_cautions=self.opp_cautions,
+            last_scorer=self.last_scorer,
+            terminal=self.terminal,
+        )
+
+    @property
+    def time_series(self) -> Tuple[ScoringEvent]:
+        """Scoring events as entered, loaded from the store on first access.
+
+        Returns:
+            Tuple: Scoring events, without the leading 'START' event.
+
+        """
+        if self._time_series is None:
+            self._time_series = self.store.load_time_series(self.rowid, self.level)
+        return self._time_series
+
+    def to_match(self, lazy: bool = False) -> Match:
+        """Rebuilds the Match instance.
+
+        Args:
+            lazy: If True, the match gets a LazyTimeSeries backed by the store
+                and built from the stored summary, so no scoring events are
+                read until the time series is used.
+
+        Returns:
+            Match: CollegeMatch or HSMatch instance.
+
+        """
+        match_cls = match_class(self.level)
+        if lazy and self._time_series is None:
+            time_series = LazyTimeSeries(
+                loader=lambda: self.store.load_scored_time_series(self.rowid, self.level),
+                summary=self.summary,
+            )
+        else:
+            time_series = self.time_series
+        return match_cls(
+            id=self.id,
+            base_url=self.base_url,
+            event=Event(name=self.event.name, kind=base.Mark(self.event.kind)),
+            date=self.date,
+            result=self.result,
+            overtime=self.overtime,
+            focus=self.focus,
+            opponent=self.opponent,
+            weight=base.Mark(self.weight),
+            duration=self.duration,
+            time_series=time_series,
+        )
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class SQLiteStore(object):
+    """SQLite backed match store.
+
+    A store owns one connection for its lifetime; use it as a context
+    manager or call `close` when done.
+
+    Args:
+        path (str): Database file path, defaults to an in-memory database.
+
+    """
+
+    path: str = attr.ib(default=":memory:", validator=instance_of(str))
+    connection: sqlite3.Connection = attr.ib(init=False, repr=False)
+    _wrestler_ids: Dict[Tuple[str, str], Tuple[int, int]] = attr.ib(init=False, factory=dict, repr=False)
+    _event_ids: Dict[Tuple[str, str], int] = attr.ib(init=False, factory=dict, repr=False)
+
+    def __attrs_post_init__(self):
+        """Post init function to open the connection and create the schema."""
+        self.connection = sqlite3.connect(self.path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying connection."""
+        self.connection.close()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager wrapping statements in a single transaction.
+
+        On rollback the cached wrestler and event ids are dropped, since rows
+        inserted in the transaction no longer exist.
+
+        """
+        self.connection.execute("BEGIN")
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            self._wrestler_ids.clear()
+            self._event_ids.clear()
+            raise
+        else:
+            self.connection.execute("COMMIT")
+
+    def _wrestler_id(self, wrestler: Wrestler) -> int:
+        # the latest known grade wins, an unknown grade (-1) never overwrites one
+        key = (wrestler.name, wrestler.team)
+        cached = self._wrestler_ids.get(key)
+        if cached is None or (wrestler.grade_int != -1 and cached[1] != wrestler.grade_int):
+            self.connection.execute(
+                "INSERT INTO wrestlers (name, team, grade_int) VALUES (?, ?, ?) "
+                "ON CONFLICT (name, team) DO UPDATE SET grade_int = excluded.grade_int "
+                "WHERE excluded.grade_int != -1",
+                (wrestler.name, wrestler.team, wrestler.grade_int),
+            )
+            cached = self._wrestler_ids[key] = self.connection.execute(
+                "SELECT id, grade_int FROM wrestlers WHERE name = ? AND team = ?", key
+            ).fetchone()
+        return cached[0]
+
+    def _event_id(self, event: Event) -> int:
+        key = (event.name, event.kind)
+        if key not in self._event_ids:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO events (name, kind) VALUES (?, ?)", key
+            )
+            if not cursor.rowcount:
+                cursor = self.connection.execute(
+                    "SELECT id FROM events WHERE name = ? AND kind = ?", key
+                )
+                self._event_ids[key] = cursor.fetchone()[0]
+            else:
+                self._event_ids[key] = cursor.lastrowid
+        return self._event_ids[key]
+
+    def insert_matches(self, matches: Iterable[Match], batch_size: int = 5000) -> int:
+        """Bulk inserts matches in one transaction.
+
+        Rows are accumulated and written with `executemany` every
+        `batch_size` matches, so arbitrarily long iterables are inserted in
+        bounded memory.  Wrestlers are stored once per (name, team) with the
+        latest known grade, which every match of the wrestler then reads.
+
+        Args:
+            matches: CollegeMatch or HSMatch instances.
+            batch_size: Number of matches per executemany batch.
+
+        Raises:
+            TypeError: Items must be Match instances, nothing is inserted.
+
+        Returns:
+            int: Number of matches inserted.
+
+        """
+        count = 0
+        with self.transaction() as conn:
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM matches").fetchone()[0]
+            match_rows: List[Tuple] = []
+            event_rows: List[Tuple] = []
+            for match in matches:
+                rowid = next_id + count
+                level = match_level(match)
+                summary = match.score_summary
+                match_rows.append(
+                    (
+                        rowid,
+                        match._id,
+                        level,
+                        match.base_url,
+                        self._event_id(match.event),
+                        match.date.isoformat() if isinstance(match.date, datetime) else match.date,
+                        isinstance(match.date, datetime),
+                        match.result.value,
+                        match.overtime,
+                        self._wrestler_id(match.focus),
+                        self._wrestler_id(match.opponent),
+                        match.weight,
+                        match.duration,
+                        summary.focus_pts,
+                        summary.opp_pts,
+                        summary.td_diff,
+                        summary.labels_valid,
+                        summary.length,
+                        summary.tech_index,
+                        summary.focus_best,
+                        summary.opp_best,
+                        summary.focus_cautions,
+                        summary.opp_cautions,
+                        summary.last_scorer,
+                        summary.terminal,
+                    )
+                )
+                # skip the 'START' event every match inserts on construction
+                event_rows.extend(
+                    (
+                        rowid,
+                        seq,
+                        str(score.time_stamp),
+                        score.initiator,
+                        score.focus_color,
+                        score.period,
+                        str(score.label.tag),
+                    )
+                    for seq, score in enumerate(match.time_series[1:])
+                )
+                count += 1
+                if len(match_rows) >= batch_size:
+                    self._flush(match_rows, event_rows)
+            self._flush(match_rows, event_rows)
+        return count
+
+    def _flush(self, match_rows: List[Tuple], event_rows: List[Tuple]) -> None:
+        self.connection.executemany(
+            "INSERT INTO matches VALUES (" + ", ".join("?" * 25) + ")", match_rows
+        )
+        self.connection.executemany(
+            "INSERT INTO scoring_events VALUES (?, ?, ?, ?, ?, ?, ?)", event_rows
+        )
+        match_rows.clear()
+        event_rows.clear()
+
+    def select(
+        self,
+        weight: Optional[str] = None,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+        event: Optional[str] = None,
+        wrestler: Optional[str] = None,
+        result: Optional[base.Result] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[StoredMatch]:
+        """Streams matching matches from the store, ordered by date.
+
+        Args:
+            weight: Weight class.
+            start: Inclusive lower date bound.
+            end: Inclusive upper date bound.
+            event: Event name.
+            wrestler: Name of either the focus or the opponent.
+            result: Result from the focus perspective.
+            limit: Maximum number of rows.
+
+        Returns:
+            Iterator[StoredMatch]: Records with lazily loaded time series.
+
+        """
+        clauses, params = [], []
+        if weight is not None:
+            clauses.append("m.weight = ?")
+            params.append(str(weight))
+        if start is not None:
+            clauses.append("m.date >= ?")
+            params.append(start.isoformat() if isinstance(start, datetime) else start)
+        if end is not None:
+            clauses.append("m.date <= ?")
+            params.append(end.isoformat() if isinstance(end, datetime) else end)
+        if event is not None:
+            clauses.append("e.name = ?")
+            params.append(event.title().strip())
+        if wrestler is not None:
+            clauses.append("(f.name = ? OR o.name = ?)")
+            params.extend([wrestler.title().strip()] * 2)
+        if result is not None:
+            clauses.append("m.result = ?")
+            params.append(int(result))
+        sql = _SELECT
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY m.date, m.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        for row in self.connection.execute(sql, params):
+            yield self._record(row)
+
+    def _record(self, row: Tuple) -> StoredMatch:
+        return StoredMatch(
+            store=self,
+            rowid=row[0],
+            id=row[1],
+            level=row[2],
+            base_url=row[3],
+            event=Event(name=row[4], kind=base.Mark(row[5])),
+            date=datetime.fromisoformat(row[6]) if row[7] else row[6],
+            result=base.Result(row[8]),
+            overtime=bool(row[9]),
+            focus=Wrestler(name=row[10], team=row[11], grade_int=row[12]),
+            opponent=Wrestler(name=row[13], team=row[14], grade_int=row[15]),
+            weight=row[16],
+            duration=row[17],
+            focus_pts=row[18],
+            opp_pts=row[19],
+            td_diff=row[20],
+            labels_valid=bool(row[21]),
+            num_events=row[22],
+            tech_index=row[23],
+            focus_best=row[24],
+            opp_best=row[25],
+            focus_cautions=row[26],
+            opp_cautions=row[27],
+            last_scorer=row[28],
+            terminal=row[29],
+        )
+
+    def load_time_series(self, rowid: int, level: str) -> Tuple[ScoringEvent]:
+        """Reads the scoring events of one stored match.
+
+        Args:
+            rowid: Internal match row id.
+            level: Registered ruleset name.
+
+        Returns:
+            Tuple: Scoring events in their stored order.
+
+        """
+        scoring_cls, label_cls = scoring_class(level), base.label_class(level)
+        rows = self.connection.execute(
+            "SELECT time_stamp, initiator, focus_color, period, label "
+            "FROM scoring_events WHERE match_id = ? ORDER BY seq",
+            (rowid,),
+        )
+        return tuple(
+            scoring_cls(
+                time_stamp=time_stamp,
+                initiator=initiator,
+                focus_color=focus_color,
+                period=period,
+                label=label_cls(label),
+            )
+            for time_stamp, initiator, focus_color, period, label in rows
+        )
+
+    def load_scored_time_series(
+        self, rowid: int, level: str
+    ) -> Tuple[ScoringEvent]:
+        """Reads, validates and scores the events of one stored match.
+
+        Args:
+            rowid: Internal match row id.
+            level: Registered ruleset name.
+
+        Returns:
+            Tuple: Events as a constructed match stores them, 'START' first.
+
+        """
+        time_series = self.load_time_series(rowid, level)
+        isvalid_sequence(level, time_series)
+        return score_time_series(time_series, scoring_class(level), base.label_class(level))
+
+    def count(self) -> int:
+        """Number of stored matches."""
+        return self.connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
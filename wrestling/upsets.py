@@ -0,0 +1,281 @@
+#! /usr/bin/python
+
+"""Module for detecting upsets and bonus-point surprises.
+
+An UpsetDetector turns completed matches into Outcomes by comparing each
+Result with the pre-match expectation of a pluggable rating source, any
+callable mapping a Wrestler to a rating (None if unrated), as used by
+`event_index.EventIndex`.  Rating gaps become win probabilities through a
+logistic curve whose `scale` is the gap at which the better rated wrestler
+wins 10 times in 11, so it must match the units of the source (about 400
+for Elo, a few points for least-squares margins, about 4 for seeds).
+
+Sources with an `update(match)` method (like EloRatings) are updated after
+each outcome is emitted, so expectations are always read before the match.
+`stream` processes a live feed one match at a time; `backfill` replays a
+history in date order.
+
+Example:
+    >>>detector = UpsetDetector(EloRatings())
+    >>>detector.backfill(last_season)
+    >>>for outcome in detector.stream(live_results):
+    >>>    if outcome.upset:
+    >>>        print(outcome.winner.name, round(outcome.win_probability, 2))
+
+"""
+
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import attr
+
+from wrestling import base
+from wrestling.event_index import Rating
+from wrestling.matches import Match
+from wrestling.wrestlers import Wrestler
+
+DECISION_POINTS = 3
+"""int: Team points of a decision, the baseline for bonus surprises."""
+
+
+def win_probability(rating: float, other: float, scale: float = 400.0) -> float:
+    """Expected probability of the first wrestler winning.
+
+    Args:
+        rating: Rating of the wrestler.
+        other: Rating of the opponent.
+        scale: Rating gap giving 10 to 1 odds.
+
+    Returns:
+        float: Probability in (0, 1).
+
+    """
+    exponent = (other - rating) / scale
+    if exponent > 300:
+        return 0.0
+    return 1.0 / (1.0 + 10.0 ** exponent)
+
+
+def from_mapping(ratings: Mapping[Wrestler, float]) -> Rating:
+    """Rating source reading a mapping, e.g. built from `ScheduleGraph.ratings`."""
+    return ratings.get
+
+
+def from_seeds(seeds: Mapping[Wrestler, int]) -> Rating:
+    """Rating source from tournament seeds, a lower seed rates higher."""
+
+    def rating(wrestler: Wrestler) -> Optional[float]:
+        seed = seeds.get(wrestler)
+        return None if seed is None else -float(seed)
+
+    return rating
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class EloRatings(object):
+    """Elo ratings updated from every processed match.
+
+    Args:
+        initial (float): Rating of unseen wrestlers, defaults to 1500.
+        k (float): Update step, defaults to 32.
+        scale (float): Logistic scale, defaults to 400.
+        bonus_weight (float): Extra step share per team point beyond a
+            decision, defaults to 0.1.
+
+    """
+
+    initial: float = attr.ib(default=1500.0)
+    k: float = attr.ib(default=32.0)
+    scale: float = attr.ib(default=400.0)
+    bonus_weight: float = attr.ib(default=0.1)
+    ratings: Dict[Wrestler, float] = attr.ib(init=False, factory=dict, repr=lambda x: f"{len(x)} wrestlers")
+
+    def __call__(self, wrestler: Wrestler) -> float:
+        return self.ratings.get(wrestler, self.initial)
+
+    def update(self, match: Match) -> None:
+        """Moves both ratings towards the result of a match.
+
+        No contests are ignored.
+
+        Args:
+            match: Completed match.
+
+        """
+        result = match.result
+        if not result.value:
+            return
+        focus, opponent = self(match.focus), self(match.opponent)
+        expected = win_probability(focus, opponent, self.scale)
+        bonus = base.Result(abs(result.value)).team_points - DECISION_POINTS
+        step = self.k * (1 + self.bonus_weight * bonus)
+        delta = step * ((result.value > 0) - expected)
+        self.ratings[match.focus] = focus + delta
+        self.ratings[match.opponent] = opponent - delta
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class Outcome(object):
+    """Completed match compared with its pre-match expectation.
+
+    Args:
+        match (Match): The match.
+        winner (Wrestler): Winning wrestler.
+        loser (Wrestler): Losing wrestler.
+        win_probability (Optional[float]): Pre-match probability of the
+            winner winning, None if either wrestler was unrated.
+        upset_score (float): 0 if the favorite won, rising to 1 as the
+            winner's probability approaches 0.
+        bonus_surprise (float): Team points beyond a decision, weighted by
+            how unlikely the win was (0 for decisions).
+
+    """
+
+    match: Match = attr.ib(repr=False)
+    winner: Wrestler = attr.ib(repr=lambda x: x.name)
+    loser: Wrestler = attr.ib(repr=lambda x: x.name)
+    win_probability: Optional[float] = attr.ib()
+    upset_score: float = attr.ib(default=0.0)
+    bonus_surprise: float = attr.ib(default=0.0)
+
+    @property
+    def rated(self) -> bool:
+        """Whether both wrestlers had ratings."""
+        return self.win_probability is not None
+
+    @property
+    def upset(self) -> bool:
+        """Whether the less likely wrestler won."""
+        return self.upset_score > 0
+
+    def to_dict(self) -> Dict:
+        """Creates a dictionary representation of the outcome."""
+        return dict(
+            winner=self.winner.name,
+            winner_team=self.winner.team,
+            loser=self.loser.name,
+            loser_team=self.loser.team,
+            result=base.Result(abs(self.match.result.value)).name,
+            win_probability=self.win_probability,
+            upset_score=self.upset_score,
+            bonus_surprise=self.bonus_surprise,
+        )
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class UpsetDetector(object):
+    """Pipeline stage scoring completed matches against expectations.
+
+    Args:
+        rating (Rating): Rating source; updated after each match if it has
+            an `update(match)` method.
+        scale (Optional[float]): Logistic scale, defaults to the source's
+            `scale` attribute or 400.
+        threshold (float): Minimum upset score reported by `upsets`,
+            defaults to 0.
+
+    Raises:
+        ValueError: `scale` must be positive.
+
+    """
+
+    rating: Rating = attr.ib(repr=False)
+    scale: float = attr.ib(
+        default=attr.Factory(lambda self: getattr(self.rating, "scale", 400.0), takes_self=True),
+        converter=float,
+    )
+    threshold: float = attr.ib(default=0.0, converter=float)
+    processed: int = attr.ib(init=False, default=0)
+    _update: Optional[Callable[[Match], None]] = attr.ib(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        """Binds the update hook of the rating source, if any."""
+        self._update = getattr(self.rating, "update", None)
+
+    @scale.validator
+    def check_scale(self, attribute, value):
+        """Validates that the scale is positive and finite."""
+        if not math.isfinite(value) or value <= 0:
+            raise ValueError(f"`scale` must be positive, got {value}.")
+
+    def process(self, match: Match) -> Optional[Outcome]:
+        """Scores one completed match.
+
+        Args:
+            match: Completed match.
+
+        Returns:
+            Optional[Outcome]: Outcome, None for a no contest.
+
+        """
+        value = match.result.value
+        self.processed += 1
+        if not value:
+            if self._update is not None:
+                self._update(match)
+            return None
+        if value > 0:
+            winner, loser = match.focus, match.opponent
+        else:
+            winner, loser = match.opponent, match.focus
+        winner_rating, loser_rating = self.rating(winner), self.rating(loser)
+        if winner_rating is None or loser_rating is None:
+            outcome = Outcome(match=match, winner=winner, loser=loser, win_probability=None)
+        else:
+            probability = win_probability(winner_rating, loser_rating, self.scale)
+            bonus = base.Result(abs(value)).team_points - DECISION_POINTS
+            outcome = Outcome(
+                match=match,
+                winner=winner,
+                loser=loser,
+                win_probability=probability,
+                upset_score=max(0.0, 1.0 - 2.0 * probability),
+                bonus_surprise=bonus * (1.0 - probability),
+            )
+        if self._update is not None:
+            self._update(match)
+        return outcome
+
+    def stream(self, matches: Iterable[Match]) -> Iterator[Outcome]:
+        """Scores matches as they arrive, skipping no contests.
+
+        Args:
+            matches: Completed matches, in the order they finished.
+
+        Returns:
+            Iterator[Outcome]: Outcomes, in input order.
+
+        """
+        for match in matches:
+            outcome = self.process(match)
+            if outcome is not None:
+                yield outcome
+
+    def backfill(self, matches: Iterable[Match]) -> List[Outcome]:
+        """Scores a history in date order, e.g. to warm up an updating source.
+
+        Args:
+            matches: Completed matches, in any order.
+
+        Returns:
+            List[Outcome]: Outcomes, in date order.
+
+        """
+        ordered = sorted(matches, key=lambda match: base.date_key(match.date))
+        return list(self.stream(ordered))
+
+    def upsets(self, matches: Iterable[Match]) -> Iterator[Outcome]:
+        """Scores matches and yields only upsets above the threshold."""
+        for outcome in self.stream(matches):
+            if outcome.upset_score > self.threshold:
+                yield outcome
+
+
+def upset_rate(outcomes: Iterable[Outcome]) -> float:
+    """Share of rated outcomes won by the underdog."""
+    rated = upsets = 0
+    for outcome in outcomes:
+        if outcome.rated:
+            rated += 1
+            upsets += outcome.upset
+    return upsets / rated if rated else 0.0
@@ -0,0 +1,378 @@
+#! /usr/bin/python
+
+"""Module for batch validation of raw match records.
+
+Constructing Matches validates them piecemeal: invalid Marks set `isvalid`
+and `msg` on each object, invalid matches collect `invalid_messages`, and
+some errors (unsorted time series, overtime on a tech) raise and abort bulk
+loads.  `validate_records` instead checks raw records directly against the
+ruleset tables in one pass, never raises, and collects every problem into a
+columnar ValidationReport of (record index, event index, field, code) rows.
+Fields and codes are interned as small integers and messages are looked up
+from the code, so a report for a million-event feed stays compact and the
+match objects are never built.
+
+A raw record is a mapping using the `Match.to_dict()` field names::
+
+    {
+        "id": "abc", "ruleset": "college", "event_name": "Fun One",
+        "event_type": "Dual Meet", "date": "2020-01-01", "result": "WD",
+        "overtime": False, "focus_name": "Nick Anthony", "focus_team": "Eagles",
+        "opp_name": "John Smith", "opp_team": "Hawks", "weight": "165",
+        "time_series": [
+            {"time_stamp": "00:00:10", "initiator": "red",
+             "focus_color": "red", "period": 1, "label": "T2"},
+        ],
+    }
+
+'ruleset' (defaults to 'college'), 'overtime', 'duration' and 'base_url'
+are optional.  `build_match` constructs the Match of a record.
+
+Example:
+    >>>report = validate_records(records)
+    >>>report.counts()
+    Counter({'invalid_label': 3, 'invalid_weight': 1})
+    >>>matches = [build_match(records[i]) for i in report.valid_indices()]
+
+"""
+
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import attr
+
+from wrestling import base, rulesets
+from wrestling.events import Event
+from wrestling.matches import Match, check_result, match_class
+from wrestling.scoring import scoring_class, summarize
+from wrestling.wrestlers import Wrestler
+
+MESSAGES = dict(
+    malformed="Record could not be read.",
+    missing_field="Required field is missing.",
+    invalid_type="Field has the wrong type.",
+    unknown_ruleset="Ruleset is not registered.",
+    invalid_result="Result is not a Result name or value.",
+    overtime_tech="Overtime must be false if match resulted in Tech.",
+    invalid_weight="Invalid weight class.",
+    invalid_event_type="Invalid event type.",
+    invalid_color="Color must be 'red' or 'green'.",
+    invalid_time_stamp="Time stamp must be 'HH:MM:SS' with a zero hour.",
+    invalid_period="Period must be an integer.",
+    invalid_label="Invalid time-series label.",
+    invalid_sequence="Label is not a valid move in the current position.",
+    unsorted_time_series="Time series is not sorted chronologically.",
+    result_inconsistent="Result inconsistent with time-series.",
+)
+"""dict[str, str]: Error codes and their messages."""
+
+CODES = tuple(MESSAGES)
+"""tuple[str]: Error codes, the report stores their positions."""
+
+FIELDS = (
+    "record", "id", "ruleset", "event_name", "event_type", "date", "result", "overtime",
+    "focus_name", "focus_team", "opp_name", "opp_team", "weight", "duration", "time_series",
+)
+"""tuple[str]: Record fields, the report stores their positions."""
+
+REQUIRED_FIELDS = (
+    "id", "event_name", "event_type", "date", "result",
+    "focus_name", "focus_team", "opp_name", "opp_team", "weight", "time_series",
+)
+"""tuple[str]: Fields every record must have."""
+
+_CODE = {code: i for i, code in enumerate(CODES)}
+_FIELD = {field: i for i, field in enumerate(FIELDS)}
+_STRING_FIELDS = ("id", "event_name", "event_type", "focus_name", "focus_team", "opp_name", "opp_team")
+_EVENT_TYPES = frozenset(("Tournament", "Dual Meet"))
+_RESULTS = {**{result.name: result for result in base.Result}, **{r.value: r for r in base.Result}}
+_COLORS = frozenset(("red", "green"))
+_TECHS = frozenset((base.Result.WT, base.Result.LT))
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class _RawLabel(object):
+    tag: Any
+    point_value: int
+    isvalid: bool
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class _RawScore(object):
+    # the attributes `summarize` reads from a ScoringEvent
+    label: _RawLabel
+    initiator: str
+    focus_color: str
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class ValidationReport(object):
+    """Columnar report of validation errors.
+
+    Each row is one error; `events` is -1 for record level errors.
+
+    Args:
+        total (int): Number of records validated.
+        invalid (int): Number of records with at least one error.
+        indices (array): Record index per row.
+        events (array): Time series event index per row.
+        fields (array): Position in FIELDS per row.
+        codes (array): Position in CODES per row.
+
+    """
+
+    total: int = attr.ib(default=0)
+    invalid: int = attr.ib(default=0)
+    indices: array = attr.ib(factory=lambda: array("l"), repr=False)
+    events: array = attr.ib(factory=lambda: array("l"), repr=False)
+    fields: array = attr.ib(factory=lambda: array("B"), repr=False)
+    codes: array = attr.ib(factory=lambda: array("B"), repr=False)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def valid(self) -> int:
+        """Number of records without errors."""
+        return self.total - self.invalid
+
+    def add(self, index: int, field: str, code: str, event: int = -1) -> None:
+        """Adds one error row.
+
+        Args:
+            index: Record index.
+            field: Field name from FIELDS.
+            code: Error code from CODES.
+            event: Time series event index, -1 for record level errors.
+
+        """
+        if not self.indices or self.indices[-1] != index:
+            self.invalid += 1
+        self.indices.append(index)
+        self.events.append(event)
+        self.fields.append(_FIELD[field])
+        self.codes.append(_CODE[code])
+
+    def rows(self) -> Iterator[Tuple[int, int, str, str, str]]:
+        """Iterates over the errors.
+
+        Returns:
+            Iterator[Tuple]: (record index, event index, field, code, message).
+
+        """
+        for index, event, field, code in zip(self.indices, self.events, self.fields, self.codes):
+            yield index, event, FIELDS[field], CODES[code], MESSAGES[CODES[code]]
+
+    def counts(self) -> Counter:
+        """Number of errors per code."""
+        return Counter({CODES[code]: count for code, count in Counter(self.codes).items()})
+
+    def invalid_indices(self) -> List[int]:
+        """Indices of the records with errors, ascending."""
+        return sorted(set(self.indices))
+
+    def valid_indices(self) -> Iterator[int]:
+        """Indices of the records without errors, ascending."""
+        invalid = set(self.indices)
+        return (index for index in range(self.total) if index not in invalid)
+
+    def to_columns(self) -> Dict[str, List]:
+        """Errors as column lists.
+
+        Returns:
+            Dict[str, List]: 'index', 'event', 'field', 'code' and 'message'.
+
+        """
+        codes = [CODES[code] for code in self.codes]
+        return dict(
+            index=self.indices.tolist(),
+            event=self.events.tolist(),
+            field=[FIELDS[field] for field in self.fields],
+            code=codes,
+            message=[MESSAGES[code] for code in codes],
+        )
+
+
+def validate_records(
+    records: Iterable[Mapping[str, Any]], default_ruleset: str = "college"
+) -> ValidationReport:
+    """Validates raw match records without building or raising.
+
+    Args:
+        records: Raw records, consumed once.
+        default_ruleset: Ruleset of records without a 'ruleset' field.
+
+    Returns:
+        ValidationReport: Every error found.
+
+    """
+    report = ValidationReport()
+    for index, record in enumerate(records):
+        try:
+            validate_record(record, index, report, default_ruleset)
+        except Exception:
+            report.add(index, "record", "malformed")
+        report.total += 1
+    return report
+
+
+def validate_record(
+    record: Mapping[str, Any],
+    index: int,
+    report: ValidationReport,
+    default_ruleset: str = "college",
+) -> None:
+    """Validates one raw record, adding its errors to a report.
+
+    Args:
+        record: Raw record.
+        index: Index reported for its errors.
+        report: Report collecting the errors.
+        default_ruleset: Ruleset if the record has no 'ruleset' field.
+
+    """
+    add = report.add
+    if not isinstance(record, Mapping):
+        add(index, "record", "malformed")
+        return
+    for field in REQUIRED_FIELDS:
+        if field not in record:
+            add(index, field, "missing_field")
+    for field in _STRING_FIELDS:
+        if field in record and not isinstance(record[field], str):
+            add(index, field, "invalid_type")
+    if "date" in record and not isinstance(record["date"], (datetime, str)):
+        add(index, "date", "invalid_type")
+    overtime = record.get("overtime", False)
+    if not isinstance(overtime, bool):
+        add(index, "overtime", "invalid_type")
+    if not isinstance(record.get("duration", 0), int):
+        add(index, "duration", "invalid_type")
+    if isinstance(record.get("event_type"), str) and record["event_type"] not in _EVENT_TYPES:
+        add(index, "event_type", "invalid_event_type")
+    weight = record.get("weight")
+    if weight is not None and not str(weight).isdigit():
+        add(index, "weight", "invalid_weight")
+
+    result = None
+    if "result" in record:
+        result = _RESULTS.get(record["result"])
+        if result is None:
+            add(index, "result", "invalid_result")
+        elif overtime is True and result in _TECHS:
+            add(index, "overtime", "overtime_tech")
+
+    try:
+        ruleset = rulesets.get_ruleset(record.get("ruleset", default_ruleset))
+    except ValueError:
+        add(index, "ruleset", "unknown_ruleset")
+        return
+    time_series = record.get("time_series")
+    if time_series is None:
+        return
+    if not isinstance(time_series, (list, tuple)):
+        add(index, "time_series", "invalid_type")
+        return
+
+    scores = _check_time_series(time_series, index, report, ruleset)
+    if scores is not None and result is not None:
+        summary = summarize(scores, ruleset)
+        if not check_result(result, summary, ruleset):
+            add(index, "result", "result_inconsistent")
+
+
+def _check_time_series(
+    time_series: List[Mapping[str, Any]],
+    index: int,
+    report: ValidationReport,
+    ruleset: rulesets.Ruleset,
+) -> Optional[List[_RawScore]]:
+    add = report.add
+    points, moves, transitions = ruleset.points, ruleset.moves, ruleset.transitions
+    position = "neutral"
+    previous = None
+    last = len(time_series) - 1
+    scores = []
+    for i, event in enumerate(time_series):
+        if not isinstance(event, Mapping):
+            add(index, "time_series", "malformed", i)
+            return None
+        time_stamp = event.get("time_stamp")
+        if str(time_stamp).split(":")[0] != "00":
+            add(index, "time_series", "invalid_time_stamp", i)
+        elif previous is not None and previous > str(time_stamp):
+            add(index, "time_series", "unsorted_time_series", i)
+        previous = str(time_stamp)
+        initiator, focus_color = event.get("initiator"), event.get("focus_color")
+        if initiator not in _COLORS or focus_color not in _COLORS:
+            add(index, "time_series", "invalid_color", i)
+            return None
+        if not isinstance(event.get("period"), int):
+            add(index, "time_series", "invalid_period", i)
+        tag = event.get("label")
+        valid = tag in points
+        formatted = f"{'f' if initiator == focus_color else 'o'}{tag}"
+        if not valid:
+            add(index, "time_series", "invalid_label", i)
+        # like `isvalid_sequence`, the last event is not position checked
+        elif i < last and formatted not in moves[position]:
+            add(index, "time_series", "invalid_sequence", i)
+            valid = False
+        position = transitions[position].get(formatted, position)
+        scores.append(
+            _RawScore(
+                label=_RawLabel(tag=tag, point_value=points.get(tag, 0), isvalid=valid),
+                initiator=initiator,
+                focus_color=focus_color,
+            )
+        )
+    return scores
+
+
+def build_match(record: Mapping[str, Any], default_ruleset: str = "college") -> Match:
+    """Constructs the Match of a raw record.
+
+    Args:
+        record: Raw record, see the module documentation.
+        default_ruleset: Ruleset if the record has no 'ruleset' field.
+
+    Raises:
+        ValueError: Invalid record, see `validate_records` for a report
+            that does not raise.
+        TypeError: Invalid record.
+
+    Returns:
+        Match: Match of the record's ruleset.
+
+    """
+    ruleset = rulesets.get_ruleset(record.get("ruleset", default_ruleset))
+    scoring_cls, label_cls = scoring_class(ruleset), base.label_class(ruleset)
+    time_series = tuple(
+        scoring_cls(
+            time_stamp=event["time_stamp"],
+            initiator=event["initiator"],
+            focus_color=event["focus_color"],
+            period=event["period"],
+            label=label_cls(event["label"]),
+        )
+        for event in record["time_series"]
+    )
+    result = _RESULTS.get(record["result"])
+    if result is None:
+        raise ValueError(f"Expected `result` to be a Result name or value, got {record['result']!r}.")
+    optional = {
+        field: record[field] for field in ("base_url", "overtime", "duration") if field in record
+    }
+    return match_class(ruleset)(
+        id=record["id"],
+        event=Event(name=record["event_name"], kind=base.Mark(record["event_type"])),
+        date=record["date"],
+        result=result,
+        focus=Wrestler(name=record["focus_name"], team=record["focus_team"]),
+        opponent=Wrestler(name=record["opp_name"], team=record["opp_team"]),
+        weight=base.Mark(str(record["weight"])),
+        time_series=time_series,
+        **optional,
+    )
@@ -0,0 +1,270 @@
+#! /usr/bin/python
+
+"""Module for batch sequence validation over padded label-code matrices.
+
+`isvalid_sequence` walks one time series at a time through ScoringEvent
+objects.  This module encodes many time series of a ruleset at once as a
+padded matrix of formatted label codes (code of the tag, times two, plus one
+for opponent actions) and a matrix of time stamps in microseconds, then runs
+the position state machine down the columns for all rows simultaneously
+using transition tables compiled from the ruleset.  The result is a per-event
+validity mask and a per-series sorted-order failure flag.
+
+NumPy is optional (`pip install wrestling[fast]`); without it the same
+tables drive a plain Python loop per series.
+
+Like `isvalid_sequence`, the last event of a series is not position checked.
+
+Example:
+    >>>report = validate_matches(archive)
+    >>>invalid = [match for match, ok in zip(archive, report.series_valid()) if not ok]
+
+"""
+
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import attr
+from attr.validators import instance_of
+
+from wrestling import base, rulesets
+from wrestling.matches import Match
+from wrestling.scoring import ScoringEvent
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+_POSITION = {position: i for i, position in enumerate(rulesets.POSITIONS)}
+_PAD_TIME = 2 ** 63 - 1
+
+
+@lru_cache(maxsize=None)
+def transition_tables(ruleset: rulesets.Ruleset) -> Tuple[Tuple, Tuple]:
+    """Validity and next-position tables of a ruleset.
+
+    Columns are formatted label codes (`2 * label_codes[tag]` for the focus,
+    plus one for the opponent), followed by a padding column (valid, no
+    move) and an unknown label column (invalid, no move).  Rows are
+    positions in `rulesets.POSITIONS` order.
+
+    Args:
+        ruleset: Compiled ruleset.
+
+    Returns:
+        Tuple: (valid, next position) tables indexed [position][code].
+
+    """
+    valid, moves = [], []
+    for position in rulesets.POSITIONS:
+        row_valid, row_next = [], []
+        for tag in ruleset.label_codes:
+            for prefix in "fo":
+                label = f"{prefix}{tag}"
+                row_valid.append(label in ruleset.moves[position])
+                row_next.append(_POSITION[ruleset.next_position(position, label)])
+        row_valid += [True, False]
+        row_next += [_POSITION[position]] * 2
+        valid.append(tuple(row_valid))
+        moves.append(tuple(row_next))
+    return tuple(valid), tuple(moves)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class EncodedBatch(object):
+    """Time series of one ruleset encoded as integer rows.
+
+    Args:
+        ruleset (Ruleset): Ruleset of every series.
+        codes (List[List[int]]): Formatted label codes per series.
+        times (List[List[int]]): Time stamps in microseconds per series, so
+            the sort check orders them exactly like `isvalid_sequence`.
+
+    """
+
+    ruleset: rulesets.Ruleset = attr.ib(validator=instance_of(rulesets.Ruleset), repr=lambda x: x.name)
+    codes: List[List[int]] = attr.ib(repr=lambda x: f"{len(x)} series")
+    times: List[List[int]] = attr.ib(repr=False)
+
+    @property
+    def pad_code(self) -> int:
+        """Code of padding cells."""
+        return 2 * len(self.ruleset.label_codes)
+
+    @property
+    def unknown_code(self) -> int:
+        """Code of labels unknown to the ruleset."""
+        return self.pad_code + 1
+
+    @property
+    def lengths(self) -> List[int]:
+        """Number of events per series."""
+        return [len(row) for row in self.codes]
+
+    def matrices(self):
+        """Padded NumPy matrices of the batch.
+
+        Raises:
+            ImportError: NumPy is not installed.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: (codes, times), padded
+            with `pad_code` and the largest 64 bit integer.
+
+        """
+        if numpy is None:
+            raise ImportError("Padded matrices require NumPy, `pip install wrestling[fast]`.")
+        width = max(self.lengths, default=0)
+        codes = numpy.full((len(self.codes), width), self.pad_code, dtype=numpy.int32)
+        times = numpy.full((len(self.codes), width), _PAD_TIME, dtype=numpy.int64)
+        for row, (row_codes, row_times) in enumerate(zip(self.codes, self.times)):
+            codes[row, : len(row_codes)] = row_codes
+            times[row, : len(row_times)] = row_times
+        return codes, times
+
+
+def encode(series: Iterable[Sequence[ScoringEvent]], ruleset: rulesets.Ruleset) -> EncodedBatch:
+    """Encodes time series of one ruleset.
+
+    Args:
+        series: Time series, without the 'START' event a Match prepends.
+        ruleset: Ruleset of every series.
+
+    Returns:
+        EncodedBatch: Encoded rows.
+
+    """
+    label_codes = ruleset.label_codes
+    unknown = 2 * len(label_codes) + 1
+    codes, times = [], []
+    for time_series in series:
+        row_codes, row_times = [], []
+        for score in time_series:
+            code = label_codes.get(score.label.tag)
+            if code is None:
+                row_codes.append(unknown)
+            else:
+                row_codes.append(2 * code + (score.initiator != score.focus_color))
+            row_times.append(base.microseconds_of(score.time_stamp))
+        codes.append(row_codes)
+        times.append(row_times)
+    return EncodedBatch(ruleset=ruleset, codes=codes, times=times)
+
+
+@attr.s(slots=True, eq=False, order=False, auto_attribs=True)
+class SequenceReport(object):
+    """Batch validation result.
+
+    Args:
+        valid (List[List[bool]]): Per event position validity, one row per
+            series (a padded boolean matrix when NumPy is used).
+        unsorted (List[bool]): Per series, whether time stamps decrease.
+        lengths (List[int]): Number of events per series.
+
+    """
+
+    valid: List[List[bool]] = attr.ib(repr=False)
+    unsorted: List[bool] = attr.ib(repr=False)
+    lengths: List[int] = attr.ib(repr=lambda x: f"{len(x)} series")
+
+    def series_valid(self) -> List[bool]:
+        """Per series, sorted and every event valid."""
+        return [
+            not unsorted and all(row[:length])
+            for row, unsorted, length in zip(self.valid, self.unsorted, self.lengths)
+        ]
+
+    def invalid_events(self) -> List[Tuple[int, int]]:
+        """(series index, event index) of every invalid event."""
+        return [
+            (i, j)
+            for i, (row, length) in enumerate(zip(self.valid, self.lengths))
+            for j in range(length)
+            if not row[j]
+        ]
+
+
+def validate_batch(batch: EncodedBatch) -> SequenceReport:
+    """Runs the position state machine over every series of a batch.
+
+    Args:
+        batch: Encoded time series.
+
+    Returns:
+        SequenceReport: Validity masks and sorted-order failures.
+
+    """
+    valid_table, next_table = transition_tables(batch.ruleset)
+    lengths = batch.lengths
+    if numpy is not None and batch.codes:
+        codes, times = batch.matrices()
+        valid_table, next_table = numpy.asarray(valid_table), numpy.asarray(next_table)
+        rows, width = codes.shape
+        valid = numpy.ones((rows, width), dtype=bool)
+        position = numpy.zeros(rows, dtype=numpy.intp)
+        for column in range(width):
+            code = codes[:, column]
+            valid[:, column] = valid_table[position, code]
+            position = next_table[position, code]
+        last = numpy.asarray(lengths) - 1
+        has_events = last >= 0
+        valid[numpy.nonzero(has_events)[0], last[has_events]] = True
+        unsorted = (numpy.diff(times, axis=1) < 0).any(axis=1)
+        return SequenceReport(valid=valid, unsorted=unsorted.tolist(), lengths=lengths)
+    valid, unsorted = [], []
+    for row_codes, row_times in zip(batch.codes, batch.times):
+        position, row_valid = 0, []
+        for code in row_codes:
+            row_valid.append(valid_table[position][code])
+            position = next_table[position][code]
+        if row_valid:
+            row_valid[-1] = True
+        valid.append(row_valid)
+        unsorted.append(any(a > b for a, b in zip(row_times, row_times[1:])))
+    return SequenceReport(valid=valid, unsorted=unsorted, lengths=lengths)
+
+
+def validate_series(
+    series: Iterable[Sequence[ScoringEvent]], ruleset: rulesets.Ruleset
+) -> SequenceReport:
+    """Encodes and validates time series of one ruleset.
+
+    Args:
+        series: Time series, without the 'START' event a Match prepends.
+        ruleset: Ruleset or registered ruleset name.
+
+    Returns:
+        SequenceReport: Validity masks and sorted-order failures.
+
+    """
+    ruleset = rulesets.get_ruleset(ruleset)
+    return validate_batch(encode(series, ruleset))
+
+
+def validate_matches(matches: Sequence[Match]) -> SequenceReport:
+    """Revalidates the time series of many matches, batched per ruleset.
+
+    Args:
+        matches: Match instances of any rulesets.
+
+    Returns:
+        SequenceReport: Rows in the order of `matches`.
+
+    """
+    order = sorted(range(len(matches)), key=lambda i: matches[i].ruleset.name)
+    valid: Dict[int, List[bool]] = {}
+    unsorted: Dict[int, bool] = {}
+    for _, group in groupby(order, key=lambda i: matches[i].ruleset.name):
+        indices = list(group)
+        ruleset = matches[indices[0]].ruleset
+        report = validate_series((matches[i].time_series[1:] for i in indices), ruleset)
+        for row, i in enumerate(indices):
+            valid[i] = list(report.valid[row][: report.lengths[row]])
+            unsorted[i] = report.unsorted[row]
+    return SequenceReport(
+        valid=[valid[i] for i in range(len(matches))],
+        unsorted=[unsorted[i] for i in range(len(matches))],
+        lengths=[len(valid[i]) for i in range(len(matches))],
+    )